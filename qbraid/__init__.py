@@ -33,6 +33,8 @@ Functions
    device_wrapper
    job_wrapper
    get_jobs
+   set_executor
+   get_executor
 
 Exceptions
 -----------
@@ -46,6 +48,7 @@ Exceptions
 
 """
 from . import _warnings
+from ._executor import get_executor, set_executor
 from ._qprogram import QPROGRAM, QPROGRAM_LIBS, QPROGRAM_TYPES
 from ._version import __version__
 from .exceptions import PackageValueError, ProgramTypeError, QbraidError
@@ -0,0 +1,94 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module containing the executor that runs the blocking work of qBraid's async methods,
+e.g. :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile_async`.
+
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[Executor] = None
+_default_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """Set the executor that runs the blocking work of qBraid's async methods.
+
+    The executor is not shut down by qBraid when it is replaced. Calls that are already
+    in flight complete on the executor they were submitted to.
+
+    Args:
+        executor: A :class:`concurrent.futures.Executor`, e.g. a ``ThreadPoolExecutor`` sized
+            for the number of conversions and submissions to keep in flight. If ``None``,
+            restore the default executor, a ``ThreadPoolExecutor`` shared by all calls.
+
+    """
+    global _executor  # pylint: disable=global-statement
+    with _lock:
+        _executor = executor
+
+
+def get_executor() -> Executor:
+    """Return the executor that runs the blocking work of qBraid's async methods.
+
+    Returns:
+        The executor set by :func:`~qbraid.set_executor`, or else the default
+        ``ThreadPoolExecutor``, which is created on first use.
+
+    """
+    global _default_executor  # pylint: disable=global-statement
+    with _lock:
+        if _executor is not None:
+            return _executor
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="qbraid")
+        return _default_executor
+
+
+async def run_in_executor(
+    func: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs
+) -> T:
+    """Run ``func(*args, **kwargs)`` on the executor returned by :func:`get_executor`,
+    without blocking the running event loop.
+
+    On a thread executor, ``func`` runs in a copy of the caller's context, so that context
+    variables such as the active :func:`~qbraid.transpiler.profile` are seen by it.
+
+    If the awaiting task is cancelled, or ``timeout`` expires, before ``func`` has started,
+    it is removed from the executor's queue. A call that has already started can not be
+    interrupted: it runs to completion in the background and its result is discarded.
+
+    Args:
+        func: The blocking function to call.
+        timeout: Seconds to wait for the result. If ``None``, wait indefinitely.
+
+    Raises:
+        asyncio.TimeoutError: If ``func`` does not return before ``timeout`` expires.
+        asyncio.CancelledError: If the awaiting task is cancelled.
+
+    Returns:
+        The return value of ``func``.
+
+    """
+    executor = get_executor()
+    call: Callable[[], Any] = functools.partial(func, *args, **kwargs)
+    if not isinstance(executor, ProcessPoolExecutor):
+        call = functools.partial(contextvars.copy_context().run, call)
+    future = asyncio.get_running_loop().run_in_executor(executor, call)
+    return await asyncio.wait_for(future, timeout)
@@ -16,7 +16,7 @@ Module defining input / output types for a quantum backend:
   * QPROGRAM_LIBS: List of all supported quantum software libraries / packages
 
 """
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
 import braket.circuits
 import cirq
@@ -51,3 +51,55 @@ QPROGRAM_TYPES = _PROGRAMS + [QASMType]
 
 _PROGRAM_LIBS = [x.split(".")[0] for x in _PROGRAM_TYPES]
 QPROGRAM_LIBS = _PROGRAM_LIBS + ["qasm2"]
+
+# Maps each supported program type to the name of its package. Subclasses of registered
+# types are resolved through their MRO, and the result is cached per concrete type.
+_PROGRAM_TYPE_REGISTRY: Dict[type, str] = dict(zip(QPROGRAM_TYPES, QPROGRAM_LIBS))
+_program_type_cache: Dict[type, Optional[str]] = {}
+
+
+def register_program_type(program_type: type, package: str) -> None:
+    """Register ``program_type`` (and its subclasses) as a program of ``package``.
+
+    Args:
+        program_type: The quantum program class.
+        package: The name of the package whose handlers apply to ``program_type``.
+
+    """
+    _PROGRAM_TYPE_REGISTRY[program_type] = package
+    _program_type_cache.clear()
+
+
+def get_program_type(program: Any) -> str:
+    """Return the package of a quantum program, based on its type.
+
+    Args:
+        program: Any quantum program object supported by qBraid.
+
+    Raises:
+        ProgramTypeError: If the type of ``program`` is not supported.
+
+    Returns:
+        The package of ``program``, one of :data:`QPROGRAM_LIBS`.
+
+    """
+    program_type = type(program)
+    try:
+        package = _program_type_cache[program_type]
+    except KeyError:
+        package = next(
+            (
+                _PROGRAM_TYPE_REGISTRY[cls]
+                for cls in program_type.__mro__
+                if cls in _PROGRAM_TYPE_REGISTRY
+            ),
+            None,
+        )
+        _program_type_cache[program_type] = package
+
+    if package is None:
+        # pylint: disable-next=import-outside-toplevel
+        from qbraid.exceptions import ProgramTypeError
+
+        raise ProgramTypeError(program)
+    return package
@@ -16,9 +16,10 @@ Module defining abstract DeviceLikeWrapper Class
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING  # pylint: disable=unused-import
+from typing import TYPE_CHECKING, Optional  # pylint: disable=unused-import
 
 from qbraid import circuit_wrapper
+from qbraid._executor import run_in_executor
 
 from .exceptions import DeviceError
 from .ionq import braket_ionq_compilation
@@ -63,8 +64,8 @@ class DeviceLikeWrapper(ABC):
         if self.status.value == 1:
             raise DeviceError("Device is currently offline.")
         device_run_package = self.info["runPackage"]
-        input_run_package = run_input.__module__.split(".")[0]
         qbraid_circuit = circuit_wrapper(run_input)
+        input_run_package = qbraid_circuit.package
         if self.num_qubits and qbraid_circuit.num_qubits > self.num_qubits:
             raise DeviceError(
                 f"Number of qubits in circuit ({qbraid_circuit.num_qubits}) exceeds "
@@ -155,3 +156,25 @@ class DeviceLikeWrapper(ABC):
     @abstractmethod
     def run(self, run_input: "qbraid.QPROGRAM", *args, **kwargs) -> "qbraid.devices.JobLikeWrapper":
         """Abstract run method."""
+
+    async def run_async(
+        self, run_input: "qbraid.QPROGRAM", *args, timeout: Optional[float] = None, **kwargs
+    ) -> "qbraid.devices.JobLikeWrapper":
+        """Run ``run_input`` on the device without blocking the event loop.
+
+        The submission done by :meth:`~qbraid.devices.DeviceLikeWrapper.run`, including any
+        transpilation of ``run_input``, is run on the executor set by
+        :func:`~qbraid.set_executor`. Other arguments are passed on to it.
+
+        Args:
+            run_input: The quantum program to run.
+            timeout: Seconds to wait for the submission. If ``None``, wait indefinitely.
+
+        Raises:
+            asyncio.TimeoutError: If the submission does not finish before ``timeout``.
+
+        Returns:
+            The job like object for the run.
+
+        """
+        return await run_in_executor(self.run, run_input, *args, timeout=timeout, **kwargs)
@@ -12,12 +12,14 @@
 Module defining abstract JobLikeWrapper Class
 
 """
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from time import sleep, time
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from qbraid import device_wrapper
+from qbraid._executor import run_in_executor
 from qbraid.api import get_job_data
 
 from .enums import JOB_FINAL, JobStatus, status_from_raw
@@ -147,6 +149,47 @@ class JobLikeWrapper(ABC):
             sleep(wait)
             status = self.status()
 
+    async def wait_for_final_state_async(
+        self, timeout: Optional[float] = None, wait: float = 5
+    ) -> None:
+        """Poll the job status until it progresses to a final state, without blocking the
+        event loop.
+
+        Status queries are run on the executor set by :func:`~qbraid.set_executor`. The
+        awaiting task can be cancelled while it waits between or on them.
+
+        Args:
+            timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
+            wait: Seconds between queries.
+
+        Raises:
+            JobError: If the job does not reach a final state before the specified timeout.
+
+        """
+
+        async def poll() -> None:
+            status = await run_in_executor(self.status)
+            while status not in JOB_FINAL:
+                await asyncio.sleep(wait)
+                status = await run_in_executor(self.status)
+
+        try:
+            await asyncio.wait_for(poll(), timeout)
+        except asyncio.TimeoutError as err:
+            raise JobError(f"Timeout while waiting for job {self.id}.") from err
+
+    async def result_async(self, timeout: Optional[float] = None) -> "qbraid.devices.ResultWrapper":
+        """Return the results of the job, without blocking the event loop.
+
+        Args:
+            timeout: Seconds to wait for the results. If ``None``, wait indefinitely.
+
+        Raises:
+            asyncio.TimeoutError: If the results are not returned before ``timeout``.
+
+        """
+        return await run_in_executor(self.result, timeout=timeout)
+
     @abstractmethod
     def result(self) -> "qbraid.devices.ResultWrapper":
         """Return the results of the job."""
@@ -0,0 +1,125 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the async methods of the qbraid device layer.
+
+"""
+import asyncio
+import time
+
+import pytest
+
+from qbraid.devices import DeviceLikeWrapper, DeviceStatus, JobError, JobLikeWrapper, JobStatus
+
+# pylint: disable=missing-function-docstring,missing-class-docstring
+
+
+class FakeDevice(DeviceLikeWrapper):
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        super().__init__(
+            qbraid_id="fake_device", name="Fake", provider="qBraid", vendor="AWS", objArg="fake"
+        )
+
+    def _get_device(self):
+        return None
+
+    def _vendor_compat_run_input(self, run_input):
+        return run_input
+
+    @property
+    def status(self):
+        return DeviceStatus.ONLINE
+
+    def run(self, run_input, *args, **kwargs):
+        time.sleep(self.delay)
+        return FakeJob(self, statuses=kwargs.get("statuses", [JobStatus.COMPLETED]))
+
+
+class FakeJob(JobLikeWrapper):
+    def __init__(self, device, statuses):
+        super().__init__("fake_device-job", device=device, status=statuses[0])
+        self.statuses = list(statuses)
+
+    def _get_vendor_jlo(self):
+        return None
+
+    def _get_status(self):
+        return "COMPLETED"
+
+    def status(self):
+        return self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+
+    def result(self):
+        return "result"
+
+    def cancel(self):
+        pass
+
+
+def test_run_async():
+    job = asyncio.run(FakeDevice().run_async("circuit"))
+    assert isinstance(job, FakeJob)
+
+
+def test_run_async_passes_arguments():
+    statuses = [JobStatus.QUEUED, JobStatus.COMPLETED]
+    job = asyncio.run(FakeDevice().run_async("circuit", statuses=statuses))
+    assert job.statuses == statuses
+
+
+def test_run_async_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(FakeDevice(delay=0.5).run_async("circuit", timeout=0.01))
+
+
+def test_run_async_concurrent():
+    """Test that many submissions are in flight at once, rather than run one by one."""
+
+    async def main():
+        device = FakeDevice(delay=0.2)
+        return await asyncio.gather(*[device.run_async("circuit") for _ in range(8)])
+
+    start = time.perf_counter()
+    jobs = asyncio.run(main())
+    assert len(jobs) == 8
+    assert time.perf_counter() - start < 1.6
+
+
+def test_wait_for_final_state_async():
+    statuses = [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.COMPLETED]
+    job = FakeJob(FakeDevice(), statuses)
+    asyncio.run(job.wait_for_final_state_async(wait=0.01))
+    assert job.status() == JobStatus.COMPLETED
+
+
+def test_wait_for_final_state_async_timeout():
+    job = FakeJob(FakeDevice(), [JobStatus.RUNNING])
+    with pytest.raises(JobError):
+        asyncio.run(job.wait_for_final_state_async(timeout=0.05, wait=0.01))
+
+
+def test_wait_for_final_state_async_cancel():
+    job = FakeJob(FakeDevice(), [JobStatus.RUNNING])
+
+    async def main():
+        task = asyncio.create_task(job.wait_for_final_state_async(wait=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+
+def test_result_async():
+    job = FakeJob(FakeDevice(), [JobStatus.COMPLETED])
+    assert asyncio.run(job.result_async()) == "result"
@@ -23,6 +23,9 @@ Interface (:mod:`qbraid.interface`)
    random_unitary_matrix
    convert_to_contiguous
    circuits_allclose
+   circuits_equivalent
+   random_product_state
+   random_haar_state
    random_circuit
    circuit_drawer
    ContiguousConversionError
@@ -36,6 +39,7 @@ from .calculate_unitary import (
     to_unitary,
     unitary_to_little_endian,
 )
+from .circuit_equivalence import circuits_equivalent, random_haar_state, random_product_state
 from .convert_to_contiguous import ContiguousConversionError, convert_to_contiguous
 from .draw import circuit_drawer
 from .programs import random_circuit
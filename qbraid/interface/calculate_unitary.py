@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 import numpy as np
 from cirq.testing import assert_allclose_up_to_global_phase
 
+from qbraid._qprogram import get_program_type
 from qbraid.exceptions import ProgramTypeError, QbraidError
 from qbraid.interface.convert_to_contiguous import convert_to_contiguous
 
@@ -44,38 +45,32 @@ def to_unitary(program: "qbraid.QPROGRAM", ensure_contiguous: Optional[bool] = F
     """
     to_unitary_function: Callable[[Any], np.ndarray]
 
-    if isinstance(program, str):
-        package = "qasm2"
-    else:
-        try:
-            package = program.__module__
-        except AttributeError as err:
-            raise ProgramTypeError(program) from err
+    package = get_program_type(program)
 
     # pylint: disable=import-outside-toplevel
 
-    if "qiskit" in package:
+    if package == "qiskit":
         from qbraid.interface.qbraid_qiskit.tools import _unitary_from_qiskit
 
         to_unitary_function = _unitary_from_qiskit
-    elif "cirq" in package:
+    elif package == "cirq":
         from qbraid.interface.qbraid_cirq.tools import _unitary_from_cirq
 
         to_unitary_function = _unitary_from_cirq
-    elif "braket" in package:
+    elif package == "braket":
         from qbraid.interface.qbraid_braket.tools import _unitary_from_braket
 
         to_unitary_function = _unitary_from_braket
 
-    elif "pyquil" in package:
+    elif package == "pyquil":
         from qbraid.interface.qbraid_pyquil.tools import _unitary_from_pyquil
 
         to_unitary_function = _unitary_from_pyquil
-    elif "pytket" in package:
+    elif package == "pytket":
         from qbraid.interface.qbraid_pytket.tools import _unitary_from_pytket
 
         to_unitary_function = _unitary_from_pytket
-    elif "qasm2" in package:
+    elif package == "qasm2":
         from qbraid.interface.qbraid_qasm.tools import _unitary_from_qasm
 
         to_unitary_function = _unitary_from_qasm
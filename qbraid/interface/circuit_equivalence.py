@@ -0,0 +1,187 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module for checking the equivalence of quantum circuits/programs on random states
+
+"""
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from qbraid._qprogram import get_program_type
+from qbraid.exceptions import ProgramTypeError
+from qbraid.interface.calculate_unitary import UnitaryCalculationError, circuits_allclose
+from qbraid.interface.convert_to_contiguous import convert_to_contiguous
+
+if TYPE_CHECKING:
+    import qbraid
+
+StatevectorFunction = Callable[[Any, np.ndarray], np.ndarray]
+
+
+def _statevector_function(program: "qbraid.QPROGRAM") -> Tuple[Any, int, StatevectorFunction]:
+    """Returns the program to simulate, its number of qubits, and the function applying it
+    to a state vector, in the qubit ordering of :func:`~qbraid.interface.to_unitary`."""
+    package = get_program_type(program)
+
+    # pylint: disable=import-outside-toplevel
+
+    if package == "qiskit":
+        from qbraid.interface.qbraid_qiskit.tools import _statevector_from_qiskit
+
+        return program, program.num_qubits, _statevector_from_qiskit
+    if package == "cirq":
+        from qbraid.interface.qbraid_cirq.tools import _statevector_from_cirq
+
+        return program, len(program.all_qubits()), _statevector_from_cirq
+    if package == "braket":
+        from qbraid.interface.qbraid_braket.tools import _statevector_from_braket
+
+        num_qubits = max(program.qubits) + 1 if program.qubits else 0
+        return program, num_qubits, _statevector_from_braket
+    if package == "pyquil":
+        from qbraid.interface.qbraid_pyquil.tools import _statevector_from_pyquil
+
+        return program, len(program.get_qubits()), _statevector_from_pyquil
+    if package == "pytket":
+        from qbraid.interface.qbraid_pytket.tools import _statevector_from_pytket
+
+        return program, program.n_qubits, _statevector_from_pytket
+    if package == "qasm2":
+        from qbraid.interface.qbraid_cirq.tools import _statevector_from_cirq
+        from qbraid.transpiler.cirq_qasm.qasm_conversions import from_qasm
+
+        circuit = from_qasm(program)
+        return circuit, len(circuit.all_qubits()), _statevector_from_cirq
+    raise ProgramTypeError(program)
+
+
+def random_product_state(num_qubits: int, seed: Optional[Any] = None) -> np.ndarray:
+    """Create the state vector of a product of random single-qubit states.
+
+    Args:
+        num_qubits: Number of qubits of the state.
+        seed: Seed or ``numpy.random.Generator`` from which to draw the state.
+
+    Returns:
+        Normalized state vector of length ``2 ** num_qubits``.
+
+    """
+    rng = np.random.default_rng(seed)
+    state = np.ones(1, dtype=complex)
+    for _ in range(num_qubits):
+        qubit_state = rng.normal(size=2) + 1j * rng.normal(size=2)
+        state = np.kron(state, qubit_state / np.linalg.norm(qubit_state))
+    return state
+
+
+def random_haar_state(num_qubits: int, seed: Optional[Any] = None) -> np.ndarray:
+    """Create a state vector drawn from the Haar measure.
+
+    Args:
+        num_qubits: Number of qubits of the state.
+        seed: Seed or ``numpy.random.Generator`` from which to draw the state.
+
+    Returns:
+        Normalized state vector of length ``2 ** num_qubits``.
+
+    """
+    rng = np.random.default_rng(seed)
+    dim = 2**num_qubits
+    state = rng.normal(size=dim) + 1j * rng.normal(size=dim)
+    return state / np.linalg.norm(state)
+
+
+_RANDOM_STATES = {"product": random_product_state, "haar": random_haar_state}
+
+
+def circuits_equivalent(  # pylint: disable=too-many-arguments
+    circuit0: "qbraid.QPROGRAM",
+    circuit1: "qbraid.QPROGRAM",
+    method: str = "random_states",
+    *,
+    trials: int = 3,
+    state_type: str = "haar",
+    index_contig: Optional[bool] = True,
+    strict_gphase: Optional[bool] = False,
+    seed: Optional[Any] = None,
+    atol: float = 1e-7,
+) -> bool:
+    """Check if quantum programs are equivalent.
+
+    With ``method="random_states"``, both programs are applied to ``trials`` random
+    states, and their output states are compared up to a global phase common to all
+    trials. This takes time linear in the number of gates and memory of order ``2 ** n``
+    for ``n`` qubits, so unlike :func:`~qbraid.interface.circuits_allclose`, which
+    compares ``2 ** n`` by ``2 ** n`` unitaries, it is feasible for circuits of 20 to 25
+    qubits. Programs that are not equivalent are reported equivalent with vanishing
+    probability.
+
+    Args:
+        circuit0 (:data:`~qbraid.QPROGRAM`): First quantum program to compare
+        circuit1 (:data:`~qbraid.QPROGRAM`): Second quantum program to compare
+        method: ``"random_states"``, or ``"unitary"`` to compare the unitaries of the
+            programs with :func:`~qbraid.interface.circuits_allclose`.
+        trials: Number of random states to compare the programs on.
+        state_type: ``"haar"`` for Haar-random states, or ``"product"`` for products
+            of random single-qubit states.
+        index_contig: If True, applies the programs using contiguous qubit indexing.
+        strict_gphase: If False, disregards global phase when verifying
+            equivalance of the programs.
+        seed: Seed or ``numpy.random.Generator`` from which to draw the random states.
+        atol: Absolute tolerance of the comparison of output states.
+
+    Raises:
+        ValueError: If ``method`` or ``state_type`` is not supported.
+        ProgramTypeError: If either input quantum program is not supported.
+        UnitaryCalculationError: If the output state of either program could not be
+            calculated.
+
+    Returns:
+        True if the input circuits pass the equivalence check
+
+    """
+    if method == "unitary":
+        return circuits_allclose(
+            circuit0, circuit1, index_contig=index_contig, strict_gphase=strict_gphase, atol=atol
+        )
+    if method != "random_states":
+        raise ValueError(f"Expected method 'random_states' or 'unitary', got '{method}'.")
+    if state_type not in _RANDOM_STATES:
+        raise ValueError(f"Expected state_type 'haar' or 'product', got '{state_type}'.")
+
+    if index_contig:
+        circuit0 = convert_to_contiguous(circuit0)
+        circuit1 = convert_to_contiguous(circuit1)
+    program0, num_qubits, statevector0 = _statevector_function(circuit0)
+    program1, num_qubits1, statevector1 = _statevector_function(circuit1)
+    if num_qubits != num_qubits1:
+        return False
+
+    rng = np.random.default_rng(seed)
+    phase = None if not strict_gphase else 1.0
+    for _ in range(trials):
+        state = _RANDOM_STATES[state_type](num_qubits, rng)
+        try:
+            output0 = statevector0(program0, state.copy())
+            output1 = statevector1(program1, state.copy())
+        except Exception as err:
+            raise UnitaryCalculationError(
+                "Output state could not be calculated from given quantum program."
+            ) from err
+        if phase is None:
+            overlap = np.vdot(output1, output0)
+            if np.isclose(overlap, 0, atol=atol):
+                return False
+            phase = overlap / abs(overlap)
+        if not np.allclose(output0, phase * output1, atol=atol):
+            return False
+    return True
@@ -14,8 +14,9 @@ Module for converting quantum circuit/program to use contiguous qubit indexing
 """
 from typing import TYPE_CHECKING, Any, Callable
 
-from qbraid._qprogram import QPROGRAM
+from qbraid._qprogram import QPROGRAM, get_program_type
 from qbraid.exceptions import ProgramTypeError, QbraidError
+from qbraid.transpiler.profiling import profiled
 
 if TYPE_CHECKING:
     import qbraid
@@ -26,6 +27,7 @@ class ContiguousConversionError(QbraidError):
 
 
 # todo: move to qbraid.passes
+@profiled("convert_to_contiguous")
 def convert_to_contiguous(program: "qbraid.QPROGRAM", **kwargs) -> "qbraid.QPROGRAM":
     """Checks whether the quantum program uses contiguous qubits/indices,
     and if not, adds identity gates to vacant registers as needed.
@@ -44,36 +46,30 @@ def convert_to_contiguous(program: "qbraid.QPROGRAM", **kwargs) -> "qbraid.QPROG
     """
     conversion_function: Callable[[Any], QPROGRAM]
 
-    if isinstance(program, str):
-        package = "qasm2"
-    else:
-        try:
-            package = program.__module__
-        except AttributeError as err:
-            raise ProgramTypeError(program) from err
+    package = get_program_type(program)
 
     # pylint: disable=import-outside-toplevel
 
-    if "pyquil" in package:
+    if package == "pyquil":
         return program
 
-    if "qiskit" in package:
+    if package == "qiskit":
         from qbraid.interface.qbraid_qiskit.tools import _convert_to_contiguous_qiskit
 
         conversion_function = _convert_to_contiguous_qiskit
-    elif "cirq" in package:
+    elif package == "cirq":
         from qbraid.interface.qbraid_cirq.tools import _convert_to_contiguous_cirq
 
         conversion_function = _convert_to_contiguous_cirq
-    elif "braket" in package:
+    elif package == "braket":
         from qbraid.interface.qbraid_braket.tools import _convert_to_contiguous_braket
 
         conversion_function = _convert_to_contiguous_braket
-    elif "pytket" in package:
+    elif package == "pytket":
         from qbraid.interface.qbraid_pytket.tools import _convert_to_contiguous_pytket
 
         conversion_function = _convert_to_contiguous_pytket
-    elif "qasm2" in package:
+    elif package == "qasm2":
         from qbraid.interface.qbraid_qasm.tools import _convert_to_contiguous_qasm
 
         conversion_function = _convert_to_contiguous_qasm
@@ -14,6 +14,7 @@ Module for drawing quantum circuit diagrams
 """
 from typing import TYPE_CHECKING
 
+from qbraid._qprogram import get_program_type
 from qbraid.exceptions import ProgramTypeError, VisualizationError
 
 if TYPE_CHECKING:
@@ -38,26 +39,23 @@ def circuit_drawer(program: "qbraid.QPROGRAM", output=None, **kwargs) -> None:
         else:
             raise ProgramTypeError("Input of type string must represent a valid OpenQASM program.")
     else:
-        try:
-            package = program.__module__
-        except AttributeError as err:
-            raise ProgramTypeError(program) from err
+        package = get_program_type(program)
 
     # pylint: disable=import-outside-toplevel
 
-    if "qiskit" in package:
+    if package == "qiskit":
         from qiskit.visualization import circuit_drawer as qiskit_drawer
 
         return qiskit_drawer(program, output=output, **kwargs)
 
-    if "braket" in package:
+    if package == "braket":
         if output in (None, "ascii"):
             from braket.circuits.ascii_circuit_diagram import AsciiCircuitDiagram
 
             return print(AsciiCircuitDiagram.build_diagram(program))
         raise VisualizationError('The only valid option for braket are "ascii"')
 
-    if "cirq" in package:
+    if package == "cirq":
         if output in (None, "text"):
             return print(program.to_text_diagram(**kwargs))
         if output == "svg":
@@ -71,7 +69,7 @@ def circuit_drawer(program: "qbraid.QPROGRAM", output=None, **kwargs) -> None:
             return circuit_to_svg(program)
         raise VisualizationError('The only valid option for cirq are "text", "svg", "svf_source"')
 
-    if "pyquil" in package:
+    if package == "pyquil":
         if output is None or output == "text":
             return print(program)
         if output == "latex":
@@ -81,7 +79,7 @@ def circuit_drawer(program: "qbraid.QPROGRAM", output=None, **kwargs) -> None:
             return display(program, **kwargs)
         raise VisualizationError('The only valid option for pyquil are "text", "latex"')
 
-    if "pytket" in package:
+    if package == "pytket":
         if output in (None, "jupyter"):
             from pytket.circuit.display import render_circuit_jupyter
 
@@ -15,6 +15,8 @@ Module containing Braket tools
 import numpy as np
 from braket.circuits import Circuit as BKCircuit
 from braket.circuits import Instruction
+from braket.circuits.compiler_directive import CompilerDirective
+from braket.default_simulator.linalg_utils import multiply_matrix
 
 
 def _unitary_from_braket(circuit: BKCircuit) -> np.ndarray:
@@ -22,6 +24,18 @@ def _unitary_from_braket(circuit: BKCircuit) -> np.ndarray:
     return circuit.as_unitary()
 
 
+def _statevector_from_braket(circuit: BKCircuit, state: np.ndarray) -> np.ndarray:
+    """Return the state obtained by applying a Braket circuit to little-endian ``state``."""
+    num_qubits = max(circuit.qubits) + 1
+    tensor = state.reshape([2] * num_qubits)
+    for instruction in circuit.instructions:
+        if isinstance(instruction.operator, CompilerDirective):
+            continue
+        targets = tuple(num_qubits - 1 - int(qubit) for qubit in instruction.target)
+        tensor = multiply_matrix(tensor, instruction.operator.to_matrix(), targets)
+    return tensor.reshape(-1)
+
+
 def _contiguous_expansion(circuit: BKCircuit) -> BKCircuit:
     """Checks whether the circuit uses contiguous qubits/indices,
     and if not, adds identity gates to vacant registers as needed."""
@@ -15,7 +15,7 @@ Module containing Cirq tools
 from typing import List, Sequence, Union
 
 import numpy as np
-from cirq import Circuit, GridQubit, I, LineQubit, NamedQubit, Qid, ops
+from cirq import Circuit, GridQubit, I, LineQubit, NamedQubit, Qid, final_state_vector, ops
 
 QUBIT = Union[LineQubit, GridQubit, NamedQubit, Qid]
 
@@ -25,6 +25,14 @@ def _unitary_from_cirq(circuit: Circuit) -> np.ndarray:
     return circuit.unitary()
 
 
+def _statevector_from_cirq(circuit: Circuit, state: np.ndarray) -> np.ndarray:
+    """Return the state obtained by applying a Cirq circuit to ``state``, ignoring terminal
+    measurements as :meth:`cirq.Circuit.unitary` does."""
+    return final_state_vector(
+        circuit, initial_state=state, ignore_terminal_measurements=True, dtype=np.complex128
+    )
+
+
 def _convert_to_line_qubits(
     circuit: Circuit,
     rev_qubits=False,
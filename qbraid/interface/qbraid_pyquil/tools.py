@@ -13,6 +13,8 @@ Module containing pyQuil tools
 """
 import numpy as np
 from pyquil import Program
+from pyquil.quilbase import Gate
+from pyquil.simulation import NumpyWavefunctionSimulator
 from pyquil.simulation.tools import program_unitary
 
 
@@ -20,3 +22,22 @@ def _unitary_from_pyquil(program: Program) -> np.ndarray:
     """Return the unitary of a pyQuil program."""
     n_qubits = len(program.get_qubits())
     return program_unitary(program, n_qubits=n_qubits)
+
+
+def _statevector_from_pyquil(program: Program, state: np.ndarray) -> np.ndarray:
+    """Return the state obtained by applying a pyQuil program to little-endian ``state``."""
+    n_qubits = len(program.get_qubits())
+    simulator = NumpyWavefunctionSimulator(n_qubits)
+    # the simulator indexes qubit 0 by the first axis of its wavefunction tensor
+    little_endian = list(reversed(range(n_qubits)))
+    simulator.wf = state.reshape([2] * n_qubits).transpose(little_endian)
+    defined_gates = {gate.name: gate.matrix for gate in program.defined_gates}
+    for instruction in program.instructions:
+        if not isinstance(instruction, Gate):
+            continue
+        if instruction.name in defined_gates:
+            matrix = np.asarray(defined_gates[instruction.name], dtype=complex)
+            simulator.do_gate_matrix(matrix, [qubit.index for qubit in instruction.qubits])
+        else:
+            simulator.do_gate(instruction)
+    return simulator.wf.transpose(little_endian).reshape(-1)
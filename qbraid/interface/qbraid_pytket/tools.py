@@ -16,6 +16,8 @@ from typing import List, Optional, Union
 import numpy as np
 from pytket.circuit import Circuit as TKCircuit
 from pytket.circuit import Command as TKInstruction
+from pytket.circuit import OpType
+from pytket.passes import DecomposeBoxes
 
 
 def _unitary_from_pytket(circuit: TKCircuit) -> np.ndarray:
@@ -23,6 +25,24 @@ def _unitary_from_pytket(circuit: TKCircuit) -> np.ndarray:
     return circuit.get_unitary()
 
 
+def _statevector_from_pytket(circuit: TKCircuit, state: np.ndarray) -> np.ndarray:
+    """Return the state obtained by applying a pytket circuit to ``state``."""
+    circuit = circuit.copy()
+    DecomposeBoxes().apply(circuit)
+    axes = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    tensor = state.reshape([2] * circuit.n_qubits)
+    for command in circuit.get_commands():
+        if command.op.type in (OpType.Measure, OpType.Barrier):
+            continue
+        targets = [axes[qubit] for qubit in command.qubits]
+        num_targets = len(targets)
+        matrix = command.op.get_unitary().reshape([2] * 2 * num_targets)
+        contracted = list(range(num_targets, 2 * num_targets))
+        tensor = np.tensordot(matrix, tensor, axes=(contracted, targets))
+        tensor = np.moveaxis(tensor, list(range(num_targets)), targets)
+    return tensor.reshape(-1)
+
+
 def _gate_to_matrix_pytket(
     gates: Optional[Union[List[TKInstruction], TKInstruction]], flat: bool = False
 ) -> np.ndarray:
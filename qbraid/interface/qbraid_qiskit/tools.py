@@ -17,7 +17,7 @@ from collections import OrderedDict
 import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
-from qiskit.quantum_info import Operator
+from qiskit.quantum_info import Operator, Statevector
 
 
 def _unitary_from_qiskit(circuit: QuantumCircuit) -> np.ndarray:
@@ -25,6 +25,12 @@ def _unitary_from_qiskit(circuit: QuantumCircuit) -> np.ndarray:
     return Operator(circuit).data
 
 
+def _statevector_from_qiskit(circuit: QuantumCircuit, state: np.ndarray) -> np.ndarray:
+    """Return the state obtained by applying a Qiskit quantum circuit to ``state``."""
+    circuit = circuit.remove_final_measurements(inplace=False)
+    return Statevector(state).evolve(circuit).data
+
+
 def _convert_to_contiguous_qiskit(circuit: QuantumCircuit) -> QuantumCircuit:
     """delete qubit with no gate"""
     dag = circuit_to_dag(circuit)
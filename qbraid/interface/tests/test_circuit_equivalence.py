@@ -0,0 +1,137 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for checking the equivalence of quantum programs on random states
+
+"""
+import cirq
+import numpy as np
+import pytest
+from braket.circuits import Circuit as BKCircuit
+
+from qbraid import circuit_wrapper
+from qbraid.exceptions import ProgramTypeError
+from qbraid.interface import (
+    circuits_equivalent,
+    random_circuit,
+    random_haar_state,
+    random_product_state,
+)
+
+# pylint: disable=missing-function-docstring
+
+PACKAGES = ["braket", "cirq", "pyquil", "pytket", "qasm2", "qiskit"]
+
+
+def cirq_ghz_t():
+    """Returns a three-qubit Cirq circuit"""
+    qubits = cirq.LineQubit.range(3)
+    return cirq.Circuit(cirq.H(qubits[0]), cirq.CNOT(*qubits[:2]), cirq.T(qubits[2]))
+
+
+@pytest.mark.parametrize("target", PACKAGES)
+@pytest.mark.parametrize("source", ["cirq", "qiskit", "braket"])
+def test_transpiled_programs_equivalent(source, target):
+    """Test that transpiled programs are equivalent on random states across packages,
+    following the qubit ordering of their unitaries."""
+    seed = {"seed": 1} if source == "qiskit" else {"random_state": 1}
+    circuit = random_circuit(source, num_qubits=3, depth=4, **seed)
+    converted = circuit_wrapper(circuit).transpile(target)
+    assert circuits_equivalent(circuit, converted, seed=0)
+    assert circuits_equivalent(circuit, converted, state_type="product", seed=0)
+
+
+@pytest.mark.parametrize("state_type", ["haar", "product"])
+def test_different_circuits_not_equivalent(state_type):
+    circuit = cirq_ghz_t()
+    other = circuit.copy()
+    other.append(cirq.Z(cirq.LineQubit(0)))
+    assert not circuits_equivalent(circuit, other, state_type=state_type, seed=0)
+
+
+def test_global_phase():
+    """Test that a global phase is disregarded unless strict_gphase is True"""
+    circuit = cirq_ghz_t()
+    phased = circuit.copy()
+    phased.append(cirq.global_phase_operation(1j))
+    assert circuits_equivalent(circuit, phased)
+    assert not circuits_equivalent(circuit, phased, strict_gphase=True)
+    assert circuits_equivalent(circuit, circuit.copy(), strict_gphase=True)
+
+
+def test_relative_phase_not_equivalent():
+    """Test that programs whose outputs differ by a state-dependent phase are not
+    reported equivalent"""
+    qubit = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.Z(qubit))
+    identity = cirq.Circuit(cirq.I(qubit))
+    assert not circuits_equivalent(circuit, identity, trials=1, seed=0)
+
+
+@pytest.mark.parametrize("package", ["cirq", "qasm2"])
+def test_terminal_measurements_ignored(package):
+    """Test that programs with terminal measurements can be compared, as with unitaries"""
+    circuit = cirq_ghz_t()
+    measured = circuit.copy()
+    measured.append(cirq.measure(*sorted(circuit.all_qubits()), key="m"))
+    program = circuit_wrapper(measured).transpile(package)
+    assert circuits_equivalent(program, circuit, seed=0)
+    assert circuits_equivalent(program, circuit, method="unitary")
+
+
+def test_different_num_qubits_not_equivalent():
+    circuit = cirq_ghz_t()
+    assert not circuits_equivalent(circuit, circuit[:1])
+
+
+def test_method_unitary():
+    circuit = cirq_ghz_t()
+    converted = circuit_wrapper(circuit).transpile("qiskit")
+    assert circuits_equivalent(circuit, converted, method="unitary")
+
+
+def test_large_circuit():
+    """Test a conversion of more qubits than is practical to compare unitaries of"""
+    circuit = random_circuit("qiskit", num_qubits=16, depth=5, seed=1)
+    converted = circuit_wrapper(circuit).transpile("braket")
+    assert circuits_equivalent(circuit, converted, trials=2, seed=0)
+
+
+def test_noncontiguous_braket_circuit():
+    circuit = BKCircuit().h(0).cnot(0, 2)  # pylint: disable=no-member
+    contiguous = BKCircuit().h(0).cnot(0, 1)  # pylint: disable=no-member
+    assert circuits_equivalent(circuit, contiguous)
+    assert not circuits_equivalent(circuit, contiguous, index_contig=False)
+
+
+def test_invalid_arguments():
+    circuit = cirq_ghz_t()
+    with pytest.raises(ValueError):
+        circuits_equivalent(circuit, circuit, method="not_a_method")
+    with pytest.raises(ValueError):
+        circuits_equivalent(circuit, circuit, state_type="not_a_state")
+    with pytest.raises(ProgramTypeError):
+        circuits_equivalent(circuit, None)
+
+
+@pytest.mark.parametrize("random_state", [random_haar_state, random_product_state])
+def test_random_states_normalized(random_state):
+    state = random_state(4, seed=0)
+    assert state.shape == (16,)
+    assert np.isclose(np.linalg.norm(state), 1)
+    assert np.allclose(state, random_state(4, seed=0))
+
+
+def test_random_product_state_is_product():
+    """Test that the state has Schmidt rank 1 across a cut between qubits"""
+    state = random_product_state(4, seed=1)
+    singular_values = np.linalg.svd(state.reshape(4, 4), compute_uv=False)
+    assert np.isclose(singular_values[0], 1)
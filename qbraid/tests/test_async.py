@@ -0,0 +1,129 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the executor of qbraid async methods, and for async transpilation
+
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qbraid import circuit_wrapper, get_executor, set_executor
+from qbraid._executor import run_in_executor
+from qbraid.exceptions import PackageValueError
+from qbraid.interface import circuits_allclose
+from qbraid.interface.qbraid_cirq.circuits import cirq_bell
+from qbraid.transpiler import profile
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test")
+    set_executor(executor)
+    yield executor
+    set_executor(None)
+    executor.shutdown(wait=True)
+
+
+def test_default_executor_is_shared():
+    set_executor(None)
+    assert isinstance(get_executor(), ThreadPoolExecutor)
+    assert get_executor() is get_executor()
+
+
+def test_set_executor(executor):
+    assert get_executor() is executor
+    thread_name = asyncio.run(run_in_executor(lambda: threading.current_thread().name))
+    assert thread_name.startswith("test")
+
+
+def test_run_in_executor_passes_arguments():
+    def func(a, b, c=0):
+        return a + b + c
+
+    assert asyncio.run(run_in_executor(func, 1, 2, c=3)) == 6
+
+
+def test_run_in_executor_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run_in_executor(time.sleep, 0.5, timeout=0.01))
+
+
+@pytest.mark.usefixtures("executor")
+def test_run_in_executor_cancels_queued_calls():
+    """Test that cancelling a task removes its call from the executor queue, so that
+    it is never run."""
+    started = []
+    release = threading.Event()
+
+    def block(name):
+        started.append(name)
+        release.wait(5)
+
+    async def main():
+        running = [asyncio.create_task(run_in_executor(block, i)) for i in range(2)]
+        queued = asyncio.create_task(run_in_executor(block, "queued"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await asyncio.gather(*running)
+
+    asyncio.run(main())
+    assert sorted(started) == [0, 1]
+
+
+def test_transpile_async():
+    circuit = cirq_bell()
+    qbraid_circuit = circuit_wrapper(circuit)
+    converted = asyncio.run(qbraid_circuit.transpile_async("braket"))
+    assert circuits_allclose(converted, circuit)
+
+
+def test_transpile_async_same_package():
+    circuit = cirq_bell()
+    assert asyncio.run(circuit_wrapper(circuit).transpile_async("cirq")) is circuit
+
+
+def test_transpile_async_concurrent(executor):
+    async def main():
+        programs = [circuit_wrapper(cirq_bell()) for _ in range(8)]
+        return await asyncio.gather(*[program.transpile_async("qiskit") for program in programs])
+
+    circuit = cirq_bell()
+    for converted in asyncio.run(main()):
+        assert circuits_allclose(converted, circuit)
+    assert executor is get_executor()
+
+
+def test_transpile_async_invalid_target():
+    circuit = cirq_bell()
+    with pytest.raises(PackageValueError):
+        asyncio.run(circuit_wrapper(circuit).transpile_async("not_a_package"))
+
+
+def test_transpile_async_is_profiled():
+    """Test that the transpilation stages run on the executor are recorded by the
+    profile that is active in the awaiting task."""
+    circuit = cirq_bell()
+
+    async def main():
+        with profile() as prof:
+            await circuit_wrapper(circuit).transpile_async("braket")
+        return prof
+
+    assert asyncio.run(main()).stages
@@ -19,9 +19,10 @@ from unittest.mock import Mock
 import pytest
 
 from qbraid import __version__
+from qbraid._qprogram import get_program_type
 from qbraid._warnings import _warn_new_version
 from qbraid.display_utils import running_in_jupyter, update_progress_bar
-from qbraid.exceptions import PackageValueError
+from qbraid.exceptions import PackageValueError, ProgramTypeError
 from qbraid.get_devices import get_devices
 from qbraid.get_jobs import _display_jobs_jupyter, get_jobs
 
@@ -71,6 +72,24 @@ def test_package_value_error():
         raise PackageValueError("custom msg")
 
 
+def test_get_program_type_subclass():
+    """Test that subclasses of supported program types resolve through their MRO."""
+    from qiskit import QuantumCircuit  # pylint: disable=import-outside-toplevel
+
+    class CustomCircuit(QuantumCircuit):
+        """Quantum circuit subclass defined outside of qiskit"""
+
+    assert get_program_type(CustomCircuit(1)) == "qiskit"
+    assert get_program_type("OPENQASM 2.0;") == "qasm2"
+
+
+def test_get_program_type_unsupported():
+    """Test that module names are not used to identify program types."""
+    unsupported = type("Circuit", (), {"__module__": "my_cirq_utils"})()
+    with pytest.raises(ProgramTypeError):
+        get_program_type(unsupported)
+
+
 def test_update_progress_bar_done(capfd):
     """Test ``update_progress_bar`` for status 'Done'."""
     progress_val = 1
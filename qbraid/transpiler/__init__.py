@@ -20,6 +20,25 @@ Transpiler  (:mod:`qbraid.transpiler`)
 
    convert_from_cirq
    convert_to_cirq
+   get_fallback_counts
+   reset_fallback_counts
+   ConversionGraph
+   Conversion
+   get_conversion_graph
+   transpile_batch
+   transpile_qasm_stream
+   transpile_parameterized
+   ParameterizedProgram
+   TranspileCache
+   DiskTranspileCache
+   enable_transpile_cache
+   enable_disk_transpile_cache
+   disable_transpile_cache
+   get_transpile_cache
+   get_disk_transpile_cache
+   program_fingerprint
+   profile
+   TranspileProfile
    QuantumProgramWrapper
    BraketCircuitWrapper
    CirqCircuitWrapper
@@ -31,8 +50,28 @@ Transpiler  (:mod:`qbraid.transpiler`)
    QasmError
 
 """
-from qbraid.transpiler.conversions import convert_from_cirq, convert_to_cirq
+from qbraid.transpiler.batch import transpile_batch
+from qbraid.transpiler.cache import (
+    DiskTranspileCache,
+    TranspileCache,
+    disable_transpile_cache,
+    enable_disk_transpile_cache,
+    enable_transpile_cache,
+    get_disk_transpile_cache,
+    get_transpile_cache,
+    program_fingerprint,
+)
+from qbraid.transpiler.conversion_graph import Conversion, ConversionGraph, get_conversion_graph
+from qbraid.transpiler.conversions import (
+    convert_from_cirq,
+    convert_to_cirq,
+    get_fallback_counts,
+    reset_fallback_counts,
+)
 from qbraid.transpiler.exceptions import CircuitConversionError, QasmError
+from qbraid.transpiler.parameterized import ParameterizedProgram, transpile_parameterized
+from qbraid.transpiler.profiling import TranspileProfile, profile
+from qbraid.transpiler.streaming import transpile_qasm_stream
 from qbraid.transpiler.wrappers.abc_qprogram import QuantumProgramWrapper
 from qbraid.transpiler.wrappers.braket_circuit import BraketCircuitWrapper
 from qbraid.transpiler.wrappers.cirq_circuit import CirqCircuitWrapper
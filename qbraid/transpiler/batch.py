@@ -0,0 +1,117 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module for transpiling batches of quantum programs over a process pool.
+
+"""
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
+
+from qbraid.transpiler.exceptions import CircuitConversionError
+
+if TYPE_CHECKING:
+    import qbraid
+
+
+def _transpile_one(
+    program: "qbraid.QPROGRAM", target: str
+) -> Union["qbraid.QPROGRAM", CircuitConversionError]:
+    """Transpile a single program, returning the error instead of raising it. Errors are
+    re-raised as :class:`~qbraid.transpiler.CircuitConversionError` so that they can be
+    pickled back to the parent process regardless of their original type."""
+    # pylint: disable-next=import-outside-toplevel
+    from qbraid.wrappers import circuit_wrapper
+
+    try:
+        return circuit_wrapper(program).transpile(target)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return _conversion_error(err)
+
+
+def _conversion_error(err: BaseException) -> CircuitConversionError:
+    return CircuitConversionError(f"{type(err).__name__}: {err}")
+
+
+def _transpile_chunk(
+    chunk: List[Tuple[int, "qbraid.QPROGRAM"]], target: str
+) -> List[Tuple[int, Union["qbraid.QPROGRAM", CircuitConversionError]]]:
+    """Transpile a chunk of indexed programs in a worker process. Errors are caught per
+    item, so a failing program only affects its own entry of the returned list."""
+    return [(index, _transpile_one(program, target)) for index, program in chunk]
+
+
+def transpile_batch(
+    programs: Sequence["qbraid.QPROGRAM"],
+    target: str,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Union["qbraid.QPROGRAM", CircuitConversionError]]:
+    """Transpile a batch of quantum programs to ``target`` using a pool of worker processes.
+
+    Programs that fail to convert do not abort the batch. Instead, the corresponding
+    entry of the returned list holds a :class:`~qbraid.transpiler.CircuitConversionError`
+    describing the failure. If a whole chunk fails, e.g. because one of its programs or
+    results cannot be pickled or its worker process died, the programs of that chunk are
+    transpiled one at a time in the calling process.
+
+    Args:
+        programs: Sequence of qBraid-supported quantum programs.
+        target: Package to transpile to. Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+            If 1, programs are transpiled in the calling process.
+        chunksize: Number of programs sent to a worker at a time. Defaults to splitting
+            the batch into roughly four chunks per worker.
+
+    Returns:
+        List of transpiled programs (or errors), in the same order as ``programs``.
+
+    """
+    programs = list(programs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}.")
+
+    max_workers = min(max_workers, max(len(programs), 1))
+    convert = partial(_transpile_one, target=target)
+
+    if max_workers == 1:
+        return [convert(program) for program in programs]
+
+    if chunksize is None:
+        chunksize = max(1, len(programs) // (max_workers * 4))
+
+    indexed = list(enumerate(programs))
+    chunks = [indexed[start : start + chunksize] for start in range(0, len(indexed), chunksize)]
+    convert_chunk = partial(_transpile_chunk, target=target)
+
+    results: List[Union["qbraid.QPROGRAM", CircuitConversionError]] = [None] * len(programs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: List[Optional[Future]] = []
+        for chunk in chunks:
+            try:
+                futures.append(executor.submit(convert_chunk, chunk))
+            except BrokenProcessPool:
+                futures.append(None)
+        for chunk, future in zip(chunks, futures):
+            if future is not None and future.exception() is None:
+                for index, result in future.result():
+                    results[index] = result
+                continue
+            # e.g. a program or result that cannot be pickled, or a worker that died
+            for index, program in chunk:
+                results[index] = convert(program)
+    return results
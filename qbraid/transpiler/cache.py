@@ -0,0 +1,488 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining opt-in, content-addressed caches of transpiled quantum programs.
+
+"""
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
+
+from qbraid._version import __version__
+
+if TYPE_CHECKING:
+    import qbraid
+
+CacheKey = Tuple[str, str, str]
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "nbytes"])
+
+
+def _serialize_program(program: "qbraid.QPROGRAM", package: str) -> bytes:
+    """Return a canonical, lossless serialization of ``program``."""
+    if package == "qiskit":
+        # OpenQASM drops the global phase and rounds parameters, so it is not lossless
+        return pickle.dumps((program.global_phase, program.qregs, program.cregs, program.data))
+    return _serialize_program_text(program, package).encode()
+
+
+def _serialize_program_text(program: "qbraid.QPROGRAM", package: str) -> str:
+    if package == "qasm2":
+        return program
+    if package == "cirq":
+        return repr(program)
+    if package == "braket":
+        return program.to_ir().json()
+    if package == "pyquil":
+        return program.out()
+    if package == "pytket":
+        return json.dumps(program.to_dict(), sort_keys=True)
+    raise ValueError(f"Cannot fingerprint program of package {package}.")
+
+
+def program_fingerprint(program: "qbraid.QPROGRAM", package: str) -> str:
+    """Return a content hash identifying ``program``.
+
+    Programs of the same package with equal canonical serializations have equal
+    fingerprints. Programs that cannot be serialized canonically are fingerprinted
+    from their pickled bytes.
+
+    Args:
+        program (:data:`~qbraid.QPROGRAM`): A qbraid-supported quantum program object.
+        package: The package of ``program``.
+
+    Returns:
+        Hex digest of the SHA-256 hash of the serialized program.
+
+    """
+    try:
+        data = _serialize_program(program, package)
+    except Exception:  # pylint: disable=broad-exception-caught
+        data = pickle.dumps(program)
+    return hashlib.sha256(package.encode() + b":" + data).hexdigest()
+
+
+class TranspileCache:
+    """Least-recently-used cache mapping ``(fingerprint, source, target)`` keys to
+    transpiled programs.
+
+    Entries are stored pickled, so every lookup returns a fresh copy that callers can
+    mutate without corrupting the cache. The pickled size is also used for
+    memory-based eviction.
+
+    Args:
+        maxsize: Maximum number of entries. If None, the number of entries is unbounded.
+        max_bytes: Maximum total size of the pickled entries. If None, unbounded.
+
+    """
+
+    def __init__(self, maxsize: Optional[int] = 256, max_bytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._data
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return a copy of the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            data = self._data.get(key)
+            if data is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+        return pickle.loads(data)
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least-recently-used entries as needed.
+        Values that cannot be pickled, or that alone exceed ``max_bytes``, are not cached.
+        """
+        try:
+            data = pickle.dumps(value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= len(self._data.pop(key))
+            self._data[key] = data
+            self._nbytes += len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+            self.max_bytes is not None and self._nbytes > self.max_bytes
+        ):
+            _, data = self._data.popitem(last=False)
+            self._nbytes -= len(data)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit / miss counters."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit / miss statistics and the current size of the cache."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self), self._nbytes)
+
+
+DEFAULT_DISK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".qbraid", "transpile_cache.db")
+
+
+_KEY_SIZE = 32
+
+
+def _read_key(path: str) -> bytes:
+    # a key created on a file system without hard links is written after its file is
+    # created, so wait for another process to finish writing it
+    for _ in range(100):
+        with open(path, "rb") as file:
+            key = file.read()
+        if len(key) >= _KEY_SIZE:
+            break
+        time.sleep(0.01)
+    return key
+
+
+def _load_or_create_key(path: str) -> bytes:
+    """Return the secret key stored at ``path``, creating it readable only by the current
+    user if it does not exist yet. Concurrent callers all end up with the same key."""
+    try:
+        return _read_key(path)
+    except FileNotFoundError:
+        pass
+    key = os.urandom(_KEY_SIZE)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(key)
+        os.link(tmp_path, path)
+    except FileExistsError:
+        pass
+    except OSError:  # hard links are not supported
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as file:
+                file.write(key)
+    finally:
+        os.unlink(tmp_path)
+    return _read_key(path)
+
+
+class DiskTranspileCache:
+    """SQLite-backed transpile cache that can be shared by worker processes and that
+    persists across interpreter sessions.
+
+    Entries are keyed by ``(fingerprint, source, target, qbraid version)``, so results never
+    outlive a change to the transpiler, and environments with different versions of qBraid
+    can share one file without invalidating each other's entries. Every write happens in a
+    single transaction. Entries not read for ``max_age`` seconds are removed when the cache
+    is opened, and least-recently-used entries of any version are evicted to keep the total
+    size of the stored programs under ``max_bytes``.
+
+    Entries are stored pickled, and unpickling data can execute arbitrary code, so the
+    cache file must only be writable by trusted users. As a safeguard against files copied
+    from elsewhere, every entry is signed with an HMAC keyed by a secret stored next to the
+    database (``<path>.key``, readable only by its owner), and entries whose signature does
+    not match are discarded instead of unpickled.
+
+    Args:
+        path: Path of the SQLite database file. Defaults to ``~/.qbraid/transpile_cache.db``.
+        max_bytes: Maximum total size of the pickled entries. If None, unbounded.
+        max_age: Maximum time in seconds since an entry was last read or written before it
+            is removed. If None, entries do not expire.
+
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: Optional[int] = 2**28,
+        max_age: Optional[float] = 30 * 24 * 3600,
+    ):
+        self.path = path or DEFAULT_DISK_CACHE_PATH
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.version = __version__
+        self._hits = 0
+        self._misses = 0
+
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(dirname, exist_ok=True)
+        self._key = _load_or_create_key(self.path + ".key")
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(entries)")]
+            if columns and "digest" not in columns:
+                conn.execute("DROP TABLE entries")  # written before entries were signed
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "fingerprint TEXT, source TEXT, target TEXT, version TEXT, "
+                "data BLOB, digest BLOB, nbytes INTEGER, last_access REAL, "
+                "PRIMARY KEY (fingerprint, source, target, version))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+            )
+            # total size of the entries, kept up to date by triggers so that eviction
+            # does not scan the table, and recomputed on open in case it drifted
+            conn.execute("CREATE TABLE IF NOT EXISTS size (total INTEGER NOT NULL)")
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                "BEGIN UPDATE size SET total = total + new.nbytes; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                "BEGIN UPDATE size SET total = total - old.nbytes; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF nbytes ON entries "
+                "BEGIN UPDATE size SET total = total - old.nbytes + new.nbytes; END"
+            )
+            conn.execute("DELETE FROM size")
+            conn.execute("INSERT INTO size SELECT COALESCE(SUM(nbytes), 0) FROM entries")
+            if self.max_age is not None:
+                conn.execute(
+                    "DELETE FROM entries WHERE last_access < ?", (time.time() - self.max_age,)
+                )
+
+    def _digest(self, data: bytes) -> bytes:
+        return hmac.new(self._key, data, hashlib.sha256).digest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection whose statements are committed, or rolled back on error, as
+        one transaction."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        # rows replaced by INSERT OR REPLACE fire the delete trigger only with this set
+        conn.execute("PRAGMA recursive_triggers=ON")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE version=?", (self.version,)
+            ).fetchone()[0]
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM entries WHERE fingerprint=? AND source=? AND target=? "
+                "AND version=?",
+                (*key, self.version),
+            ).fetchone()
+        return row is not None
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        with self._connect() as conn:
+            params = (*key, self.version)
+            row = conn.execute(
+                "SELECT data, digest FROM entries WHERE fingerprint=? AND source=? "
+                "AND target=? AND version=?",
+                params,
+            ).fetchone()
+            if row is not None and not hmac.compare_digest(self._digest(row[0]), row[1]):
+                conn.execute(
+                    "DELETE FROM entries WHERE fingerprint=? AND source=? AND target=? "
+                    "AND version=?",
+                    params,
+                )
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            conn.execute(
+                "UPDATE entries SET last_access=? WHERE fingerprint=? AND source=? "
+                "AND target=? AND version=?",
+                (time.time(), *params),
+            )
+        self._hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least-recently-used entries as needed.
+        Values that cannot be pickled, or that alone exceed ``max_bytes``, are not cached.
+        """
+        try:
+            data = pickle.dumps(value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, self.version, data, self._digest(data), len(data), time.time()),
+            )
+            if self.max_bytes is not None:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT total FROM size").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # walk the last_access index from the oldest entry, only as far as needed
+        cursor = conn.execute("SELECT rowid, nbytes FROM entries ORDER BY last_access")
+        stale = []
+        for rowid, nbytes in cursor:
+            stale.append((rowid,))
+            total -= nbytes
+            if total <= self.max_bytes:
+                break
+        cursor.close()
+        conn.executemany("DELETE FROM entries WHERE rowid=?", stale)
+
+    def clear(self) -> None:
+        """Remove the entries of this version of qBraid and reset the hit / miss counters."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE version=?", (self.version,))
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit / miss statistics and the current size of the entries of this version
+        of qBraid."""
+        with self._connect() as conn:
+            count, nbytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM entries WHERE version=?",
+                (self.version,),
+            ).fetchone()
+        return CacheInfo(self._hits, self._misses, None, count, nbytes)
+
+
+_transpile_cache: Optional[TranspileCache] = None
+_disk_transpile_cache: Optional[DiskTranspileCache] = None
+
+
+def enable_transpile_cache(
+    maxsize: Optional[int] = 256, max_bytes: Optional[int] = None
+) -> TranspileCache:
+    """Enable in-memory caching of :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile`
+    results.
+
+    Args:
+        maxsize: Maximum number of entries. If None, the number of entries is unbounded.
+        max_bytes: Maximum total size of the pickled entries. If None, unbounded.
+
+    Returns:
+        The newly enabled cache.
+
+    """
+    global _transpile_cache  # pylint: disable=global-statement
+    _transpile_cache = TranspileCache(maxsize=maxsize, max_bytes=max_bytes)
+    return _transpile_cache
+
+
+def enable_disk_transpile_cache(
+    path: Optional[str] = None,
+    max_bytes: Optional[int] = 2**28,
+    max_age: Optional[float] = 30 * 24 * 3600,
+) -> DiskTranspileCache:
+    """Enable on-disk caching of :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile`
+    results. When the in-memory cache is also enabled, it is checked first.
+
+    Args:
+        path: Path of the SQLite database file. Defaults to ``~/.qbraid/transpile_cache.db``.
+        max_bytes: Maximum total size of the pickled entries. If None, unbounded.
+        max_age: Maximum time in seconds since an entry was last read or written before it
+            is removed. If None, entries do not expire.
+
+    Returns:
+        The newly enabled cache.
+
+    """
+    global _disk_transpile_cache  # pylint: disable=global-statement
+    _disk_transpile_cache = DiskTranspileCache(path=path, max_bytes=max_bytes, max_age=max_age)
+    return _disk_transpile_cache
+
+
+def disable_transpile_cache() -> None:
+    """Disable caching of transpile results. The on-disk cache file is left in place."""
+    global _transpile_cache, _disk_transpile_cache  # pylint: disable=global-statement
+    _transpile_cache = None
+    _disk_transpile_cache = None
+
+
+def get_transpile_cache() -> Optional[TranspileCache]:
+    """Return the active in-memory transpile cache, or None if it is disabled."""
+    return _transpile_cache
+
+
+def get_disk_transpile_cache() -> Optional[DiskTranspileCache]:
+    """Return the active on-disk transpile cache, or None if it is disabled."""
+    return _disk_transpile_cache
+
+
+def _active_caches() -> List[Any]:
+    return [cache for cache in (_transpile_cache, _disk_transpile_cache) if cache is not None]
+
+
+def transpile_cache_key(program: "qbraid.QPROGRAM", source: str, target: str) -> Optional[CacheKey]:
+    """Return the cache key of a ``source`` to ``target`` conversion of ``program``, or
+    None if no transpile cache is enabled. The key also covers the configuration of the
+    conversion graph, so that results are not reused after its conversions change."""
+    if len(_active_caches()) == 0:
+        return None
+    # pylint: disable-next=import-outside-toplevel
+    from qbraid.transpiler.conversion_graph import get_conversion_graph
+
+    fingerprint = program_fingerprint(program, source)
+    graph_fingerprint = get_conversion_graph().fingerprint()
+    key = hashlib.sha256(f"{fingerprint}:{graph_fingerprint}".encode()).hexdigest()
+    return key, source, target
+
+
+def lookup_transpiled(key: CacheKey) -> Optional["qbraid.QPROGRAM"]:
+    """Return a cached transpiled program, or None on a miss. Hits from the on-disk cache
+    are copied into the in-memory cache."""
+    caches = _active_caches()
+    for idx, cache in enumerate(caches):
+        program = cache.get(key)
+        if program is not None:
+            for faster_cache in caches[:idx]:
+                faster_cache.put(key, program)
+            return program
+    return None
+
+
+def store_transpiled(key: CacheKey, program: "qbraid.QPROGRAM") -> None:
+    """Store a transpiled program in every enabled transpile cache."""
+    for cache in _active_caches():
+        cache.put(key, program)
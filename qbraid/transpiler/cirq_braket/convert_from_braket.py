@@ -15,10 +15,12 @@
 Module for converting Cirq circuits to Braket circuits
 
 """
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import numpy as np
+import sympy
 from braket.circuits import Circuit as BKCircuit
+from braket.circuits import FreeParameterExpression
 from braket.circuits import Instruction as BKInstruction
 from braket.circuits import gates as braket_gates
 from braket.circuits import noises as braket_noise_gate
@@ -40,6 +42,22 @@ def _gate_to_matrix_braket(gate: braket_gates.Unitary) -> np.ndarray:
     return to_unitary(circuit)
 
 
+def _angle(gate: braket_gates.AngledGate) -> Union[float, sympy.Expr]:
+    """Returns the angle of a Braket gate, as a sympy expression if it is parameterized."""
+    angle = gate.angle
+    if isinstance(angle, FreeParameterExpression):
+        return angle.expression
+    return angle
+
+
+def _exponent(gate: braket_gates.AngledGate) -> Union[float, sympy.Expr]:
+    """Returns the angle of a Braket gate in units of pi, i.e. as a Cirq gate exponent."""
+    angle = _angle(gate)
+    if isinstance(angle, sympy.Expr):
+        return angle / sympy.pi
+    return angle / np.pi
+
+
 def unitary_braket_instruction(instr: BKInstruction) -> BKInstruction:
     """Converts a Braket instruction to a unitary gate instruction.
 
@@ -166,13 +184,13 @@ def _from_one_qubit_braket_instruction(
 
     # One-qubit parameterized gates.
     if isinstance(gate, braket_gates.Rx):
-        return [cirq_ops.rx(gate.angle).on(*qubits)]
+        return [cirq_ops.rx(_angle(gate)).on(*qubits)]
     if isinstance(gate, braket_gates.Ry):
-        return [cirq_ops.ry(gate.angle).on(*qubits)]
+        return [cirq_ops.ry(_angle(gate)).on(*qubits)]
     if isinstance(gate, braket_gates.Rz):
-        return [cirq_ops.rz(gate.angle).on(*qubits)]
+        return [cirq_ops.rz(_angle(gate)).on(*qubits)]
     if isinstance(gate, braket_gates.PhaseShift):
-        return [cirq_ops.Z.on(*qubits) ** (gate.angle / np.pi)]
+        return [cirq_ops.Z.on(*qubits) ** (_exponent(gate))]
 
     # One-qubit Noise gates.
     if isinstance(gate, braket_noise_gate.BitFlip):
@@ -230,40 +248,40 @@ def _from_two_qubit_braket_instruction(
 
     # Two-qubit parameterized gates.
     if isinstance(gate, braket_gates.CPhaseShift):
-        return [cirq_ops.CZ.on(*qubits) ** (gate.angle / np.pi)]
+        return [cirq_ops.CZ.on(*qubits) ** (_exponent(gate))]
     if isinstance(gate, braket_gates.CPhaseShift00):
         return [
             cirq_ops.XX(*qubits),
-            cirq_ops.CZ.on(*qubits) ** (gate.angle / np.pi),
+            cirq_ops.CZ.on(*qubits) ** (_exponent(gate)),
             cirq_ops.XX(*qubits),
         ]
     if isinstance(gate, braket_gates.CPhaseShift01):
         return [
             cirq_ops.X(qubits[0]),
-            cirq_ops.CZ.on(*qubits) ** (gate.angle / np.pi),
+            cirq_ops.CZ.on(*qubits) ** (_exponent(gate)),
             cirq_ops.X(qubits[0]),
         ]
     if isinstance(gate, braket_gates.CPhaseShift10):
         return [
             cirq_ops.X(qubits[1]),
-            cirq_ops.CZ.on(*qubits) ** (gate.angle / np.pi),
+            cirq_ops.CZ.on(*qubits) ** (_exponent(gate)),
             cirq_ops.X(qubits[1]),
         ]
     if isinstance(gate, braket_gates.PSwap):
         return [
             cirq_ops.SWAP.on(*qubits),
             cirq_ops.CNOT.on(*qubits),
-            cirq_ops.Z.on(qubits[1]) ** (gate.angle / np.pi),
+            cirq_ops.Z.on(qubits[1]) ** (_exponent(gate)),
             cirq_ops.CNOT.on(*qubits),
         ]
     if isinstance(gate, braket_gates.XX):
-        return [cirq_ops.XXPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
+        return [cirq_ops.XXPowGate(exponent=_exponent(gate), global_shift=-0.5).on(*qubits)]
     if isinstance(gate, braket_gates.YY):
-        return [cirq_ops.YYPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
+        return [cirq_ops.YYPowGate(exponent=_exponent(gate), global_shift=-0.5).on(*qubits)]
     if isinstance(gate, braket_gates.ZZ):
-        return [cirq_ops.ZZPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
+        return [cirq_ops.ZZPowGate(exponent=_exponent(gate), global_shift=-0.5).on(*qubits)]
     if isinstance(gate, braket_gates.XY):
-        return [cirq_ops.ISwapPowGate(exponent=gate.angle / np.pi).on(*qubits)]
+        return [cirq_ops.ISwapPowGate(exponent=_exponent(gate)).on(*qubits)]
 
     # Two-qubit noise gates.
     if isinstance(gate, braket_noise_gate.Kraus):
@@ -18,7 +18,9 @@ Module for converting Braket circuits to Cirq circuits
 from typing import Dict, List, Optional, Union
 
 import numpy as np
+import sympy
 from braket.circuits import Circuit as BKCircuit
+from braket.circuits import FreeParameterExpression
 from braket.circuits import Instruction as BKInstruction
 from braket.circuits import gates as braket_gates
 from braket.circuits import noises as braket_noise_gate
@@ -52,6 +54,22 @@ def to_braket(circuit: Circuit) -> BKCircuit:
     )
 
 
+def _isclose(value: Union[float, sympy.Expr], other: float) -> bool:
+    """Returns True if ``value`` is a number close to ``other``. Parameterized values are
+    never close to a number."""
+    return not isinstance(value, sympy.Basic) and np.isclose(value, other)
+
+
+def _angle(exponent: Union[float, sympy.Expr]) -> Union[float, FreeParameterExpression]:
+    """Returns the rotation angle of a Cirq gate exponent, as a Braket free parameter
+    expression if the exponent is parameterized."""
+    if isinstance(exponent, sympy.Basic):
+        # pi cancels out of e.g. cirq.rx(theta), and is otherwise evaluated, since Braket
+        # can't compute the matrix of gates bound to a symbolic constant
+        return FreeParameterExpression((exponent * sympy.pi).evalf())
+    return exponent * np.pi
+
+
 def _to_braket_instruction(
     operation: cirq_ops.Operation,
     qubit_mapping: Dict[int, int],
@@ -131,43 +149,43 @@ def _to_one_qubit_braket_instruction(
     def convert_one_qubit_gate(gate, target):
         if isinstance(gate, cirq_ops.XPowGate):
             exponent = gate.exponent
-            if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            if _isclose(exponent, 1.0) or _isclose(exponent, -1.0):
                 return [BKInstruction(braket_gates.X(), target)]
-            if np.isclose(exponent, 0.5):
+            if _isclose(exponent, 0.5):
                 return [BKInstruction(braket_gates.V(), target)]
-            if np.isclose(exponent, -0.5):
+            if _isclose(exponent, -0.5):
                 return [BKInstruction(braket_gates.Vi(), target)]
 
-            return [BKInstruction(braket_gates.Rx(exponent * np.pi), target)]
+            return [BKInstruction(braket_gates.Rx(_angle(exponent)), target)]
 
         if isinstance(gate, cirq_ops.YPowGate):
             exponent = gate.exponent
 
-            if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            if _isclose(exponent, 1.0) or _isclose(exponent, -1.0):
                 return [BKInstruction(braket_gates.Y(), target)]
 
-            return [BKInstruction(braket_gates.Ry(exponent * np.pi), target)]
+            return [BKInstruction(braket_gates.Ry(_angle(exponent)), target)]
 
         if isinstance(gate, cirq_ops.ZPowGate):
             global_shift = gate.global_shift
             exponent = gate.exponent
 
-            if np.isclose(global_shift, 0.0):
-                if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            if _isclose(global_shift, 0.0):
+                if _isclose(exponent, 1.0) or _isclose(exponent, -1.0):
                     return [BKInstruction(braket_gates.Z(), target)]
-                if np.isclose(exponent, 0.5):
+                if _isclose(exponent, 0.5):
                     return [BKInstruction(braket_gates.S(), target)]
-                if np.isclose(exponent, -0.5):
+                if _isclose(exponent, -0.5):
                     return [BKInstruction(braket_gates.Si(), target)]
-                if np.isclose(exponent, 0.25):
+                if _isclose(exponent, 0.25):
                     return [BKInstruction(braket_gates.T(), target)]
-                if np.isclose(exponent, -0.25):
+                if _isclose(exponent, -0.25):
                     return [BKInstruction(braket_gates.Ti(), target)]
-                return [BKInstruction(braket_gates.PhaseShift(exponent * np.pi), target)]
-            if np.isclose(global_shift, -0.5):
-                return [BKInstruction(braket_gates.Rz(exponent * np.pi), target)]
+                return [BKInstruction(braket_gates.PhaseShift(_angle(exponent)), target)]
+            if _isclose(global_shift, -0.5):
+                return [BKInstruction(braket_gates.Rz(_angle(exponent)), target)]
 
-        if isinstance(gate, cirq_ops.HPowGate) and np.isclose(abs(gate.exponent), 1.0):
+        if isinstance(gate, cirq_ops.HPowGate) and _isclose(abs(gate.exponent), 1.0):
             return [BKInstruction(braket_gates.H(), target)]
 
         if isinstance(gate, cirq_ops.IdentityGate):
@@ -243,20 +261,26 @@ def _to_two_qubit_braket_instruction(
     q1, q2 = qubits
 
     # Check common two-qubit gates.
-    if isinstance(gate, cirq_ops.CNotPowGate) and np.isclose(abs(gate.exponent), 1.0):
+    if isinstance(gate, cirq_ops.CNotPowGate) and _isclose(abs(gate.exponent), 1.0):
         return [BKInstruction(braket_gates.CNot(), [q1, q2])]
-    if isinstance(gate, cirq_ops.CZPowGate) and np.isclose(abs(gate.exponent), 1.0):
+    if isinstance(gate, cirq_ops.CZPowGate) and _isclose(abs(gate.exponent), 1.0):
         return [BKInstruction(braket_gates.CZ(), [q1, q2])]
-    if isinstance(gate, cirq_ops.SwapPowGate) and np.isclose(gate.exponent, 1.0):
+    if isinstance(gate, cirq_ops.SwapPowGate) and _isclose(gate.exponent, 1.0):
         return [BKInstruction(braket_gates.Swap(), [q1, q2])]
-    if isinstance(gate, cirq_ops.ISwapPowGate) and np.isclose(gate.exponent, 1.0):
+    if isinstance(gate, cirq_ops.ISwapPowGate) and _isclose(gate.exponent, 1.0):
         return [BKInstruction(braket_gates.ISwap(), [q1, q2])]
     if isinstance(gate, cirq_ops.XXPowGate):
-        return [BKInstruction(braket_gates.XX(gate.exponent * np.pi), [q1, q2])]
+        return [BKInstruction(braket_gates.XX(_angle(gate.exponent)), [q1, q2])]
     if isinstance(gate, cirq_ops.YYPowGate):
-        return [BKInstruction(braket_gates.YY(gate.exponent * np.pi), [q1, q2])]
+        return [BKInstruction(braket_gates.YY(_angle(gate.exponent)), [q1, q2])]
     if isinstance(gate, cirq_ops.ZZPowGate):
-        return [BKInstruction(braket_gates.ZZ(gate.exponent * np.pi), [q1, q2])]
+        return [BKInstruction(braket_gates.ZZ(_angle(gate.exponent)), [q1, q2])]
+    if (
+        isinstance(gate, cirq_ops.CZPowGate)
+        and protocols.is_parameterized(gate)
+        and _isclose(gate.global_shift, 0.0)
+    ):
+        return [BKInstruction(braket_gates.CPhaseShift(_angle(gate.exponent)), [q1, q2])]
     if isinstance(gate, cirq_ops.ControlledGate):
         sub_gate_instr = _to_one_qubit_braket_instruction(gate.sub_gate, q2)
         sub_gate = sub_gate_instr[0].operator
@@ -18,6 +18,7 @@ import numpy as np
 import pytest
 # from cirq import Circuit, LineQubit, ops, protocols
 from pytket.circuit import Circuit as TKCircuit
+from pytket.circuit import Unitary1qBox
 
 from qbraid.interface import circuits_allclose, random_circuit
 from qbraid.transpiler.cirq_pytket.conversions import from_pytket
@@ -68,8 +69,16 @@ def test_100_random_pytket():
         assert circuits_allclose(pytket_circuit, cirq_circuit, strict_gphase=False)
 
 
+def test_custom_gate_def():
+    """Tests converting a gate that pytket exports as a custom qasm gate definition"""
+    pytket_circuit = TKCircuit(2)
+    pytket_circuit.ISWAPMax(0, 1)
+    cirq_circuit = from_pytket(pytket_circuit)
+    assert circuits_allclose(pytket_circuit, cirq_circuit, strict_gphase=False)
+
+
 def test_raise_error():
     with pytest.raises(CircuitConversionError):
         pytket_circuit = TKCircuit(2)
-        pytket_circuit.ISWAPMax(0, 1)
-        cirq_circuit = from_pytket(pytket_circuit)
+        pytket_circuit.add_unitary1qbox(Unitary1qBox(np.eye(2)), 0)
+        from_pytket(pytket_circuit)
@@ -18,13 +18,24 @@ QASM conversions  (:mod:`qbraid.transpiler.cirq_qasm`)
 .. autosummary::
    :toctree: ../stubs/
 
+   emit_qasm
    from_qasm
+   fast_parse_qasm
+   parse_qasm
    to_qasm
    Qasm
    QasmGateStatement
+   QasmParseContext
    QasmParser
 
 
 """
-from qbraid.transpiler.cirq_qasm.qasm_conversions import from_qasm, to_qasm
-from qbraid.transpiler.cirq_qasm.qasm_parser import Qasm, QasmGateStatement, QasmParser
+from qbraid.transpiler.cirq_qasm.qasm_conversions import from_qasm, parse_qasm, to_qasm
+from qbraid.transpiler.cirq_qasm.qasm_emitter import emit_qasm
+from qbraid.transpiler.cirq_qasm.qasm_fast_parser import fast_parse_qasm
+from qbraid.transpiler.cirq_qasm.qasm_parser import (
+    Qasm,
+    QasmGateStatement,
+    QasmParseContext,
+    QasmParser,
+)
@@ -18,54 +18,66 @@ import cirq
 from cirq import ops
 
 import qbraid
-from qbraid.transpiler.cirq_qasm.qasm_parser import QasmParser
+from qbraid.transpiler.cirq_qasm.qasm_emitter import emit_qasm
+from qbraid.transpiler.cirq_qasm.qasm_fast_parser import fast_parse_qasm
+from qbraid.transpiler.cirq_qasm.qasm_parser import Qasm, QasmParser
 from qbraid.transpiler.cirq_qasm.qasm_preprocess import convert_to_supported_qasm
+from qbraid.transpiler.profiling import profiled
 
 QASMType = str
 
+# Parser shared by all calls, which is safe to use from several threads
+_parser = QasmParser()
 
-def _to_qasm_output(
+
+@profiled("to_qasm")
+def to_qasm(
     circuit: cirq.Circuit,
     header: Optional[str] = None,
     precision: int = 10,
     qubit_order: "cirq.QubitOrderOrList" = ops.QubitOrder.DEFAULT,
-) -> "cirq.QasmOutput":
-    """Returns a QASM object equivalent to the circuit.
+    map_zpow: bool = False,
+) -> QASMType:
+    """Returns a QASM string representing the input Cirq circuit.
 
     Args:
+        circuit: Cirq circuit to convert to a QASM string.
         header: A multi-line string that is placed in a comment at the top
-            of the QASM. Defaults to a cirq version specifier.
+            of the QASM. Defaults to a qBraid version specifier.
         precision: Number of digits to use when representing numbers.
         qubit_order: Determines how qubits are ordered in the QASM
             register.
+        map_zpow: If True, Z rotations without global phase are written as ``p``
+            gates, as by :class:`qbraid.transpiler.custom_gates.ZPowGate`.
+
+    Returns:
+        QASMType: QASM string equivalent to the input Cirq circuit.
     """
     if header is None:
         header = f"Generated from qBraid v{qbraid._version.__version__}"
-    qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(circuit.all_qubits())
-    return cirq.QasmOutput(
-        operations=circuit.all_operations(),
-        qubits=qubits,
-        header=header,
-        precision=precision,
-        version="2.0",
-    )
+    return emit_qasm(circuit, header, precision, qubit_order, map_zpow=map_zpow)
 
 
-def to_qasm(
-    circuit: cirq.Circuit,
-    header: Optional[str] = None,
-    precision: int = 10,
-    qubit_order: "cirq.QubitOrderOrList" = ops.QubitOrder.DEFAULT,
-) -> QASMType:
-    """Returns a QASM string representing the input Cirq circuit.
+def parse_qasm(qasm: QASMType) -> Qasm:
+    """Preprocesses and parses the input QASM string. The returned object holds the
+    parsed Cirq circuit along with the quantum and classical registers, so that the
+    program does not need to be parsed again.
+
+    Programs in the flat subset of QASM handled by
+    :func:`~qbraid.transpiler.cirq_qasm.fast_parse_qasm` are parsed by it, and all
+    others by the :class:`~qbraid.transpiler.cirq_qasm.QasmParser`.
 
     Args:
-        circuit: Cirq circuit to convert to a QASM string.
+        qasm: QASM string to parse.
 
     Returns:
-        QASMType: QASM string equivalent to the input Cirq circuit.
+        Parsed QASM program.
     """
-    return str(_to_qasm_output(circuit, header, precision, qubit_order))
+    qasm = convert_to_supported_qasm(qasm)
+    parsed = fast_parse_qasm(qasm)
+    if parsed is None:
+        parsed = _parser.parse(qasm)
+    return parsed
 
 
 def from_qasm(qasm: QASMType) -> cirq.Circuit:
@@ -77,5 +89,4 @@ def from_qasm(qasm: QASMType) -> cirq.Circuit:
     Returns:
         Cirq circuit representation equivalent to the input QASM string.
     """
-    qasm = convert_to_supported_qasm(qasm)
-    return QasmParser().parse(qasm).circuit
+    return parse_qasm(qasm).circuit
@@ -0,0 +1,297 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+# pylint: disable=unused-argument
+
+"""
+Module containing a QASM 2 emitter for Cirq circuits, which writes the operations of
+common gates from a table of formatters, and leaves all others to ``cirq.QasmOutput``.
+
+Operations whose QASM spans several lines are written by the private
+``cirq.QasmOutput._write_operations``, which annotates them as ``str(cirq.QasmOutput)``
+does. If this cirq version does not have it, the whole circuit is written by
+``str(cirq.QasmOutput)`` instead.
+
+"""
+import io
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence
+
+import cirq
+from cirq import ops
+
+from qbraid.transpiler.custom_gates import ZPowGate, _map_zpow_and_unroll
+
+# Formats an operation of a gate on the given QASM qubit ids, or returns None to leave
+# the operation to cirq.
+GateFormatter = Callable[[ops.Gate, Sequence[str], cirq.QasmArgs], Optional[str]]
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_half_turns(value: float, precision: int) -> str:
+    """Returns an exponent in half turns as an angle in radians, formatted as by
+    ``cirq.QasmArgs``. Values are memoized, as circuits often repeat the same angles."""
+    if isinstance(value, float):
+        value = round(value, precision)
+    return f"pi*{value}" if value != 0 else "0"
+
+
+def _half_turns(value: float, args: cirq.QasmArgs) -> Optional[str]:
+    if not isinstance(value, (float, int)):  # e.g. a symbol
+        return None
+    return _format_half_turns(value, args.precision)
+
+
+def _rotation(name: str, exponent: float, qubit: str, args: cirq.QasmArgs) -> Optional[str]:
+    angle = _half_turns(exponent, args)
+    return None if angle is None else f"{name}({angle}) {qubit};\n"
+
+
+def _format_x(gate: ops.XPowGate, qubits: Sequence[str], args: cirq.QasmArgs) -> Optional[str]:
+    if gate.global_shift == 0:
+        if gate.exponent == 1:
+            return f"x {qubits[0]};\n"
+        if gate.exponent == 0.5:
+            return f"sx {qubits[0]};\n"
+        if gate.exponent == -0.5:
+            return f"sxdg {qubits[0]};\n"
+    return _rotation("rx", gate.exponent, qubits[0], args)
+
+
+def _format_y(gate: ops.YPowGate, qubits: Sequence[str], args: cirq.QasmArgs) -> Optional[str]:
+    if gate.exponent == 1 and gate.global_shift != -0.5:
+        return f"y {qubits[0]};\n"
+    return _rotation("ry", gate.exponent, qubits[0], args)
+
+
+_Z_POWERS = {1: "z", 0.5: "s", -0.5: "sdg", 0.25: "t", -0.25: "tdg"}
+
+
+def _format_z(gate: ops.ZPowGate, qubits: Sequence[str], args: cirq.QasmArgs) -> Optional[str]:
+    if gate.global_shift == 0 and isinstance(gate.exponent, (float, int)):
+        name = _Z_POWERS.get(gate.exponent)
+        if name is not None:
+            return f"{name} {qubits[0]};\n"
+    return _rotation("rz", gate.exponent, qubits[0], args)
+
+
+def _format_phase(gate: ops.ZPowGate, qubits: Sequence[str], args: cirq.QasmArgs) -> Optional[str]:
+    """Formats a Z rotation as :class:`qbraid.transpiler.custom_gates.ZPowGate` does,
+    i.e. as a ``p`` gate rather than an ``rz`` gate when it has no global phase."""
+    if gate.global_shift == 0:
+        if isinstance(gate.exponent, (float, int)):
+            name = _Z_POWERS.get(gate.exponent)
+            if name is not None:
+                return f"{name} {qubits[0]};\n"
+        return _rotation("p", gate.exponent, qubits[0], args)
+    return _rotation("rz", gate.exponent, qubits[0], args)
+
+
+def _format_h(gate: ops.HPowGate, qubits: Sequence[str], args: cirq.QasmArgs) -> Optional[str]:
+    if gate.exponent == 0:
+        return f"id {qubits[0]};\n"
+    if gate.exponent == 1 and gate.global_shift == 0:
+        return f"h {qubits[0]};\n"
+    return None  # written by cirq as three rotations
+
+
+def _format_rotation(name: str) -> GateFormatter:
+    def format_rotation(gate: ops.EigenGate, qubits: Sequence[str], args: cirq.QasmArgs):
+        return _rotation(name, gate.exponent, qubits[0], args)
+
+    return format_rotation
+
+
+def _format_whole_power(name: str) -> GateFormatter:
+    def format_whole_power(gate: ops.EigenGate, qubits: Sequence[str], args: cirq.QasmArgs):
+        if gate.exponent != 1:
+            return None  # decomposed by cirq
+        return f"{name} {','.join(qubits)};\n"
+
+    return format_whole_power
+
+
+def _format_cswap(gate: ops.CSwapGate, qubits: Sequence[str], args: cirq.QasmArgs) -> str:
+    return f"cswap {','.join(qubits)};\n"
+
+
+def _format_identity(gate: ops.IdentityGate, qubits: Sequence[str], args: cirq.QasmArgs):
+    return f"id {qubits[0]};\n" if len(qubits) == 1 else None
+
+
+def _format_measurement(
+    gate: ops.MeasurementGate, qubits: Sequence[str], args: cirq.QasmArgs
+) -> Optional[str]:
+    if len(qubits) != 1 or any(gate.invert_mask) or gate.confusion_map:
+        return None
+    if cirq.qid_shape(gate) != (2,):
+        return None
+    return f"measure {qubits[0]} -> {args.meas_key_id_map[gate.key]}[0];\n"
+
+
+# Formatters of the operations of each type of gate. Formatters write the same QASM as
+# the gate itself would, and leave to cirq the operations it writes on several lines.
+_GATE_FORMATTERS: Dict[type, GateFormatter] = {
+    ops.XPowGate: _format_x,
+    ops.YPowGate: _format_y,
+    ops.ZPowGate: _format_z,
+    type(ops.X): _format_x,
+    type(ops.Y): _format_y,
+    type(ops.Z): _format_z,
+    ops.HPowGate: _format_h,
+    ops.Rx: _format_rotation("rx"),
+    ops.Ry: _format_rotation("ry"),
+    ops.Rz: _format_rotation("rz"),
+    ZPowGate: _format_phase,
+    ops.CXPowGate: _format_whole_power("cx"),
+    ops.CZPowGate: _format_whole_power("cz"),
+    ops.SwapPowGate: _format_whole_power("swap"),
+    ops.CCXPowGate: _format_whole_power("ccx"),
+    ops.CSwapGate: _format_cswap,
+    ops.IdentityGate: _format_identity,
+    ops.MeasurementGate: _format_measurement,
+}
+
+# Formatters when Z rotations are written as qbraid ZPowGates, as expected by qiskit
+# and pytket
+_PHASE_GATE_FORMATTERS: Dict[type, GateFormatter] = {
+    **_GATE_FORMATTERS,
+    ops.ZPowGate: _format_phase,
+    type(ops.Z): _format_phase,
+    ops.Rz: _format_phase,
+}
+
+
+def _map_zpow(op: ops.Operation) -> ops.Operation:
+    if isinstance(op.gate, ops.ZPowGate):
+        gate = ZPowGate(exponent=op.gate.exponent, global_shift=op.gate.global_shift)
+        return gate.on(op.qubits[0])
+    return op
+
+
+# Members of cirq.QasmOutput used by the emitter. All but _write_operations are public
+# attributes, though not documented.
+_QASM_OUTPUT_ATTRS = ("args", "operations", "measurements", "meas_comments", "_write_operations")
+
+
+class _QasmWriter:
+    """Writes QASM to a buffer, with the blank lines between sections requested by
+    ``cirq.QasmOutput``."""
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self._line_gap = 0
+
+    def write(self, text: str) -> None:
+        """Writes text, after the pending blank lines."""
+        if self._line_gap > 0:
+            self.buffer.write("\n" * self._line_gap)
+            self._line_gap = 0
+        self.buffer.write(text)
+
+    def line_gap(self, num_lines: int) -> None:
+        """Requests blank lines before the next text written."""
+        self._line_gap = max(self._line_gap, num_lines)
+
+
+def emit_qasm(
+    circuit: cirq.Circuit,
+    header: str = "",
+    precision: int = 10,
+    qubit_order: "cirq.QubitOrderOrList" = ops.QubitOrder.DEFAULT,
+    map_zpow: bool = False,
+) -> str:
+    """Returns the QASM 2 string of a Cirq circuit, as written by ``cirq.QasmOutput``.
+
+    The program is written to a buffer in a single pass over the operations. Operations
+    of common gates are formatted from a table, with angles formatted once per value,
+    and all others are written by ``cirq.QasmOutput``.
+
+    Args:
+        circuit: Cirq circuit to write as QASM.
+        header: A multi-line string that is placed in a comment at the top of the QASM.
+        precision: Number of digits after the decimal point of angles.
+        qubit_order: Determines how qubits are ordered in the QASM register.
+        map_zpow: If True, Z rotations are written as by
+            :class:`qbraid.transpiler.custom_gates.ZPowGate`, i.e. with ``p`` gates.
+
+    Returns:
+        QASM string equivalent to the input Cirq circuit.
+
+    Raises:
+        ValueError: If an operation cannot be written as QASM.
+
+    """
+    qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(circuit.all_qubits())
+    output = cirq.QasmOutput(
+        operations=circuit.all_operations(),
+        qubits=qubits,
+        header=header,
+        precision=precision,
+        version="2.0",
+    )
+    if not all(hasattr(output, attr) for attr in _QASM_OUTPUT_ATTRS):
+        if map_zpow:
+            output = cirq.QasmOutput(
+                operations=_map_zpow_and_unroll(circuit).all_operations(),
+                qubits=qubits,
+                header=header,
+                precision=precision,
+                version="2.0",
+            )
+        return str(output)
+
+    args = output.args
+    qubit_ids = args.qubit_id_map
+    formatters = _PHASE_GATE_FORMATTERS if map_zpow else _GATE_FORMATTERS
+    writer = _QasmWriter()
+    write = writer.write
+
+    if header:
+        for line in header.split("\n"):
+            write(f"// {line}".rstrip() + "\n")
+        write("\n")
+    write('OPENQASM 2.0;\ninclude "qelib1.inc";\n')
+    writer.line_gap(2)
+    write(f"// Qubits: [{', '.join(map(str, qubits))}]\n")
+    if qubits:
+        write(f"qreg q[{len(qubits)}];\n")
+    # the size of each classical register is that of the first measurement with its key
+    written_keys = set()
+    for meas in output.measurements:
+        key = cirq.measurement_key_name(meas)
+        if key in written_keys:
+            continue
+        written_keys.add(key)
+        meas_id = args.meas_key_id_map[key]
+        comment = output.meas_comments[key]
+        if comment is None:
+            write(f"creg {meas_id}[{len(meas.qubits)}];\n")
+        else:
+            write(f"creg {meas_id}[{len(meas.qubits)}];  // Measurement: {comment}\n")
+    writer.line_gap(2)
+
+    for op in output.operations:
+        text = None
+        if type(op) is ops.GateOperation:  # pylint: disable=unidiomatic-typecheck
+            formatter = formatters.get(type(op.gate))
+            if formatter is not None:
+                text = formatter(op.gate, [qubit_ids[qubit] for qubit in op.qubits], args)
+        if text is None:
+            if map_zpow:
+                op = _map_zpow(op)
+            text = cirq.qasm(op, args=args, default=None)
+            if text is None or text.count("\n") > 1:
+                # decomposed or multi-line operations are annotated by cirq
+                # pylint: disable-next=protected-access
+                output._write_operations([op], write, writer.line_gap)
+                continue
+        write(text)
+    return writer.buffer.getvalue()
@@ -0,0 +1,285 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module containing a fast-path parser for the flat subset of OpenQASM 2 emitted by
+qiskit and pytket, which falls back to the
+:class:`~qbraid.transpiler.cirq_qasm.qasm_parser.QasmParser` for anything else.
+
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from cirq import NamedQubit, ops
+
+from qbraid.transpiler.cirq_qasm.qasm_parser import CircuitBuilder, Qasm, QasmParser
+from qbraid.transpiler.profiling import profiled
+
+# Identifiers, as lexed by the QasmLexer. Identifiers starting with a keyword are lexed
+# as that keyword followed by an identifier, and are left to the QasmParser.
+_ID = r"[a-zA-Z][a-zA-Z\d_]*"
+_KEYWORD_PREFIX_RE = re.compile(r"pi|qreg|creg|measure|if")
+_ARG = rf"({_ID})\s*(?:\[\s*(\d+)\s*\])?"
+
+_COMMENT_RE = re.compile(r"//.*")
+_UNSUPPORTED_WHITESPACE_RE = re.compile(r"[^\S \t\n]")
+# the format spec and include are single tokens, which end with their semicolon
+_FORMAT_RE = re.compile(r"\s*OPENQASM\s+([^\s;]*)")
+_INCLUDE_RE = re.compile(r'\s*include\s+"qelib1\.inc"')
+_REG_RE = re.compile(rf"\s*(qreg|creg)\s+({_ID})\s*\[\s*(\d+)\s*\]\s*")
+_MEASURE_RE = re.compile(rf"\s*measure\s+{_ARG}\s*->\s*{_ARG}\s*")
+_GATE_RE = re.compile(rf"\s*({_ID})\s*(?:\((.*)\))?\s*((?:{_ARG}\s*,\s*)*{_ARG})\s*")
+_ARG_RE = re.compile(_ARG)
+
+# Tokens of parameter expressions, as lexed by the QasmLexer
+_EXPR_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:[0-9]+\.?|[0-9]?\.[0-9]+)[eE][+-]?[0-9]+|(?:[0-9]+)?\.[0-9]+|[0-9]+\.)"
+    r"|(?P<natural>\d+)"
+    rf"|(?P<id>{_ID})"
+    r"|(?P<op>[-+*/^(),]))"
+)
+
+# Precedence levels and associativity of binary operators, as in the QasmParser grammar.
+# Unary operators have the precedence of addition.
+_BINARY_LEVELS = {"+": 1, "-": 1, "*": 2, "/": 2, "^": 3}
+_RIGHT_ASSOCIATIVE = {"^"}
+_UNARY_LEVEL = 1
+
+
+class _FallBack(Exception):
+    """Raised when the program is outside of the subset handled by the fast path."""
+
+
+class _ExpressionParser:
+    """Evaluates a parameter expression by precedence climbing, in the same order of
+    operations as the LALR grammar of the QasmParser."""
+
+    def __init__(self, expression: str):
+        self._tokens: List[Tuple[str, Any]] = []
+        pos = 0
+        expression = expression.rstrip()
+        while pos < len(expression):
+            match = _EXPR_TOKEN_RE.match(expression, pos)
+            if match is None:
+                raise _FallBack
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "number":
+                self._tokens.append((kind, float(value)))
+            elif kind == "natural":
+                self._tokens.append((kind, int(value)))
+            elif value == "pi":
+                self._tokens.append(("number", np.pi))
+            elif kind == "id" and _KEYWORD_PREFIX_RE.match(value):
+                raise _FallBack
+            else:
+                self._tokens.append((kind, value))
+            pos = match.end()
+        self._pos = 0
+
+    def _peek(self) -> Tuple[str, Any]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else ("end", None)
+
+    def _next(self) -> Tuple[str, Any]:
+        token = self._peek()
+        self._pos += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        if self._next() != ("op", value):
+            raise _FallBack
+
+    def params(self) -> List[Any]:
+        """Returns the values of the comma-separated expressions."""
+        values = [self._expr(0)]
+        while self._peek() == ("op", ","):
+            self._pos += 1
+            values.append(self._expr(0))
+        if self._peek()[0] != "end":
+            raise _FallBack
+        return values
+
+    def _expr(self, min_level: int) -> Any:
+        kind, value = self._next()
+        if kind == "op" and value in ("-", "+"):
+            operand = self._expr(_UNARY_LEVEL + 1)
+            lhs = -operand if value == "-" else operand
+        elif kind in ("number", "natural"):
+            lhs = value
+        elif kind == "op" and value == "(":
+            lhs = self._expr(0)
+            self._expect(")")
+        elif kind == "id" and value in QasmParser.functions:
+            self._expect("(")
+            lhs = QasmParser.functions[value](self._expr(0))
+            self._expect(")")
+        else:
+            raise _FallBack
+
+        while True:
+            kind, value = self._peek()
+            level = _BINARY_LEVELS.get(value) if kind == "op" else None
+            if level is None or level < min_level:
+                return lhs
+            self._pos += 1
+            rhs = self._expr(level if value in _RIGHT_ASSOCIATIVE else level + 1)
+            lhs = QasmParser.binary_operators[value](lhs, rhs)
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_params(params: str) -> Tuple[Any, ...]:
+    """Returns the values of comma-separated parameter expressions, folded to constants.
+    Values are memoized by expression text, as programs often repeat the same angles."""
+    return tuple(_ExpressionParser(params).params())
+
+
+class _FastParse:
+    """State of a single fast-path parse."""
+
+    def __init__(self):
+        self.qregs: Dict[str, int] = {}
+        self.cregs: Dict[str, int] = {}
+        self.qubits: Dict[Tuple[str, int], ops.Qid] = {}
+        self.qelibinc = False
+        self.circuit_builder = CircuitBuilder()
+
+    @staticmethod
+    def _check_id(name: str) -> None:
+        if _KEYWORD_PREFIX_RE.match(name):
+            raise _FallBack
+
+    def _qubit(self, reg: str, idx: int) -> ops.Qid:
+        qubit = self.qubits.get((reg, idx))
+        if qubit is None:
+            qubit = self.qubits[(reg, idx)] = NamedQubit(f"{reg}_{idx}")
+        return qubit
+
+    def _qarg(self, reg: str, idx: Optional[str]) -> List[ops.Qid]:
+        self._check_id(reg)
+        size = self.qregs.get(reg)
+        if size is None:
+            raise _FallBack
+        if idx is None:
+            return [self._qubit(reg, i) for i in range(size)]
+        index = int(idx)
+        if index >= size:
+            raise _FallBack
+        return [self._qubit(reg, index)]
+
+    def _carg(self, reg: str, idx: Optional[str]) -> List[str]:
+        self._check_id(reg)
+        size = self.cregs.get(reg)
+        if size is None:
+            raise _FallBack
+        if idx is None:
+            return [f"{reg}_{i}" for i in range(size)]
+        index = int(idx)
+        if index >= size:
+            raise _FallBack
+        return [f"{reg}_{index}"]
+
+    def statement(self, statement: str) -> None:
+        """Adds the registers or operations of a statement, other than the format spec."""
+        match = _GATE_RE.fullmatch(statement)
+        if match is not None and match.group(1) not in ("qreg", "creg", "measure"):
+            self._gate(match.group(1), match.group(2), match.group(3))
+            return
+        match = _REG_RE.fullmatch(statement)
+        if match is not None:
+            kind, name, length = match.groups()
+            self._check_id(name)
+            if name in self.qregs or name in self.cregs or int(length) == 0:
+                raise _FallBack
+            (self.qregs if kind == "qreg" else self.cregs)[name] = int(length)
+            return
+        match = _MEASURE_RE.fullmatch(statement)
+        if match is not None:
+            qreg, qidx, creg, cidx = match.groups()
+            qubits = self._qarg(qreg, qidx)
+            keys = self._carg(creg, cidx)
+            if len(qubits) != len(keys):
+                raise _FallBack
+            self.circuit_builder.extend(
+                ops.MeasurementGate(num_qubits=1, key=key).on(qubit)
+                for qubit, key in zip(qubits, keys)
+            )
+            return
+        if _INCLUDE_RE.fullmatch(statement):
+            self.qelibinc = True
+            return
+        raise _FallBack
+
+    def _gate(self, name: str, params_str: Optional[str], args_str: str) -> None:
+        self._check_id(name)
+        gate_set = QasmParser.all_gates if self.qelibinc else QasmParser.basic_gates
+        statement = gate_set.get(name)
+        if statement is None:
+            raise _FallBack
+        params: Sequence[Any] = _evaluate_params(params_str) if params_str is not None else ()
+        args = [self._qarg(reg, idx or None) for reg, idx in _ARG_RE.findall(args_str)]
+
+        if all(len(arg) == 1 for arg in args):
+            if len(args) != statement.num_args or len(params) != statement.num_params:
+                raise _FallBack
+            qubits = [arg[0] for arg in args]
+            if len(set(qubits)) < len(qubits):
+                raise _FallBack
+            self.circuit_builder.append(statement.gate(params).on(*qubits))
+        else:
+            # registers are broadcast by the gate statement, as in the QasmParser
+            self.circuit_builder.extend(statement.on(params=list(params), args=args, lineno=0))
+
+
+def _fast_parse(qasm: str) -> Qasm:
+    if _UNSUPPORTED_WHITESPACE_RE.search(qasm):
+        raise _FallBack
+    statements = _COMMENT_RE.sub("", qasm).split(";")
+    if statements[-1].strip():
+        raise _FallBack
+    format_match = _FORMAT_RE.fullmatch(statements[0])
+    if format_match is None or format_match.group(1) != "2.0":
+        raise _FallBack
+
+    parse = _FastParse()
+    for statement in statements[1:-1]:
+        parse.statement(statement)
+    circuit = parse.circuit_builder.circuit()
+    return Qasm(True, parse.qelibinc, parse.qregs, parse.cregs, circuit)
+
+
+@profiled("fast_parse_qasm")
+def fast_parse_qasm(qasm: str) -> Optional[Qasm]:
+    """Parses the flat subset of OpenQASM 2 emitted by qiskit and pytket: register
+    declarations, qelib1 gates with numeric or ``pi`` parameter expressions, and
+    measurements.
+
+    Statements are matched by regular expressions, and the circuit is built from all of
+    its operations at once, which is several times faster than the LALR parser of the
+    :class:`~qbraid.transpiler.cirq_qasm.qasm_parser.QasmParser`. The result is the
+    same as that of :meth:`QasmParser.parse <qbraid.transpiler.cirq_qasm.QasmParser.parse>`.
+
+    Args:
+        qasm: QASM string to parse.
+
+    Returns:
+        Parsed QASM program, or None if the program is outside of the supported subset or
+        is invalid, in which case it should be parsed by the QasmParser.
+
+    """
+    try:
+        return _fast_parse(qasm)
+    except _FallBack:
+        return None
+    except Exception:  # pylint: disable=broad-exception-caught
+        # e.g. a gate statement rejecting its arguments: the QasmParser reports the error
+        return None
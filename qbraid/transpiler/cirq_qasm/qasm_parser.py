@@ -23,20 +23,25 @@
 Module defining qBraid Cirq QASM parser.
 
 """
+import copy
 import functools
+import inspect
 import operator
-from typing import Any, Callable, cast, Dict, Iterable, List, Optional, Union, TYPE_CHECKING
+import threading
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, cast, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 # import sympy
 from ply import yacc
 
-from cirq import ops, Circuit, NamedQubit, CX
+from cirq import ops, protocols, Circuit, Moment, NamedQubit, CX
 from cirq.circuits.qasm_output import QasmUGate
 from cirq.contrib.qasm_import._lexer import QasmLexer
 from cirq.contrib.qasm_import.exception import QasmException
 
 import qbraid.transpiler.custom_gates as qbraid_cirq_gates
+from qbraid.transpiler.profiling import profiled
 
 # Redefined lexer tokens (4/7/21) to surpress warning:
 # Token ['IF', 'NE'] defined, but not used
@@ -56,6 +61,47 @@ QasmLexer.tokens = [
 if TYPE_CHECKING:
     import cirq
 
+# LR parsers generated from the grammar of each parser class, by class
+_lr_parsers: Dict[type, yacc.LRParser] = {}
+_lr_parsers_lock = threading.Lock()
+
+
+def _lr_parser(parser_module: Any) -> yacc.LRParser:
+    """Returns an LR parser whose grammar actions are the methods of ``parser_module``.
+
+    The LALR tables of the grammar are generated once per class, the first time a parser
+    of that class is created, and shared by every later instance. Only the productions,
+    which hold the callables of the grammar actions, are bound to ``parser_module``.
+    """
+    cls = type(parser_module)
+    with _lr_parsers_lock:
+        template = _lr_parsers.get(cls)
+        if template is None:
+            # the grammar is read from the class attributes only, leaving out properties
+            # such as those of the parse context, which are not set between parses
+            grammar = {
+                name: getattr(parser_module, name)
+                for name in dir(cls)
+                if not name.startswith('__')
+                and not isinstance(inspect.getattr_static(cls, name), property)
+            }
+            grammar_module = SimpleNamespace(__module__=cls.__module__, **grammar)
+            template = yacc.yacc(module=grammar_module, debug=False, write_tables=False)
+            # unbind the grammar actions, so that the template keeps no parser alive
+            for production in template.productions:
+                production.callable = None
+            template.errorfunc = None
+            _lr_parsers[cls] = template
+
+    parser = copy.copy(template)
+    parser.productions = []
+    for production in template.productions:
+        bound = copy.copy(production)
+        bound.callable = getattr(parser_module, production.func) if production.func else None
+        parser.productions.append(bound)
+    parser.errorfunc = parser_module.p_error
+    return parser
+
 
 class Qasm:
     """Qasm stores the final result of the Qasm parsing."""
@@ -99,6 +145,8 @@ class QasmGateStatement:
         self.qasm_gate = qasm_gate
         self.cirq_gate = cirq_gate
         self.num_params = num_params
+        # gates are immutable, so the operations with the same parameters share their gate
+        self._cached_gate = functools.lru_cache(maxsize=1024, typed=True)(self._new_gate)
 
         # at least one quantum argument is mandatory for gates to act on
         assert num_args >= 1
@@ -119,6 +167,19 @@ class QasmGateStatement:
                 )
             )
 
+    def _new_gate(self, *params: float) -> ops.Gate:
+        return self.cirq_gate(params)
+
+    def gate(self, params: Sequence[float]) -> ops.Gate:
+        """Returns the cirq gate of a call with the given (validated) parameters. The gate
+        is memoized on the values and types of the parameters."""
+        if isinstance(self.cirq_gate, ops.Gate):
+            return self.cirq_gate
+        try:
+            return self._cached_gate(*params)
+        except TypeError:  # unhashable parameters
+            return self.cirq_gate(params)
+
     def on(
         self, params: List[float], args: List[List[ops.Qid]], lineno: int
     ) -> Iterable[ops.Operation]:
@@ -133,9 +194,7 @@ class QasmGateStatement:
 
         # the actual gate we'll apply the arguments to might be a parameterized
         # or non-parameterized gate
-        final_gate: ops.Gate = (
-            self.cirq_gate if isinstance(self.cirq_gate, ops.Gate) else self.cirq_gate(params)
-        )
+        final_gate: ops.Gate = self.gate(params)
         # OpenQASM gates can be applied on single qubits and qubit registers.
         # We represent single qubits as registers of size 1.
         # Based on the OpenQASM spec (https://arxiv.org/abs/1707.03429),
@@ -157,44 +216,172 @@ class QasmGateStatement:
                 yield final_gate.on(*qubits)
 
 
+# magic methods from which cirq protocols get the measurement and control keys of a gate
+_KEY_METHODS = (
+    "_measurement_key_objs_",
+    "_measurement_key_obj_",
+    "_measurement_key_names_",
+    "_measurement_key_name_",
+    "_control_keys_",
+)
+_NO_KEYS: Tuple[FrozenSet, FrozenSet] = (frozenset(), frozenset())
+
+
+class CircuitBuilder:
+    """Builds a circuit from operations, placing them as cirq's EARLIEST insertion
+    strategy does, i.e. with the same moments as appending them to a circuit one by one.
+
+    Each operation is placed in the moment after the latest one holding any of its
+    qubits or conflicting measurement or control keys, which is kept for each qubit and
+    key, so building takes time linear in the number of operations. Moments are only
+    created by :meth:`circuit`.
+    """
+
+    def __init__(self):
+        self._moments: List[List[ops.Operation]] = []
+        self._qubit_moments: Dict[ops.Qid, int] = {}
+        self._mkey_moments: Dict[Any, int] = {}
+        self._ckey_moments: Dict[Any, int] = {}
+        # whether the operations of each type of gate may have measurement or control keys
+        self._gate_type_has_keys: Dict[type, bool] = {}
+
+    def _keys(self, op: ops.Operation) -> Tuple[FrozenSet, FrozenSet]:
+        gate = op.gate
+        if isinstance(gate, ops.MeasurementGate):
+            return frozenset((gate.mkey,)), frozenset()
+        if type(op) is ops.GateOperation:
+            gate_type = type(gate)
+            has_keys = self._gate_type_has_keys.get(gate_type)
+            if has_keys is None:
+                has_keys = self._gate_type_has_keys[gate_type] = any(
+                    hasattr(gate_type, name) for name in _KEY_METHODS
+                )
+            if not has_keys:
+                return _NO_KEYS
+        return protocols.measurement_key_objs(op), protocols.control_keys(op)
+
+    def append(self, op: ops.Operation) -> None:
+        """Places an operation after the operations appended before it."""
+        mkeys, ckeys = self._keys(op)
+        qubit_moments = self._qubit_moments
+        index = -1
+        for qubit in op.qubits:
+            index = max(index, qubit_moments.get(qubit, -1))
+        for key in mkeys:
+            index = max(index, self._mkey_moments.get(key, -1), self._ckey_moments.get(key, -1))
+        for key in ckeys:
+            index = max(index, self._mkey_moments.get(key, -1))
+        index += 1
+
+        if index == len(self._moments):
+            self._moments.append([op])
+        else:
+            self._moments[index].append(op)
+        for qubit in op.qubits:
+            qubit_moments[qubit] = index
+        for key in mkeys:
+            self._mkey_moments[key] = index
+        for key in ckeys:
+            # operations controlled by the same key may be placed out of order
+            self._ckey_moments[key] = max(index, self._ckey_moments.get(key, -1))
+
+    def extend(self, operations: Iterable[ops.Operation]) -> None:
+        """Places operations in order, after the operations appended before them."""
+        for op in operations:
+            self.append(op)
+
+    def circuit(self) -> Circuit:
+        """Returns the circuit of the operations appended so far."""
+        return Circuit(*(Moment.from_ops(*operations) for operations in self._moments))
+
+
+class QasmParseContext:
+    """Holds the state of a single parse of a QASM string."""
+
+    def __init__(self, qasm: str):
+        self.qasm = qasm
+        self.circuit_builder = CircuitBuilder()
+        self.qregs: Dict[str, int] = {}
+        self.cregs: Dict[str, int] = {}
+        self.qubits: Dict[str, ops.Qid] = {}
+        self.qelibinc = False
+        self.supported_format = False
+        # parameter lists of gate calls, keyed by their source text
+        self.params: Dict[str, List[Any]] = {}
+
+
+def _context_attribute(name: str) -> property:
+    """Returns a property delegating to attribute ``name`` of the current parse context."""
+
+    def getter(parser: "QasmParser") -> Any:
+        return getattr(parser._context, name)
+
+    def setter(parser: "QasmParser", value: Any) -> None:
+        setattr(parser._context, name, value)
+
+    return property(getter, setter, doc=f"The {name} of the parse in progress.")
+
+
 class QasmParser:
     """Parser for QASM strings.
     Example:
         qasm = "OPENQASM 2.0; qreg q1[2]; CX q1[0], q1[1];"
         parsedQasm = QasmParser().parse(qasm)
+
+    A parser can be reused, and shared by threads: the state of each call to
+    :meth:`parse` is held by its own :class:`QasmParseContext`, and each thread parses
+    with its own lexer and LR parser. A grammar action may itself call :meth:`parse`.
     """
 
     def __init__(self):
-        self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
-        self.circuit = Circuit()
-        self.qregs: Dict[str, int] = {}
-        self.cregs: Dict[str, int] = {}
-        self.qelibinc = False
-        self.lexer = QasmLexer()
-        self.supported_format = False
-        self.parsedQasm: Optional[Qasm] = None
-        self.qubits: Dict[str, ops.Qid] = {}
-        self.functions = {
-            'sin': np.sin,
-            'cos': np.cos,
-            'tan': np.tan,
-            'exp': np.exp,
-            'ln': np.log,
-            'sqrt': np.sqrt,
-            'acos': np.arccos,
-            'atan': np.arctan,
-            'asin': np.arcsin,
-        }
-
-        self.binary_operators = {
-            '+': operator.add,
-            '-': operator.sub,
-            '*': operator.mul,
-            '/': operator.truediv,
-            '^': operator.pow,
-        }
-
-    basic_gates: Dict[str, QasmGateStatement] = {
+        self._local = threading.local()
+
+    @property
+    def _contexts(self) -> List[QasmParseContext]:
+        """The contexts of the parses in progress in the current thread, innermost last."""
+        try:
+            return self._local.contexts
+        except AttributeError:
+            self._local.contexts = []
+            return self._local.contexts
+
+    @property
+    def _context(self) -> QasmParseContext:
+        contexts = self._contexts
+        if not contexts:
+            raise RuntimeError("No QASM parse in progress in the current thread.")
+        return contexts[-1]
+
+    qasm = _context_attribute("qasm")
+    circuit_builder = _context_attribute("circuit_builder")
+    qregs = _context_attribute("qregs")
+    cregs = _context_attribute("cregs")
+    qubits = _context_attribute("qubits")
+    qelibinc = _context_attribute("qelibinc")
+    supported_format = _context_attribute("supported_format")
+    params = _context_attribute("params")
+
+    functions: Mapping[str, Callable[[float], float]] = MappingProxyType({
+        'sin': np.sin,
+        'cos': np.cos,
+        'tan': np.tan,
+        'exp': np.exp,
+        'ln': np.log,
+        'sqrt': np.sqrt,
+        'acos': np.arccos,
+        'atan': np.arctan,
+        'asin': np.arcsin,
+    })
+
+    binary_operators: Mapping[str, Callable[[Any, Any], Any]] = MappingProxyType({
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '^': operator.pow,
+    })
+
+    basic_gates: Mapping[str, QasmGateStatement] = MappingProxyType({
         'CX': QasmGateStatement(qasm_gate='CX', cirq_gate=CX, num_params=0, num_args=2),
         'U': QasmGateStatement(
             qasm_gate='U',
@@ -203,9 +390,9 @@ class QasmParser:
             # QasmUGate expects half turns
             cirq_gate=(lambda params: QasmUGate(*[p / np.pi for p in params])),
         ),
-    }
+    })
 
-    qelib_gates = {
+    qelib_gates: Mapping[str, QasmGateStatement] = MappingProxyType({
         'rx': QasmGateStatement(
             qasm_gate='rx', cirq_gate=(lambda params: ops.rx(params[0])), num_params=1, num_args=1
         ),
@@ -344,9 +531,9 @@ class QasmParser:
             num_params=1,
             num_args=2,
         ),
-    }
+    })
 
-    all_gates = {**basic_gates, **qelib_gates}
+    all_gates: Mapping[str, QasmGateStatement] = MappingProxyType({**basic_gates, **qelib_gates})
 
     tokens = QasmLexer.tokens
     start = 'start'
@@ -355,12 +542,13 @@ class QasmParser:
 
     def p_start(self, p):
         """start : qasm"""
-        p[0] = p[1]
+        # the circuit is built once all of its operations have been parsed
+        circuit = self.circuit_builder.circuit()
+        p[0] = Qasm(self.supported_format, self.qelibinc, self.qregs, self.cregs, circuit)
 
     def p_qasm_format_only(self, p):
         """qasm : format"""
         self.supported_format = True
-        p[0] = Qasm(self.supported_format, self.qelibinc, self.qregs, self.cregs, self.circuit)
 
     def p_qasm_no_format_specified_error(self, p):
         """qasm : QELIBINC
@@ -371,11 +559,9 @@ class QasmParser:
     def p_qasm_include(self, p):
         """qasm : qasm QELIBINC"""
         self.qelibinc = True
-        p[0] = Qasm(self.supported_format, self.qelibinc, self.qregs, self.cregs, self.circuit)
 
     def p_qasm_circuit(self, p):
         """qasm : qasm circuit"""
-        p[0] = Qasm(self.supported_format, self.qelibinc, self.qregs, self.cregs, p[2])
 
     def p_format(self, p):
         """format : FORMAT_SPEC"""
@@ -393,17 +579,17 @@ class QasmParser:
 
     def p_circuit_reg(self, p):
         """circuit : new_reg circuit"""
-        p[0] = self.circuit
+        p[0] = self.circuit_builder
 
     def p_circuit_gate_or_measurement(self, p):
         """circuit :  circuit gate_op
         |  circuit measurement"""
-        self.circuit.append(p[2])
-        p[0] = self.circuit
+        self.circuit_builder.extend(p[2])
+        p[0] = self.circuit_builder
 
     def p_circuit_empty(self, p):
         """circuit : empty"""
-        p[0] = self.circuit
+        p[0] = self.circuit_builder
 
     # qreg and creg
 
@@ -431,7 +617,11 @@ class QasmParser:
 
     def p_gate_op_with_params(self, p):
         """gate_op :  ID '(' params ')' qargs"""
-        self._resolve_gate_operation(args=p[5], gate=p[1], p=p, params=p[3])
+        # calls with the same parameter text share one list of values, and so hit the
+        # gate cache of the QasmGateStatement on the same parameters
+        text = p.lexer.lexdata[p.lexpos(2) + 1 : p.lexpos(4)]
+        params = self.params.setdefault(text, p[3])
+        self._resolve_gate_operation(args=p[5], gate=p[1], p=p, params=params)
 
     def _resolve_gate_operation(
         self, args: List[List[ops.Qid]], gate: str, p: Any, params: List[float]
@@ -628,12 +818,39 @@ at line {p.lineno}, column {self.find_column(p)}"""
     def p_empty(self, p):
         """empty :"""
 
+    @profiled("QasmParser.parse", arg=1)
     def parse(self, qasm: str) -> Qasm:
-        if self.parsedQasm is None:
-            self.qasm = qasm
-            self.lexer.input(self.qasm)
-            self.parsedQasm = self.parser.parse(lexer=self.lexer)
-        return self.parsedQasm
+        contexts = self._contexts
+        if contexts:
+            # re-entrant call: the lexer and parser of this thread are in use
+            lexer, parser = QasmLexer(), _lr_parser(self)
+        else:
+            lexer, parser = self._thread_lexer_and_parser()
+        contexts.append(QasmParseContext(qasm))
+        try:
+            lexer.input(qasm)
+            return parser.parse(lexer=lexer)
+        finally:
+            contexts.pop()
+
+    def _thread_lexer_and_parser(self):
+        """Returns the lexer and LR parser of the current thread, creating them if needed."""
+        try:
+            return self._local.lexer, self._local.parser
+        except AttributeError:
+            self._local.lexer = QasmLexer()
+            self._local.parser = _lr_parser(self)
+            return self._local.lexer, self._local.parser
+
+    @property
+    def lexer(self) -> QasmLexer:
+        """The lexer of the current thread."""
+        return self._thread_lexer_and_parser()[0]
+
+    @property
+    def parser(self) -> yacc.LRParser:
+        """The LR parser of the current thread."""
+        return self._thread_lexer_and_parser()[1]
 
     def debug_context(self, p):
         debug_start = max(self.qasm.rfind('\n', 0, p.lexpos) + 1, p.lexpos - 5)
@@ -13,106 +13,284 @@ Module for preprocessing qasm string to before it is passed to parser.
 
 """
 import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
-from qbraid.transpiler.cirq_qasm.qelib1_defs import replace_qelib1_defs
+from qbraid.transpiler.cirq_qasm.qelib1_defs import decompose_qelib1_gate
+from qbraid.transpiler.exceptions import QasmError
+from qbraid.transpiler.profiling import profiled
 
+_SPECIAL_CHAR_RE = re.compile(r'[;{}"/]')
+_COMMENT_RE = re.compile(r"//[^\n]*")
+_BARRIER_RE = re.compile(r"\s*barrier(?:\s|;)")
 
-def _remove_barriers(qasm_str: str) -> str:
-    """Returns a copy of the input QASM with all barriers removed.
+_SEGMENT_KINDS = {";": "statement", "{": "block_start", "}": "block_end"}
+
+
+class QasmSegment(NamedTuple):
+    """Segment of a QASM program, as split by :func:`_scan_qasm`.
 
     Args:
-        qasm_str: QASM to remove barriers from.
+        kind: ``"statement"`` for text ending in a semicolon, ``"block_start"`` for text
+            ending in an opening brace (e.g. a gate definition header), ``"block_end"`` for
+            a closing brace, ``"comment"`` for a comment outside of any statement, and
+            ``"text"`` for whitespace or an unterminated statement at the end of the program.
+        text: Source text of the segment, including the whitespace preceding it.
+
     """
-    quoted_re = r"(?:\"[^\"]*?\")"
-    # Statements separated by semicolons
-    statement_re = r"((?:[^;{}\"]*?" + quoted_re + r"?)*[;{}])?"
-    # Comments begin with a pair of forward slashes and end with a new line
-    comment_re = r"(\n?//[^\n]*(?:\n|$))?"
-    statements_comments = re.findall(statement_re + comment_re, qasm_str)
-    lines = []
-    # Language is case sensitive. Whitespace is ignored
-    for statement, comment in statements_comments:
-        if re.match(r"^\s*barrier(?:(?:\s+)|(?:;))", statement) is None:
-            lines.append(statement + comment)
-    return "".join(lines)
-
-
-def _format_qasm_string(qasm_string, skip_pattern):
-    lines = qasm_string.split("\n")
-    formatted_lines = []
-
-    for line in lines:
-        line = line.strip()  # Strip leading and trailing whitespace
-        if skip_pattern.match(line) or line.startswith("//"):
-            # If the line matches the gate definition pattern, add it as is
-            formatted_lines.append(line)
-        else:
-            # Otherwise, split it at semicolons and add each part as a separate line
-            parts = re.split(";[ ]*", line)
-            parts = [part + ";" for part in parts if part]  # Remove empty parts
-            formatted_lines.extend(parts)
 
-    return "\n".join(formatted_lines)
+    kind: str
+    text: str
 
 
-def _convert_gate_defs(qasm_string):
-    # Define regular expression patterns
-    gate_definition_pattern = re.compile(
-        r"gate ([a-zA-Z0-9_]+)(\((.*?)\))? ((q[0-9]+,)*q[0-9]+) {(.*?)}"
-    )
+def _scan_qasm(qasm_str: str) -> Iterator[QasmSegment]:
+    """Split QASM into statements, comments and blocks in a single linear pass.
 
-    gate_usage_match = None
+    The texts of the segments concatenate to ``qasm_str``. Semicolons and braces in quoted
+    strings and comments do not end a statement. A comment within a statement, e.g.
+    between its lines, is part of the text of the statement.
 
-    # Find gate definition and extract its components
-    gate_definition_match = gate_definition_pattern.search(qasm_string)
-    if gate_definition_match:
-        gate_name, _, params, qubits, _, gate_body = gate_definition_match.groups()
-        params_list = [param.strip() for param in params.split(",")] if params is not None else []
-
-        qubits = [qubit.strip() for qubit in qubits.split(",")]
+    Args:
+        qasm_str: QASM to split.
 
-        # pylint: disable=consider-using-f-string
-        gate_usage_pattern = re.compile(
-            r"({})(\((.*?)\))? ((q\[([0-9]+)\],)*(q\[([0-9]+)\]));".format(gate_name)
-        )
+    Returns:
+        Iterator over the segments of the program, in order.
 
-        # Replace parameters with their values in gate body
-        gate_usage_match = gate_usage_pattern.search(qasm_string)
+    """
+    start = pos = 0
+    end_of_program = len(qasm_str)
+    while True:
+        match = _SPECIAL_CHAR_RE.search(qasm_str, pos)
+        if match is None:
+            break
+        pos = match.start()
+        char = qasm_str[pos]
+        if char == '"':
+            end = qasm_str.find('"', pos + 1)
+            pos = end_of_program if end == -1 else end + 1
+        elif char == "/":
+            if not qasm_str.startswith("//", pos):
+                pos += 1
+                continue
+            end = qasm_str.find("\n", pos)
+            end = end_of_program if end == -1 else end
+            if qasm_str[start:pos].isspace() or start == pos:
+                yield QasmSegment("comment", qasm_str[start:end])
+                start = end
+            pos = end
+        else:
+            pos += 1
+            yield QasmSegment(_SEGMENT_KINDS[char], qasm_str[start:pos])
+            start = pos
+    if start < end_of_program:
+        yield QasmSegment("text", qasm_str[start:])
 
-    while gate_usage_match:
-        groups = gate_usage_match.groups()
-        param_values, qubits_usage = groups[2], groups[3]
-        param_values_list = (
-            [value.strip() for value in param_values.split(",")] if param_values is not None else []
-        )
-        expanded_gate_body = gate_body
-        qubits_usage = [qubit.strip() for qubit in re.findall(r"q\[\d+\]", qubits_usage)]
 
-        for param, value in zip(params_list, param_values_list):
-            expanded_gate_body = expanded_gate_body.replace(param, value)
+def _is_barrier(segment: QasmSegment) -> bool:
+    return segment.kind == "statement" and _BARRIER_RE.match(segment.text) is not None
 
-        for qubit, qubit_usage in zip(qubits, qubits_usage):
-            expanded_gate_body = expanded_gate_body.replace(qubit, qubit_usage)
 
-        # Replace gate usage with the expanded gate body in the input string
-        qasm_string = qasm_string.replace(gate_usage_match.group(0), expanded_gate_body + ";")
+def _statement_text(segment: QasmSegment) -> str:
+    """Returns the text of a statement or block header, without its delimiter, comments
+    and surrounding whitespace."""
+    text = segment.text[:-1] if segment.kind != "text" else segment.text
+    if "//" in text:
+        text = _COMMENT_RE.sub("", text)
+    return text.strip()
 
-        # Search for the next gate usage
-        gate_usage_match = gate_usage_pattern.search(qasm_string)
 
-    # Remove double semicolons
-    qasm_string = _format_qasm_string(qasm_string, gate_definition_pattern)
+def _remove_barriers(qasm_str: str) -> str:
+    """Returns a copy of the input QASM with all barriers removed.
 
-    return qasm_string
+    Args:
+        qasm_str: QASM to remove barriers from.
+    """
+    return "".join(segment.text for segment in _scan_qasm(qasm_str) if not _is_barrier(segment))
+
+
+_IDENTIFIER_RE = re.compile(r"(?<![\w.])[A-Za-z_]\w*")
+_ATOM_RE = re.compile(r"\s*(?:[A-Za-z_]\w*|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*")
+_GATE_HEADER_RE = re.compile(r"gate\s+([A-Za-z_]\w*)\s*(?:\((.*?)\))?\s*(.*)", re.S)
+_GATE_CALL_RE = re.compile(r"([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)", re.S)
+
+# A gate application: gate name, parameter expressions, and qubit arguments
+GateCall = Tuple[str, List[str], List[str]]
+
+
+class _GateDefinition(NamedTuple):
+    """Custom gate definition: formal parameters, formal qubits, and body."""
+
+    params: List[str]
+    qubits: List[str]
+    body: List[GateCall]
+
+
+def _split_args(args: Optional[str]) -> List[str]:
+    """Split a comma-separated argument list, ignoring commas nested in parentheses."""
+    if args is None or not args.strip():
+        return []
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(args):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(args[start:i].strip())
+            start = i + 1
+    parts.append(args[start:].strip())
+    return parts
+
+
+def _parse_gate_call(statement: str) -> Optional[GateCall]:
+    """Returns the gate name, parameters and qubit arguments of a gate application, or
+    None if the statement is not one."""
+    match = _GATE_CALL_RE.fullmatch(statement)
+    if match is None:
+        return None
+    name, params, qargs = match.groups()
+    return name, _split_args(params), _split_args(qargs)
+
+
+def _operand(value: str) -> str:
+    """Returns ``value`` parenthesized unless it is a number or identifier, so that it
+    keeps its precedence when substituted into an expression."""
+    return value.strip() if _ATOM_RE.fullmatch(value) else f"({value.strip()})"
+
+
+def _substitute(expr: str, values: Dict[str, str]) -> str:
+    """Substitute whole identifiers of ``expr`` by their values in a single pass."""
+    if expr in values:
+        return values[expr]
+    return _IDENTIFIER_RE.sub(
+        lambda match: _operand(values[match.group()]) if match.group() in values else match.group(),
+        expr,
+    )
 
 
-def _find_gate_line(lines):
-    for i, line in enumerate(lines):
-        if line.strip().startswith("gate"):
-            return i
-    return None
+class _GateInliner:
+    """Expands applications of custom gates into applications of gates that are not
+    custom defined. The body of each definition is inlined into a template, in terms of
+    its formal parameters and qubits, once."""
+
+    def __init__(self, definitions: Dict[str, _GateDefinition]):
+        self._definitions = definitions
+        self._templates: Dict[str, List[GateCall]] = {}
+        self._expanding: Set[str] = set()
+
+    def template(self, name: str) -> List[GateCall]:
+        """Returns the body of gate ``name`` with all custom gates in it expanded."""
+        if name in self._templates:
+            return self._templates[name]
+        if name in self._expanding:
+            raise QasmError(f"Gate '{name}' is defined in terms of itself.")
+        self._expanding.add(name)
+        template = []
+        for call in self._definitions[name].body:
+            template.extend(self.expand(call) if call[0] in self._definitions else [call])
+        self._expanding.discard(name)
+        self._templates[name] = template
+        return template
+
+    def expand(self, call: GateCall) -> List[GateCall]:
+        """Returns the applications of non-custom gates that make up ``call``."""
+        name, params, qargs = call
+        definition = self._definitions[name]
+        if len(params) != len(definition.params) or len(qargs) != len(definition.qubits):
+            raise QasmError(
+                f"Gate '{name}' takes {len(definition.params)} parameter(s) and "
+                f"{len(definition.qubits)} qubit(s), got {len(params)} and {len(qargs)}."
+            )
+        param_values = dict(zip(definition.params, params))
+        qubit_values = dict(zip(definition.qubits, qargs))
+        return [
+            (
+                gate,
+                [_substitute(param, param_values) for param in gate_params],
+                [qubit_values.get(qubit, qubit) for qubit in gate_qargs],
+            )
+            for gate, gate_params, gate_qargs in self.template(name)
+        ]
+
+
+def _format_gate_call(call: GateCall) -> str:
+    name, params, qargs = call
+    params_str = f"({','.join(params)})" if params else ""
+    return f"{name}{params_str} {','.join(qargs)};"
+
+
+def _parse_gate_definition(header: str, body: List[str]) -> Tuple[str, _GateDefinition]:
+    match = _GATE_HEADER_RE.fullmatch(header)
+    if match is None:
+        raise QasmError(f"Invalid gate definition '{header}'.")
+    name, params, qubits = match.groups()
+    calls = []
+    for statement in body:
+        call = _parse_gate_call(statement)
+        if call is None:
+            raise QasmError(f"Invalid statement '{statement}' in definition of gate '{name}'.")
+        calls.append(call)
+    return name, _GateDefinition(_split_args(params), _split_args(qubits), calls)
+
+
+def _is_custom_gate(call: GateCall, definitions: Dict[str, _GateDefinition]) -> bool:
+    name, _, _ = call
+    return name in definitions
+
+
+def _emit_gate_call(call: GateCall, lines: List[str]) -> None:
+    if not decompose_qelib1_gate(*call, lines):
+        lines.append(_format_gate_call(call))
+
+
+def _expand_gates(segments: Iterable[QasmSegment]) -> str:
+    """Returns QASM with the definitions of custom gates removed, their applications
+    replaced by the gates they are defined in terms of, and edge-case qelib1 gates
+    decomposed, output with one statement per line.
 
+    Args:
+        segments: Segments of the input QASM, as split by :func:`_scan_qasm`.
 
+    """
+    definitions: Dict[str, _GateDefinition] = {}
+    inliner = _GateInliner(definitions)
+    lines: List[str] = []
+    header = None
+    body: List[str] = []
+    for segment in segments:
+        if segment.kind == "comment":
+            lines.append(segment.text.strip())
+        elif segment.kind == "block_start":
+            header = _statement_text(segment)
+        elif segment.kind == "block_end":
+            name, definition = _parse_gate_definition(header or "", body)
+            definitions[name] = definition
+            header = None
+            body = []
+        else:
+            text = _statement_text(segment)
+            if not text:
+                continue
+            if segment.kind == "text":
+                raise QasmError(f"Incomplete OpenQASM statement at end of program: {text}")
+            if header is not None:
+                body.append(text)
+                continue
+            call = _parse_gate_call(text)
+            if call is None:
+                lines.append(text + ";")
+            elif _is_custom_gate(call, definitions):
+                for gate in inliner.expand(call):
+                    _emit_gate_call(gate, lines)
+            elif not decompose_qelib1_gate(*call, lines):
+                lines.append(text + ";")
+    if header is not None:
+        raise QasmError(f"Unterminated definition at end of program: {header}")
+    return "\n".join(lines)
+
+
+@profiled("convert_to_supported_qasm")
 def convert_to_supported_qasm(qasm_str):
     """Dev version of convert_to_supported_qasm function, compatible
     with qiskit>=0.43.0. Returns a copy of the input QASM compatible with
@@ -121,32 +299,5 @@ def convert_to_supported_qasm(qasm_str):
     decomposition of unsupported gates/operations.
 
     """
-    # temp hack to fix 'r' replacing last char of 'ecr'
-    qasm_str = qasm_str.replace("ecr", "ecr_")
-
-    input_str = _remove_barriers(qasm_str)
-
-    lines = input_str.strip("\n").split("\n")
-    gate_lines = [(i, line) for i, line in enumerate(lines) if line.strip().startswith("gate")]
-    gate_lines.reverse()  # Reverse to start removing from the last
-    gate_line_idx = _find_gate_line(lines)
-
-    # Remove all 'gate' lines
-    for idx, _ in gate_lines:
-        lines.pop(idx)
-
-    for _, gate_line in gate_lines:
-        # Insert the current 'gate' line for this iteration
-        lines.insert(gate_line_idx, gate_line)
-
-        new_input = "\n".join(lines)
-        new_input = _convert_gate_defs(new_input)  # call the conversion function
-        lines = new_input.split("\n")  # update lines after conversion
-
-        # Remove the current 'gate' line for the next iteration
-        lines.pop(gate_line_idx)
-
-    qasm = "\n".join(lines)
-    qasm_out = replace_qelib1_defs(qasm)
-
-    return qasm_out
+    segments = (segment for segment in _scan_qasm(qasm_str) if not _is_barrier(segment))
+    return _expand_gates(segments)
@@ -12,143 +12,164 @@ Module that implements qelib1.inc qasm gate definitions as python functions
 
 """
 import re
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from qbraid.transpiler.exceptions import QasmError
 
+# Appends the statements of a decomposition, given the gate's parameters and qubits,
+# to the output buffer
+Decomposer = Callable[[List[str], List[str], List[str]], None]
 
-def _get_param(instr: str) -> Optional[str]:
-    try:
-        return instr[instr.index("(") + 1 : instr.index(")")]
-    except ValueError:
-        return None
-
-
-def _remove_spaces_in_parentheses(expression):
-    # Find all parenthesized parts of the input.
-    parenthesized_parts = re.findall(r"\(.*?\)", expression)
-
-    for part in parenthesized_parts:
-        # For each parenthesized part, remove all the spaces.
-        cleaned_part = part.replace(" ", "")
+_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+_INSTR_RE = re.compile(r"\s*([A-Za-z_]\w*)\s*(?:\(([^)]*)\))?\s*([^;]*);?\s*")
 
-        # Replace the original part in the expression with the cleaned part.
-        expression = expression.replace(part, cleaned_part)
 
-    return expression
+def _unpack(args: List[str], count: int, name: str) -> List[str]:
+    if len(args) != count:
+        raise QasmError(f"Expected {count} arguments to {name}, got {len(args)}.")
+    return args
 
 
-def _decompose_cu_instr(instr: str) -> str:
+def _decompose_cu(params: List[str], qubits: List[str], out: List[str]) -> None:
     """controlled-U gate"""
+    a, b = _unpack(qubits, 2, "cu")
     try:
-        instr = _remove_spaces_in_parentheses(instr)
-        cu_gate, qs = instr.split(" ")
-        a, b = qs.strip(";").split(",")
-        params_lst = _get_param(cu_gate).split(",")
-        params = [float(x) for x in params_lst]
-        theta, phi, lam, gamma = params
-    except (AttributeError, ValueError) as err:
+        theta, phi, lam, gamma = (float(param) for param in _unpack(params, 4, "cu"))
+    except ValueError as err:
         raise QasmError from err
-    instr_out = "\n// cu gate\n"
-    instr_out += f"p({gamma}) {a};\n"
-    instr_out += f"p({(lam+phi)/2}) {a};\n"
-    instr_out += f"p({(lam-phi)/2}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"u({-1*theta/2},0,{-1*(phi+lam)/2}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"u({theta/2},{phi},0) {b};\n\n"
-    return instr_out
+    out.append("// cu gate")
+    out.append(f"p({gamma}) {a};")
+    out.append(f"p({(lam+phi)/2}) {a};")
+    out.append(f"p({(lam-phi)/2}) {b};")
+    out.append(f"cx {a},{b};")
+    out.append(f"u({-1*theta/2},0,{-1*(phi+lam)/2}) {b};")
+    out.append(f"cx {a},{b};")
+    out.append(f"u({theta/2},{phi},0) {b};")
 
 
-def _decompose_rxx_instr(instr: str) -> str:
+def _decompose_rxx(params: List[str], qubits: List[str], out: List[str]) -> None:
     """two-qubit XX rotation"""
-    try:
-        instr = instr.replace(", ", ",")
-        rxx_gate, qs = instr.split(" ")
-        a, b = qs.strip(";").split(",")
-        theta = _get_param(rxx_gate)
-    except (AttributeError, ValueError) as err:
-        raise QasmError from err
-    instr_out = "\n// rxx gate\n"
-    instr_out += f"h {a};\n"
-    instr_out += f"h {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"rz({theta}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"h {b};\n"
-    instr_out += f"h {a};\n\n"
-    return instr_out
-
-
-def _decompose_rccx_instr(instr: str) -> str:
+    a, b = _unpack(qubits, 2, "rxx")
+    (theta,) = _unpack(params, 1, "rxx")
+    out.append("// rxx gate")
+    out.append(f"h {a};")
+    out.append(f"h {b};")
+    out.append(f"cx {a},{b};")
+    out.append(f"rz({theta}) {b};")
+    out.append(f"cx {a},{b};")
+    out.append(f"h {b};")
+    out.append(f"h {a};")
+
+
+def _decompose_rccx(params: List[str], qubits: List[str], out: List[str]) -> None:
     """relative-phase CCX"""
-    try:
-        _, qs = instr.split(" ")
-        a, b, c = qs.strip(";").split(",")
-    except (AttributeError, ValueError) as err:
-        raise QasmError from err
-    instr_out = "\n// rccx gate\n"
-    instr_out += f"u2(0,pi) {c};\n"
-    instr_out += f"u1(pi/4) {c};\n"
-    instr_out += f"cx {b},{c};\n"
-    instr_out += f"u1(-pi/4) {c};\n"
-    instr_out += f"cx {a},{c};\n"
-    instr_out += f"u1(pi/4) {c};\n"
-    instr_out += f"cx {b},{c};\n"
-    instr_out += f"u1(-pi/4) {c};\n"
-    instr_out += f"u2(0,pi) {c};\n\n"
-    return instr_out
-
-
-def _decompose_rc3x_instr(instr: str) -> str:
+    _unpack(params, 0, "rccx")
+    a, b, c = _unpack(qubits, 3, "rccx")
+    out.append("// rccx gate")
+    out.append(f"u2(0,pi) {c};")
+    out.append(f"u1(pi/4) {c};")
+    out.append(f"cx {b},{c};")
+    out.append(f"u1(-pi/4) {c};")
+    out.append(f"cx {a},{c};")
+    out.append(f"u1(pi/4) {c};")
+    out.append(f"cx {b},{c};")
+    out.append(f"u1(-pi/4) {c};")
+    out.append(f"u2(0,pi) {c};")
+
+
+def _decompose_rc3x(params: List[str], qubits: List[str], out: List[str]) -> None:
     """relative-phase 3-controlled X gate"""
-    try:
-        _, qs = instr.split(" ")
-        a, b, c, d = qs.strip(";").split(",")
-    except (AttributeError, ValueError) as err:
-        raise QasmError from err
-    instr_out = "\n// rc3x gate\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {c},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"cx {a},{d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {b},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"cx {a},{d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {b},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {c},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n\n"
-    return instr_out
+    _unpack(params, 0, "rc3x")
+    a, b, c, d = _unpack(qubits, 4, "rc3x")
+    out.append("// rc3x gate")
+    out.append(f"u2(0,pi) {d};")
+    out.append(f"u1(pi/4) {d};")
+    out.append(f"cx {c},{d};")
+    out.append(f"u1(-pi/4) {d};")
+    out.append(f"u2(0,pi) {d};")
+    out.append(f"cx {a},{d};")
+    out.append(f"u1(pi/4) {d};")
+    out.append(f"cx {b},{d};")
+    out.append(f"u1(-pi/4) {d};")
+    out.append(f"cx {a},{d};")
+    out.append(f"u1(pi/4) {d};")
+    out.append(f"cx {b},{d};")
+    out.append(f"u1(-pi/4) {d};")
+    out.append(f"u2(0,pi) {d};")
+    out.append(f"u1(pi/4) {d};")
+    out.append(f"cx {c},{d};")
+    out.append(f"u1(-pi/4) {d};")
+    out.append(f"u2(0,pi) {d};")
+
+
+# qelib1 gates that are not supported by the QasmParser, and their decompositions
+_DECOMPOSERS: Dict[str, Decomposer] = {
+    "cu": _decompose_cu,
+    "rxx": _decompose_rxx,
+    "rccx": _decompose_rccx,
+    "rc3x": _decompose_rc3x,
+}
+
+
+def decompose_qelib1_gate(name: str, params: List[str], qubits: List[str], out: List[str]) -> bool:
+    """Append the decomposition of an edge-case qelib1 gate to ``out``, one statement per
+    element.
+
+    Args:
+        name: Name of the gate.
+        params: Parameter expressions of the gate.
+        qubits: Qubit arguments of the gate.
+        out: Output buffer to append statements to.
+
+    Raises:
+        QasmError: If the gate is applied to the wrong number of arguments.
+
+    Returns:
+        True if the gate was decomposed, or False if it needs no decomposition, in which
+        case ``out`` is left unchanged.
+
+    """
+    decomposer = _DECOMPOSERS.get(name)
+    if decomposer is None:
+        return False
+    decomposer(params, qubits, out)
+    return True
+
+
+def _tokenize_instr(instr: str) -> Optional[Tuple[str, List[str], List[str]]]:
+    match = _INSTR_RE.fullmatch(instr)
+    if match is None:
+        return None
+    name, params, qubits = match.groups()
+    return (
+        name,
+        [param.strip() for param in params.split(",")] if params else [],
+        [qubit.strip() for qubit in qubits.split(",")] if qubits.strip() else [],
+    )
+
+
+def _decompose_rxx_instr(instr: str) -> str:
+    """two-qubit XX rotation"""
+    tokens = _tokenize_instr(instr)
+    if tokens is None:
+        raise QasmError(f"Invalid rxx instruction '{instr}'.")
+    _, params, qubits = tokens
+    out: List[str] = []
+    _decompose_rxx(params, qubits, out)
+    return "\n".join(out) + "\n"
 
 
 def replace_qelib1_defs(qasm_str: str) -> str:
-    """Replace edge-case qelib1 gates with equivalent decomposition."""
-    qasm_lst_out = []
-    qasm_lst = qasm_str.split("\n")
-
-    for _, qasm_line in enumerate(qasm_lst):
-        line_str = qasm_line
-        len_line = len(line_str)
-        if len_line > 3 and line_str[0:3] == "cu(":
-            line_str_out = _decompose_cu_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rxx(":
-            line_str_out = _decompose_rxx_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rccx":
-            line_str_out = _decompose_rccx_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rc3x":
-            line_str_out = _decompose_rc3x_instr(line_str)
-        else:
-            line_str_out = line_str
-
-        qasm_lst_out.append(line_str_out)
-
-    qasm_str_def = "\n".join(qasm_lst_out)
-    return qasm_str_def
+    """Replace edge-case qelib1 gates with equivalent decomposition.
+
+    Each line that is a single application of one of these gates is replaced in one pass
+    over the lines of ``qasm_str``. Other lines are left unchanged.
+
+    """
+    qasm_lst_out: List[str] = []
+    for line in qasm_str.split("\n"):
+        name = _NAME_RE.match(line)
+        tokens = _tokenize_instr(line) if name and name.group() in _DECOMPOSERS else None
+        if tokens is None or not decompose_qelib1_gate(*tokens, qasm_lst_out):
+            qasm_lst_out.append(line)
+    return "\n".join(qasm_lst_out)
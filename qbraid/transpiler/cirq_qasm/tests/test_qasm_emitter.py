@@ -0,0 +1,105 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the QASM emitter, differential against cirq.QasmOutput
+
+"""
+import cirq
+import numpy as np
+import pytest
+
+from qbraid.interface import random_circuit
+from qbraid.transpiler.cirq_qasm import emit_qasm, to_qasm
+from qbraid.transpiler.custom_gates import U3Gate, _map_zpow_and_unroll
+
+
+def cirq_qasm(circuit: cirq.Circuit, header: str = "", precision: int = 10) -> str:
+    """Returns the QASM of a circuit written by cirq.QasmOutput"""
+    output = cirq.QasmOutput(
+        operations=circuit.all_operations(),
+        qubits=default_qubits(circuit),
+        header=header,
+        precision=precision,
+    )
+    return str(output)
+
+
+def default_qubits(circuit: cirq.Circuit):
+    """Returns the qubits of a circuit in the default order"""
+    return cirq.QubitOrder.DEFAULT.order_for(circuit.all_qubits())
+
+
+def all_gates_circuit() -> cirq.Circuit:
+    """Returns a circuit of gates formatted by the emitter and of gates written by cirq"""
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    return cirq.Circuit(
+        [cirq.X(q0), cirq.X(q1) ** 0.5, cirq.X(q2) ** -0.5, cirq.X(q0) ** 0.3],
+        [cirq.rx(0.1)(q0), cirq.XPowGate(exponent=1, global_shift=0.5)(q1)],
+        [cirq.Y(q0), cirq.ry(np.pi)(q1), cirq.Y(q2) ** 1.25],
+        [cirq.Z(q0), cirq.S(q1), cirq.S(q2) ** -1, cirq.T(q0), cirq.T(q1) ** -1],
+        [cirq.Z(q2) ** 0.123456789012345, cirq.rz(0)(q0), cirq.rz(2)(q1)],
+        [cirq.H(q0), cirq.H(q1) ** 0, cirq.H(q2) ** 0.5],
+        [cirq.CNOT(q0, q1), cirq.CZ(q1, q2), cirq.SWAP(q0, q2), cirq.CNOT(q0, q1) ** 0.5],
+        [cirq.CCX(q0, q1, q2), cirq.CCZ(q0, q1, q2), cirq.CSWAP(q2, q1, q0)],
+        [cirq.I(q0), cirq.IdentityGate(2)(q1, q2), U3Gate(0.1, 0.2, 0.3)(q0)],
+        [cirq.measure(q0, key="a"), cirq.measure(q1, q2, key="b")],
+        [cirq.measure(q0, key="a", invert_mask=(True,)), cirq.measure(q1, key="c d")],
+    )
+
+
+def test_same_qasm_as_cirq():
+    """Test that all gates are written as by cirq.QasmOutput"""
+    circuit = all_gates_circuit()
+    header = "Generated for\na test"
+    assert emit_qasm(circuit, header) == cirq_qasm(circuit, header)
+    assert emit_qasm(circuit, precision=3) == cirq_qasm(circuit, precision=3)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_circuits_same_qasm_as_cirq(seed):
+    """Test random circuits, of gates both formatted by the emitter and left to cirq"""
+    circuit = random_circuit("cirq", num_qubits=4, depth=10, random_state=seed)
+    assert emit_qasm(circuit) == cirq_qasm(circuit)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_map_zpow_same_qasm_as_mapped_circuit(seed):
+    """Test that Z rotations are written as once mapped to qbraid ZPowGates"""
+    circuit = random_circuit("cirq", num_qubits=4, depth=10, random_state=seed)
+    circuit += all_gates_circuit()
+    mapped = _map_zpow_and_unroll(circuit)
+    assert emit_qasm(circuit, map_zpow=True) == cirq_qasm(mapped)
+    assert "p(pi*0.123456789) q[2];" in emit_qasm(circuit, map_zpow=True)
+
+
+@pytest.mark.parametrize("map_zpow", [False, True])
+def test_fallback_without_private_cirq_api(monkeypatch, map_zpow):
+    """Test that the circuit is written by cirq.QasmOutput if its private writer is missing"""
+    circuit = all_gates_circuit()
+    expected = emit_qasm(circuit, "header", map_zpow=map_zpow)
+    monkeypatch.delattr(cirq.QasmOutput, "_write_operations")
+    assert emit_qasm(circuit, "header", map_zpow=map_zpow) == expected
+
+
+def test_to_qasm_header_and_order():
+    """Test the default header and a given qubit order"""
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.CNOT(q0, q1))
+    qasm = to_qasm(circuit, qubit_order=[q1, q0])
+    assert qasm.startswith("// Generated from qBraid v")
+    assert qasm.endswith("cx q[1],q[0];\n")
+
+
+def test_unsupported_operation():
+    """Test that operations which cannot be written as QASM raise cirq's error"""
+    circuit = cirq.Circuit(cirq.depolarize(0.1)(cirq.LineQubit(0)))
+    with pytest.raises(ValueError, match="Cannot output operation as QASM"):
+        emit_qasm(circuit)
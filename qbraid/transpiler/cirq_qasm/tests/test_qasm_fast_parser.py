@@ -0,0 +1,157 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the fast-path QASM parser, differential against the QasmParser
+
+"""
+import cirq
+import numpy as np
+import pytest
+from cirq.contrib.qasm_import import QasmException
+
+from qbraid.interface import random_circuit
+from qbraid.transpiler.cirq_qasm import QasmParser, fast_parse_qasm, parse_qasm
+from qbraid.transpiler.cirq_qasm.qasm_fast_parser import _evaluate_params
+from qbraid.transpiler.cirq_qasm.qasm_preprocess import convert_to_supported_qasm
+from qbraid.transpiler.profiling import profile
+
+HEADER = 'OPENQASM 2.0;\ninclude "qelib1.inc";\n'
+
+
+def assert_same_parse(qasm: str):
+    """Assert that the fast path parses ``qasm`` to the same program as the QasmParser.
+    Operations of gates that do not define equality are compared by unitary."""
+    fast = fast_parse_qasm(qasm)
+    assert fast is not None
+    expected = QasmParser().parse(qasm)
+    assert fast.qregs == expected.qregs
+    assert fast.cregs == expected.cregs
+    assert fast.qelib1Include == expected.qelib1Include
+    assert fast.supportedFormat == expected.supportedFormat
+    assert len(fast.circuit) == len(expected.circuit)
+    for moment, expected_moment in zip(fast.circuit, expected.circuit):
+        operations = sorted(moment.operations, key=lambda op: op.qubits)
+        expected_operations = sorted(expected_moment.operations, key=lambda op: op.qubits)
+        assert len(operations) == len(expected_operations)
+        for op, expected_op in zip(operations, expected_operations):
+            assert op.qubits == expected_op.qubits
+            if op != expected_op:
+                assert np.array_equal(cirq.unitary(op), cirq.unitary(expected_op))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_qiskit_qasm(seed):
+    """Test parsing QASM exported by qiskit"""
+    circuit = random_circuit("qiskit", num_qubits=5, depth=8, measure=True, seed=seed)
+    assert_same_parse(convert_to_supported_qasm(circuit.qasm()))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_cirq_qasm(seed):
+    """Test parsing QASM exported by cirq"""
+    circuit = random_circuit("cirq", num_qubits=4, depth=8, random_state=seed)
+    assert_same_parse(convert_to_supported_qasm(cirq.qasm(circuit)))
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "-2^2",
+        "2^-1^2",
+        "2^3^2",
+        "1-2-3",
+        "2*-3*4",
+        "-pi/2+1",
+        "sin(pi/3)^2",
+        "+1.5e-3*2",
+        "(1+2)*3^2/4",
+        "cos(-pi)-ln(2)",
+        "1.",
+        " .5 ",
+        "-(1)-(-2)",
+        "sqrt(2)*-pi^2/3-1",
+    ],
+)
+def test_parameter_expressions(expr):
+    """Test that parameter expressions are evaluated in the order of the QasmParser"""
+    assert_same_parse(HEADER + f"qreg q[1];\nrz({expr}) q[0];\nu3({expr},0,{expr}) q[0];")
+
+
+def test_repeated_expressions_evaluated_once():
+    """Test that repeated parameter expressions are folded to constants once"""
+    expr = "pi/4+0.1*2+0.123456789"
+    qasm = HEADER + "qreg q[2];\n" + f"rz({expr}) q[0];\ncrz({expr}) q[0],q[1];\n" * 50
+    hits = _evaluate_params.cache_info().hits
+    parsed = fast_parse_qasm(qasm)
+    assert _evaluate_params.cache_info().hits - hits >= 99
+    rz_gate = cirq.rz(np.pi / 4 + 0.1 * 2 + 0.123456789)
+    gates = {op.gate for op in parsed.circuit.all_operations()}
+    assert gates == {rz_gate, cirq.ControlledGate(rz_gate)}
+    assert_same_parse(qasm)
+
+
+def test_registers_broadcast():
+    """Test gates and measurements applied to whole registers"""
+    assert_same_parse(
+        HEADER
+        + "qreg q[2];qreg r[2];creg c[2]; // comment\n"
+        + "cx q,r; h q[0]; cx q[1],r;\nmeasure q -> c; U(1,2,3) r[0]; CX r[0], q[ 1 ];"
+    )
+
+
+def test_basic_gates_without_include():
+    """Test that only the basic gates are defined before qelib1.inc is included"""
+    assert_same_parse("OPENQASM 2.0;\nqreg q[2];\nCX q[0],q[1];\nU(0,0,pi) q[1];")
+    assert fast_parse_qasm("OPENQASM 2.0;\nqreg q[1];\nh q[0];") is None
+
+
+@pytest.mark.parametrize(
+    "qasm",
+    [
+        "qreg q[1];",
+        "OPENQASM 3.0;",
+        'OPENQASM 2.0 ;\ninclude "qelib1.inc";',
+        'OPENQASM 2.0;\ninclude "other.inc";',
+        HEADER + "qreg q[1];\nrz(2pi) q[0];",
+        HEADER + "qreg q[1];\nrz(x) q[0];",
+        HEADER + "qreg q[2];\ncx q[0],q[0];",
+        HEADER + "qreg q[2];\nqreg q[1];",
+        HEADER + "qreg q[0];",
+        HEADER + "qreg q[1];\nh q[1];",
+        HEADER + "qreg q[1];\nh q[0]",
+        HEADER + "qreg q[1];\nmygate q[0];",
+        HEADER + "qreg q[1];\nqregx q[0];",
+        HEADER + "qreg q[1];\nif(c==1) x q[0];",
+        HEADER + "qreg q[2];\ncreg c[1];\nmeasure q -> c;",
+        HEADER + "qreg q[1];\r\nh q[0];",
+    ],
+)
+def test_falls_back(qasm):
+    """Test that programs outside of the supported subset, or invalid, are left to the
+    QasmParser"""
+    assert fast_parse_qasm(qasm) is None
+
+
+def test_parse_qasm_uses_fast_path():
+    """Test that parse_qasm only falls back to the QasmParser when needed"""
+    qasm = HEADER + "qreg q[2];\nh q[0];\ncx q[0],q[1];"
+    with profile() as prof:
+        parse_qasm(qasm)
+    assert "fast_parse_qasm" in prof.stages
+    assert "QasmParser.parse" not in prof.stages
+
+    with profile() as prof:
+        circuit = parse_qasm(HEADER + "qreg q[2];\ngate g a,b { h a; cx a,b; }\ng q[0],q[1];")
+    assert "QasmParser.parse" not in prof.stages
+    assert len(circuit.circuit) == 2
+
+    with pytest.raises(QasmException, match="Unknown gate"):
+        parse_qasm(HEADER + "qreg q[1];\nmygate q[0];")
@@ -37,7 +37,7 @@ from cirq.circuits.qasm_output import QasmUGate
 from cirq.contrib.qasm_import import QasmException
 
 import qbraid.transpiler.custom_gates as cirq_qasm_gates
-from qbraid.transpiler.cirq_qasm.qasm_parser import QasmParser
+from qbraid.transpiler.cirq_qasm.qasm_parser import CircuitBuilder, QasmGateStatement, QasmParser
 
 # from cirq.contrib.qasm_import._parser import QasmParser
 
@@ -1091,3 +1091,186 @@ def test_single_qubit_gates(qasm_gate: str, cirq_gate: cirq.Gate):
 
     ct.assert_same_circuits(parsed_qasm.circuit, expected_circuit)
     assert parsed_qasm.qregs == {'q': 2}
+
+
+def test_parser_tables_shared_between_instances():
+    parser1 = QasmParser()
+    parser2 = QasmParser()
+
+    assert parser1.parser is not parser2.parser
+    assert parser1.parser.action is parser2.parser.action
+    assert parser1.parser.goto is parser2.parser.goto
+    assert all(
+        production.callable is None or production.callable.__self__ is parser2
+        for production in parser2.parser.productions
+    )
+
+
+def test_parser_instances_keep_separate_state():
+    qasm1 = """OPENQASM 2.0;
+     include "qelib1.inc";
+     qreg q[2];
+     h q[0];
+     cx q[0],q[1];
+    """
+    qasm2 = """OPENQASM 2.0;
+     include "qelib1.inc";
+     qreg r[1];
+     x r[0];
+    """
+    parser1 = QasmParser()
+    parser2 = QasmParser()
+    parsed_qasm2 = parser2.parse(qasm2)
+    parsed_qasm1 = parser1.parse(qasm1)
+
+    q0 = cirq.NamedQubit('q_0')
+    q1 = cirq.NamedQubit('q_1')
+    r0 = cirq.NamedQubit('r_0')
+
+    ct.assert_same_circuits(parsed_qasm1.circuit, Circuit([cirq.H(q0), cirq.CNOT(q0, q1)]))
+    ct.assert_same_circuits(parsed_qasm2.circuit, Circuit([cirq.X(r0)]))
+    assert parsed_qasm1.qregs == {'q': 2}
+    assert parsed_qasm2.qregs == {'r': 1}
+
+
+def test_syntax_error_reported_by_own_parser():
+    QasmParser().parse('OPENQASM 2.0; qreg q[1];')
+    parser = QasmParser()
+    with pytest.raises(QasmException, match='Unexpected end of file'):
+        parser.parse('OPENQASM 2.0; qreg q[1]; x q[0]')
+
+
+def test_parser_reused_for_several_parses():
+    parser = QasmParser()
+    parsed_qasm1 = parser.parse('OPENQASM 2.0; include "qelib1.inc"; qreg q[1]; h q[0];')
+    parsed_qasm2 = parser.parse('OPENQASM 2.0; qreg r[2]; creg c[2];')
+
+    ct.assert_same_circuits(parsed_qasm1.circuit, Circuit([cirq.H(cirq.NamedQubit('q_0'))]))
+    ct.assert_same_circuits(parsed_qasm2.circuit, Circuit())
+    assert parsed_qasm1.qelib1Include and not parsed_qasm2.qelib1Include
+    assert parsed_qasm1.qregs == {'q': 1}
+    assert parsed_qasm2.qregs == {'r': 2}
+    assert parsed_qasm2.cregs == {'c': 2}
+
+
+def test_parser_reused_after_error():
+    parser = QasmParser()
+    with pytest.raises(QasmException):
+        parser.parse('OPENQASM 2.0; qreg q[1]; qreg q[1];')
+    parsed_qasm = parser.parse('OPENQASM 2.0; qreg q[1];')
+    assert parsed_qasm.qregs == {'q': 1}
+
+
+def test_parser_shared_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = QasmParser()
+
+    def parse(size):
+        qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[{0}];\n'.format(size)
+        qasm += ''.join('h q[{0}];\ncx q[{0}],q[{1}];\n'.format(i, i + 1) for i in range(size - 1))
+        return size, parser.parse(qasm)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, [2 + i % 7 for i in range(200)]))
+
+    for size, parsed_qasm in results:
+        assert parsed_qasm.qregs == {'q': size}
+        assert len(list(parsed_qasm.circuit.all_operations())) == 2 * (size - 1)
+
+
+def test_parser_re_entrant():
+    inner_qasm = 'OPENQASM 2.0; qreg r[1]; U(0, 0, 0) r[0];'
+
+    class ReEntrantParser(QasmParser):
+        inner = []
+
+        def _resolve_gate_operation(self, args, gate, p, params):
+            if gate == 'CX':
+                self.inner.append(self.parse(inner_qasm))
+            super()._resolve_gate_operation(args, gate, p, params)
+
+    parsed_qasm = ReEntrantParser().parse('OPENQASM 2.0; qreg q[2]; CX q[0],q[1];')
+
+    q0 = cirq.NamedQubit('q_0')
+    q1 = cirq.NamedQubit('q_1')
+    ct.assert_same_circuits(parsed_qasm.circuit, Circuit([cirq.CNOT(q0, q1)]))
+    assert parsed_qasm.qregs == {'q': 2}
+    assert ReEntrantParser.inner[0].qregs == {'r': 1}
+
+
+def test_gate_tables_immutable():
+    with pytest.raises(TypeError):
+        QasmParser.qelib_gates['foo'] = QasmParser.qelib_gates['x']
+    with pytest.raises(TypeError):
+        QasmParser().all_gates['x'] = QasmParser.qelib_gates['y']
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_circuit_builder_same_moments_as_append(seed):
+    rng = np.random.default_rng(seed)
+    qubits = cirq.LineQubit.range(4)
+    operations = []
+    for _ in range(200):
+        kind = rng.integers(4)
+        targets = [qubits[i] for i in rng.choice(4, size=2, replace=False)]
+        key = f'm{rng.integers(3)}'
+        if kind == 0:
+            operations.append(cirq.measure(targets[0], key=key))
+        elif kind == 1:
+            operations.append(cirq.X(targets[0]).with_classical_controls(key))
+        elif kind == 2:
+            operations.append(cirq.CZ(*targets) ** rng.random())
+        else:
+            operations.append(cirq.H(targets[0]))
+
+    builder = CircuitBuilder()
+    builder.extend(operations)
+    expected = Circuit()
+    for op in operations:
+        expected.append(op)
+    assert builder.circuit() == expected
+
+
+def test_gates_shared_by_operations_with_same_params():
+    qasm = """OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[2];
+    rz(pi/4) q[0];
+    cu3(0.5,1,2) q[0],q[1];
+    rz(pi/4) q[1];
+    cu3(0.5,1,2) q[1],q[0];
+    rz(pi/8) q[0];
+"""
+    operations = list(QasmParser().parse(qasm).circuit.all_operations())
+    assert operations[0].gate is operations[2].gate
+    # controlled operations build their ControlledGate from the shared sub gate
+    assert operations[1].gate.sub_gate is operations[3].gate.sub_gate
+    assert operations[4].gate == cirq.rz(np.pi / 8)
+
+    statement = QasmParser.qelib_gates['u1']
+    assert statement.gate([1]) is statement.gate((1,))
+    assert statement.gate([1]) is not statement.gate([1.0])
+    assert QasmParser.qelib_gates['x'].gate([]) is QasmParser.qelib_gates['x'].cirq_gate
+
+
+def test_params_memoized_by_text(monkeypatch):
+    qasm = """OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[2];
+    rz(pi/4+0.1*2) q[0];
+    crz(pi/4+0.1*2) q[0],q[1];
+    rz(pi/4 + 0.1*2) q[1];
+"""
+    calls = []
+    on = QasmGateStatement.on
+
+    def record_on(self, params, args, lineno):
+        calls.append(params)
+        return on(self, params=params, args=args, lineno=lineno)
+
+    monkeypatch.setattr(QasmGateStatement, 'on', record_on)
+    operations = list(QasmParser().parse(qasm).circuit.all_operations())
+    assert calls[0] is calls[1]
+    assert calls[2] is not calls[0] and calls[2] == calls[0]
+    assert operations[0].gate == cirq.rz(np.pi / 4 + 0.1 * 2)
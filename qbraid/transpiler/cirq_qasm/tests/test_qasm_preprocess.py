@@ -13,13 +13,21 @@ Unit tests for QASM preprocessing functions
 
 """
 
+import time
+
 import pytest
 from qiskit import QuantumCircuit
 
 from qbraid.interface import circuits_allclose
 from qbraid.interface.qbraid_cirq.tools import _convert_to_line_qubits
 from qbraid.transpiler.cirq_qasm.qasm_conversions import from_qasm
-from qbraid.transpiler.cirq_qasm.qasm_preprocess import _remove_barriers, convert_to_supported_qasm
+from qbraid.transpiler.cirq_qasm.qasm_preprocess import (
+    _remove_barriers,
+    _scan_qasm,
+    convert_to_supported_qasm,
+)
+from qbraid.transpiler.cirq_qasm.qelib1_defs import decompose_qelib1_gate, replace_qelib1_defs
+from qbraid.transpiler.exceptions import QasmError
 
 qasm_0 = """OPENQASM 2.0;
 include "qelib1.inc";
@@ -171,6 +179,52 @@ measure cout[0] -> ans[4];
     )
 
 
+def test_scan_qasm():
+    """Test splitting qasm into statements, comments and blocks"""
+    qasm_str = """OPENQASM 2.0;
+include "semi;colon{.inc";
+// comment; with {delimiters}
+gate g a { h a; }
+qreg q[1]; x q[0]; // trailing
+measure q[0] // comment within a statement
+  -> c[0];
+barrier q"""
+    segments = list(_scan_qasm(qasm_str))
+    assert "".join(segment.text for segment in segments) == qasm_str
+    assert [segment.kind for segment in segments] == [
+        "statement",
+        "statement",
+        "comment",
+        "block_start",
+        "statement",
+        "block_end",
+        "statement",
+        "statement",
+        "comment",
+        "statement",
+        "text",
+    ]
+    assert segments[1].text == '\ninclude "semi;colon{.inc";'
+    assert segments[9].text == "\nmeasure q[0] // comment within a statement\n  -> c[0];"
+
+
+def test_remove_barriers_large_qasm():
+    """Test removing barriers from a program of several megabytes"""
+    lines = ['include "qelib1.inc";', "qreg q[2];"]
+    lines += ["h q[0]; barrier q[0],q[1]; // barrier;", 'cx q[0],q[1]; // "unmatched'] * 50000
+    qasm_str = "\n".join(lines)
+    start = time.perf_counter()
+    qasm_out = _remove_barriers(qasm_str)
+    assert time.perf_counter() - start < 5
+    assert qasm_out.count("barrier") == 50000
+    assert qasm_out.count("cx q[0],q[1];") == 50000
+
+    unterminated = 'include "qelib1.inc' + " x" * 20000
+    start = time.perf_counter()
+    assert _remove_barriers(unterminated) == unterminated
+    assert time.perf_counter() - start < 5
+
+
 def test_convert_qasm_one_param():
     """Test converting qasm string from one-parameter gate"""
 
@@ -296,3 +350,168 @@ h q[1];
 """
     qasm_out = convert_to_supported_qasm(qasm_in)
     assert strings_equal(qasm_out, expected_out)
+
+
+def test_convert_qasm_multiline_gate_defs():
+    """Test converting qasm string with multi-line gate defs applied to several registers"""
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate majority a,b,c
+{
+  cx c,b;
+  cx c,a;
+  ccx a,b,c;
+}
+gate unmaj a,b,c
+{
+  ccx a,b,c;
+  cx c,a;
+  cx a,b;
+}
+qreg cin[1];
+qreg a[2];
+qreg b[2]; x a[0]; // a = 01
+majority cin[0],b[0],a[0];
+unmaj cin[0],b[0],a[0];
+"""
+    expected_out = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg cin[1];
+qreg a[2];
+qreg b[2];
+x a[0];
+// a = 01
+cx a[0],b[0];
+cx a[0],cin[0];
+ccx cin[0],b[0],a[0];
+ccx cin[0],b[0],a[0];
+cx a[0],cin[0];
+cx cin[0],b[0];
+"""
+    assert strings_equal(convert_to_supported_qasm(qasm_in), expected_out)
+
+
+def test_convert_qasm_substitutes_whole_identifiers():
+    """Test that gate parameters and qubits are substituted as whole identifiers, and that
+    compound parameter values keep their precedence"""
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate x1(p) q1,q10 { cx q1,q10; rz(2*p) q10; rx(pi*p) q1; ry(p) q10; }
+qreg q[2];
+x1(pi/2+0.5) q[1],q[0];
+x q[0];
+"""
+    expected_out = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+cx q[1],q[0];
+rz(2*(pi/2+0.5)) q[0];
+rx(pi*(pi/2+0.5)) q[1];
+ry(pi/2+0.5) q[0];
+x q[0];
+"""
+    assert strings_equal(convert_to_supported_qasm(qasm_in), expected_out)
+
+
+def test_convert_qasm_invalid_gate_application():
+    """Test that applying a custom gate to the wrong number of arguments raises an error"""
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate g(theta) a,b { rz(theta) a; cx a,b; }
+qreg q[2];
+g(0.1) q[0];
+"""
+    with pytest.raises(QasmError):
+        convert_to_supported_qasm(qasm_in)
+
+
+@pytest.mark.parametrize(
+    "qasm_in",
+    [
+        'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncx q[0],q[1]',
+        'OPENQASM 2.0;\nqreg q[2];\ngate g a,b { cx a,b; }\ng q[0],q[1];\ng q[1],  // cut',
+        'OPENQASM 2.0;\nqreg q[2];\ngate g a,b { cx a,b;',
+    ],
+)
+def test_convert_qasm_truncated_program(qasm_in):
+    """Test that a program truncated in the middle of a statement is rejected"""
+    with pytest.raises(QasmError):
+        convert_to_supported_qasm(qasm_in)
+
+
+def test_convert_qasm_trailing_comment():
+    """Test that whitespace and comments after the last statement are accepted"""
+    qasm_in = 'OPENQASM 2.0;\nqreg q[1];\nh q[0];\n  // done\n'
+    assert convert_to_supported_qasm(qasm_in).endswith("h q[0];\n// done")
+
+
+def test_convert_qasm_many_gate_defs():
+    """Test that nested custom gates applied many times are expanded in one pass"""
+    num_defs = 200
+    defs = ["gate g0(theta) a,b { rz(theta) a; cx a,b; }"]
+    defs += [f"gate g{i}(theta) a,b {{ g{i - 1}(theta) a,b; }}" for i in range(1, num_defs)]
+    usages = [f"g{i}({i}) q[0],q[1];" for i in range(num_defs)] * 10
+    qasm_in = "\n".join(["OPENQASM 2.0;", 'include "qelib1.inc";', *defs, "qreg q[2];", *usages])
+    start = time.perf_counter()
+    qasm_out = convert_to_supported_qasm(qasm_in)
+    assert time.perf_counter() - start < 5
+    assert qasm_out.count("cx q[0],q[1];") == len(usages)
+    assert "g1" not in qasm_out
+    assert len(from_qasm(qasm_out)) > 0
+
+
+def test_convert_qasm_decomposes_qelib1_gates_in_gate_defs():
+    """Test that edge-case qelib1 gates are decomposed, including within custom gates"""
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate g(theta) a,b,c { rxx(theta) a,b; rccx a,b,c; }
+qreg q[3];
+g(0.5) q[0],q[1],q[2];
+cu(0.1,0.2,0.3,0.4) q[2],q[0];
+"""
+    qasm_out = convert_to_supported_qasm(qasm_in)
+    assert "rxx" not in qasm_out.replace("// rxx gate", "")
+    assert "rccx" not in qasm_out.replace("// rccx gate", "")
+    assert "cu(" not in qasm_out
+    assert "rz(0.5) q[1];" in qasm_out
+    qiskit_circuit = QuantumCircuit().from_qasm_str(qasm_in)
+    cirq_circuit = _convert_to_line_qubits(from_qasm(qasm_out), rev_qubits=True)
+    assert circuits_allclose(cirq_circuit, qiskit_circuit)
+
+
+def test_decompose_qelib1_gate():
+    """Test decomposing edge-case qelib1 gates into a shared output buffer"""
+    out = ["qreg q[4];"]
+    assert decompose_qelib1_gate("rc3x", [], ["q[0]", "q[1]", "q[2]", "q[3]"], out)
+    assert not decompose_qelib1_gate("cx", [], ["q[0]", "q[1]"], out)
+    assert out[0] == "qreg q[4];"
+    assert out[1] == "// rc3x gate"
+    assert len(out) == 20
+    with pytest.raises(QasmError):
+        decompose_qelib1_gate("rxx", ["0.1"], ["q[0]"], out)
+    with pytest.raises(QasmError):
+        decompose_qelib1_gate("cu", ["pi", "0", "0", "0"], ["q[0]", "q[1]"], out)
+
+
+def test_replace_qelib1_defs():
+    """Test replacing edge-case qelib1 gates line by line"""
+    qasm_in = "qreg q[2];\nrxx(0.5) q[0], q[1];\nrx(0.5) q[0];\ncx q[0],q[1];"
+    assert replace_qelib1_defs(qasm_in).split("\n") == [
+        "qreg q[2];",
+        "// rxx gate",
+        "h q[0];",
+        "h q[1];",
+        "cx q[0],q[1];",
+        "rz(0.5) q[1];",
+        "cx q[0],q[1];",
+        "h q[1];",
+        "h q[0];",
+        "rx(0.5) q[0];",
+        "cx q[0],q[1];",
+    ]
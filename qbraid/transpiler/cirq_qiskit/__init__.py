@@ -20,6 +20,12 @@ Qiskit Conversions  (:mod:`qbraid.transpiler.cirq_qiskit`)
 
    from_qiskit
    to_qiskit
+   from_qiskit_parameterized
+   to_qiskit_parameterized
 
 """
 from qbraid.transpiler.cirq_qiskit.conversions import from_qiskit, to_qiskit
+from qbraid.transpiler.cirq_qiskit.parameterized import (
+    from_qiskit_parameterized,
+    to_qiskit_parameterized,
+)
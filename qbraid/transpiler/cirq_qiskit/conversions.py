@@ -19,8 +19,8 @@ import qiskit
 from qbraid.interface import convert_to_contiguous
 from qbraid.interface.qbraid_cirq.tools import _convert_to_line_qubits
 from qbraid.transpiler.cirq_qasm import from_qasm, to_qasm
-from qbraid.transpiler.custom_gates import _map_zpow_and_unroll
 from qbraid.transpiler.exceptions import CircuitConversionError
+from qbraid.transpiler.profiling import record_stage
 
 
 def to_qiskit(circuit: cirq.Circuit) -> qiskit.QuantumCircuit:
@@ -36,8 +36,9 @@ def to_qiskit(circuit: cirq.Circuit) -> qiskit.QuantumCircuit:
     """
     try:
         contig_circuit = convert_to_contiguous(circuit, rev_qubits=True)
-        compat_circuit = _map_zpow_and_unroll(contig_circuit)
-        return qiskit.QuantumCircuit.from_qasm_str(to_qasm(compat_circuit))
+        qasm = to_qasm(contig_circuit, map_zpow=True)
+        with record_stage("qiskit.QuantumCircuit.from_qasm_str", qasm):
+            return qiskit.QuantumCircuit.from_qasm_str(qasm)
     except ValueError as err:
         raise CircuitConversionError("Cirq qasm converter doesn't yet support qasm3.") from err
 
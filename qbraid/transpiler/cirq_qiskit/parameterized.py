@@ -0,0 +1,297 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module containing functions to convert between parameterized Cirq and Qiskit circuits,
+preserving symbolic parameters (sympy symbols in Cirq, ``Parameter`` objects in Qiskit).
+
+Unlike :func:`~qbraid.transpiler.cirq_qiskit.to_qiskit` and
+:func:`~qbraid.transpiler.cirq_qiskit.from_qiskit`, which go through OpenQASM 2 and so
+require bound parameters, these functions map circuits operation by operation.
+
+"""
+import operator
+import re
+from functools import reduce
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import cirq
+import numpy as np
+import sympy
+from qiskit import ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter, ParameterExpression
+from qiskit.circuit import library as qiskit_gates
+from qiskit.extensions import UnitaryGate
+from qiskit.quantum_info import Operator
+
+from qbraid.transpiler.exceptions import CircuitConversionError
+
+Angle = Union[float, sympy.Expr]
+
+
+def _to_sympy(value: Union[float, ParameterExpression]) -> Angle:
+    if isinstance(value, ParameterExpression):
+        if not value.parameters:
+            return float(value)
+        return sympy.sympify(value.sympify())
+    return float(value)
+
+
+def _to_qiskit_expr(
+    expr: Angle, parameters: Dict[str, Parameter]
+) -> Union[float, ParameterExpression]:
+    """Rebuilds the sympy expression ``expr`` out of the Qiskit ``parameters``, keyed by name."""
+    if not isinstance(expr, sympy.Basic) or expr.is_number:
+        return float(expr)
+    if expr.is_Symbol:
+        if expr.name not in parameters:
+            parameters[expr.name] = Parameter(expr.name)
+        return parameters[expr.name]
+    args = [_to_qiskit_expr(arg, parameters) for arg in expr.args]
+    if expr.is_Add:
+        return reduce(operator.add, args)
+    if expr.is_Mul:
+        return reduce(operator.mul, args)
+    if expr.is_Pow and expr.exp.is_Integer:
+        power = reduce(operator.mul, [args[0]] * abs(int(expr.exp)))
+        return power if expr.exp > 0 else 1 / power
+    functions = {sympy.sin: "sin", sympy.cos: "cos", sympy.tan: "tan", sympy.exp: "exp"}
+    if expr.func in functions:
+        return getattr(args[0], functions[expr.func])()
+    raise CircuitConversionError(f"Unsupported parameter expression {expr}.")
+
+
+def _div_pi(angle: Angle) -> Angle:
+    return angle / (sympy.pi if isinstance(angle, sympy.Basic) else np.pi)
+
+
+def _mul_pi(exponent: Angle) -> Angle:
+    return exponent * (sympy.pi if isinstance(exponent, sympy.Basic) else np.pi)
+
+
+def _u3(theta: Angle, phi: Angle, lam: Angle) -> List[cirq.Gate]:
+    # equal to qiskit's U3 gate up to global phase
+    return [cirq.rz(lam), cirq.ry(theta), cirq.rz(phi)]
+
+
+_QISKIT_TO_CIRQ: Dict[str, Callable[..., Union[cirq.Gate, List[cirq.Gate]]]] = {
+    "id": lambda: cirq.I,
+    "x": lambda: cirq.X,
+    "y": lambda: cirq.Y,
+    "z": lambda: cirq.Z,
+    "h": lambda: cirq.H,
+    "s": lambda: cirq.S,
+    "sdg": lambda: cirq.S**-1,
+    "t": lambda: cirq.T,
+    "tdg": lambda: cirq.T**-1,
+    "sx": lambda: cirq.X**0.5,
+    "sxdg": lambda: cirq.X**-0.5,
+    "rx": cirq.rx,
+    "ry": cirq.ry,
+    "rz": cirq.rz,
+    "p": lambda lam: cirq.ZPowGate(exponent=_div_pi(lam)),
+    "u1": lambda lam: cirq.ZPowGate(exponent=_div_pi(lam)),
+    "u2": lambda phi, lam: _u3(np.pi / 2, phi, lam),
+    "u3": _u3,
+    "u": _u3,
+    "cx": lambda: cirq.CNOT,
+    "cy": lambda: cirq.ControlledGate(cirq.Y),
+    "cz": lambda: cirq.CZ,
+    "ch": lambda: cirq.ControlledGate(cirq.H),
+    "swap": lambda: cirq.SWAP,
+    "crx": lambda theta: cirq.ControlledGate(cirq.rx(theta)),
+    "cry": lambda theta: cirq.ControlledGate(cirq.ry(theta)),
+    "crz": lambda theta: cirq.ControlledGate(cirq.rz(theta)),
+    "cp": lambda lam: cirq.CZPowGate(exponent=_div_pi(lam)),
+    "cu1": lambda lam: cirq.CZPowGate(exponent=_div_pi(lam)),
+    "rxx": lambda theta: cirq.XXPowGate(exponent=_div_pi(theta), global_shift=-0.5),
+    "ryy": lambda theta: cirq.YYPowGate(exponent=_div_pi(theta), global_shift=-0.5),
+    "rzz": lambda theta: cirq.ZZPowGate(exponent=_div_pi(theta), global_shift=-0.5),
+    "ccx": lambda: cirq.TOFFOLI,
+    "cswap": lambda: cirq.FREDKIN,
+}
+
+
+def from_qiskit_parameterized(circuit: QuantumCircuit) -> cirq.Circuit:
+    """Returns a Cirq circuit equivalent to the input, possibly parameterized, Qiskit circuit.
+    Qiskit parameters are mapped to sympy symbols of the same name.
+
+    Qubits are mapped to ``cirq.LineQubit``'s in reverse order, as by
+    :func:`~qbraid.transpiler.cirq_qiskit.from_qiskit`. Global phase and barriers are
+    dropped.
+
+    Args:
+        circuit: Qiskit circuit to convert to a Cirq circuit.
+
+    Raises:
+        CircuitConversionError: If the circuit contains a parameterized instruction
+            that is not a Qiskit standard gate.
+
+    Returns:
+        Cirq circuit equivalent to the input Qiskit circuit.
+    """
+    num_qubits = circuit.num_qubits
+    qubits = {
+        bit: cirq.LineQubit(num_qubits - 1 - index) for index, bit in enumerate(circuit.qubits)
+    }
+    operations = []
+    for instruction in circuit.data:
+        gate = instruction.operation
+        gate_qubits = [qubits[bit] for bit in instruction.qubits]
+        if gate.name == "barrier":
+            continue
+        if gate.name == "measure":
+            bit = circuit.find_bit(instruction.clbits[0])
+            key = f"{bit.registers[0][0].name}_{bit.registers[0][1]}" if bit.registers else None
+            operations.append(cirq.measure(*gate_qubits, key=key))
+            continue
+        if gate.name in _QISKIT_TO_CIRQ:
+            cirq_gates = _QISKIT_TO_CIRQ[gate.name](*[_to_sympy(param) for param in gate.params])
+            if not isinstance(cirq_gates, list):
+                cirq_gates = [cirq_gates]
+            operations.extend(cirq_gate.on(*gate_qubits) for cirq_gate in cirq_gates)
+            continue
+        if any(isinstance(param, ParameterExpression) for param in gate.params):
+            raise CircuitConversionError(
+                f"Unable to convert parameterized instruction {gate.name} to Cirq."
+            )
+        try:
+            # qiskit matrices are little-endian in the qubits of the instruction
+            matrix = Operator(gate).data
+        except Exception as err:
+            raise CircuitConversionError(f"Unable to convert {gate.name} to Cirq.") from err
+        operations.append(cirq.MatrixGate(matrix).on(*reversed(gate_qubits)))
+    return cirq.Circuit(operations)
+
+
+_CIRQ_TO_QISKIT = {
+    cirq.X: qiskit_gates.XGate,
+    cirq.Y: qiskit_gates.YGate,
+    cirq.Z: qiskit_gates.ZGate,
+    cirq.H: qiskit_gates.HGate,
+    cirq.S: qiskit_gates.SGate,
+    cirq.S**-1: qiskit_gates.SdgGate,
+    cirq.T: qiskit_gates.TGate,
+    cirq.T**-1: qiskit_gates.TdgGate,
+    cirq.X**0.5: qiskit_gates.SXGate,
+    cirq.X**-0.5: qiskit_gates.SXdgGate,
+    cirq.CNOT: qiskit_gates.CXGate,
+    cirq.CZ: qiskit_gates.CZGate,
+    cirq.ControlledGate(cirq.Y): qiskit_gates.CYGate,
+    cirq.ControlledGate(cirq.H): qiskit_gates.CHGate,
+    cirq.SWAP: qiskit_gates.SwapGate,
+    cirq.TOFFOLI: qiskit_gates.CCXGate,
+    cirq.FREDKIN: qiskit_gates.CSwapGate,
+}
+
+# Cirq gates that are a Qiskit rotation gate of angle pi * exponent, up to global phase,
+# keyed by (gate type, global shift of the rotation)
+_CIRQ_ROTATIONS = {
+    (cirq.XPowGate, -0.5): qiskit_gates.RXGate,
+    (cirq.YPowGate, -0.5): qiskit_gates.RYGate,
+    (cirq.ZPowGate, -0.5): qiskit_gates.RZGate,
+    (cirq.ZPowGate, 0.0): qiskit_gates.PhaseGate,
+    (cirq.CZPowGate, 0.0): qiskit_gates.CPhaseGate,
+    (cirq.XXPowGate, -0.5): qiskit_gates.RXXGate,
+    (cirq.YYPowGate, -0.5): qiskit_gates.RYYGate,
+    (cirq.ZZPowGate, -0.5): qiskit_gates.RZZGate,
+}
+
+_CIRQ_CONTROLLED_ROTATIONS = {
+    cirq.Rx: qiskit_gates.CRXGate,
+    cirq.Ry: qiskit_gates.CRYGate,
+    cirq.Rz: qiskit_gates.CRZGate,
+}
+
+
+def _rotation(gate: cirq.Gate) -> Tuple[Optional[Callable], float]:
+    """Returns the Qiskit rotation gate equal to ``gate`` up to global phase, and the global
+    shift of the Cirq gate it corresponds to, or None if ``gate`` is not a rotation."""
+    candidates = [
+        (rotation, shift)
+        for (gate_type, shift), rotation in _CIRQ_ROTATIONS.items()
+        if isinstance(gate, gate_type)
+    ]
+    for rotation, shift in candidates:
+        if gate.global_shift == shift:
+            return rotation, shift
+    return candidates[0] if candidates else (None, 0.0)
+
+
+def to_qiskit_parameterized(circuit: cirq.Circuit) -> QuantumCircuit:
+    """Returns a Qiskit circuit equivalent to the input, possibly parameterized, Cirq
+    circuit. Sympy symbols are mapped to Qiskit parameters of the same name.
+
+    Qubits are ordered as by :func:`~qbraid.transpiler.cirq_qiskit.to_qiskit`. The
+    qubits measured under each measurement key are written to a classical register.
+
+    Args:
+        circuit: Cirq circuit to convert to a Qiskit circuit.
+
+    Raises:
+        CircuitConversionError: If the circuit contains a parameterized operation
+            that has no Qiskit equivalent.
+
+    Returns:
+        Qiskit circuit equivalent to the input Cirq circuit.
+    """
+    all_qubits = sorted(circuit.all_qubits())
+    qubits = {qubit: len(all_qubits) - 1 - index for index, qubit in enumerate(all_qubits)}
+    qiskit_circuit = QuantumCircuit(len(all_qubits))
+    registers: Dict[str, ClassicalRegister] = {}
+    parameters: Dict[str, Parameter] = {}
+
+    for operation in circuit.all_operations():
+        gate = operation.gate
+        gate_qubits = [qubits[qubit] for qubit in operation.qubits]
+
+        if isinstance(gate, cirq.MeasurementGate):
+            key = cirq.measurement_key_name(gate)
+            if key not in registers:
+                name = re.sub(r"[^a-zA-Z0-9_]", "_", f"m_{key}")
+                registers[key] = ClassicalRegister(len(gate_qubits), name)
+                qiskit_circuit.add_register(registers[key])
+            qiskit_circuit.measure(gate_qubits, registers[key])
+            continue
+
+        if gate in _CIRQ_TO_QISKIT:
+            qiskit_circuit.append(_CIRQ_TO_QISKIT[gate](), gate_qubits)
+            continue
+
+        if isinstance(gate, cirq.IdentityGate):
+            for qubit in gate_qubits:
+                qiskit_circuit.id(qubit)
+            continue
+
+        if (
+            isinstance(gate, cirq.ControlledGate)
+            and type(gate.sub_gate) in _CIRQ_CONTROLLED_ROTATIONS
+        ):
+            if gate == cirq.ControlledGate(gate.sub_gate):
+                rotation = _CIRQ_CONTROLLED_ROTATIONS[type(gate.sub_gate)]
+                angle = _mul_pi(gate.sub_gate.exponent)
+                qiskit_circuit.append(rotation(_to_qiskit_expr(angle, parameters)), gate_qubits)
+                continue
+
+        rotation, shift = _rotation(gate)
+        if rotation is not None:
+            angle = _mul_pi(gate.exponent)
+            qiskit_circuit.append(rotation(_to_qiskit_expr(angle, parameters)), gate_qubits)
+            phase = angle * (gate.global_shift - shift)
+            if isinstance(phase, sympy.Basic) or phase != 0:
+                qiskit_circuit.global_phase += _to_qiskit_expr(phase, parameters)
+            continue
+
+        if cirq.is_parameterized(gate) or not cirq.has_unitary(gate):
+            raise CircuitConversionError(f"Unable to convert {operation} to Qiskit.")
+        # qiskit matrices are little-endian in the qubits of the instruction
+        qiskit_circuit.append(UnitaryGate(cirq.unitary(gate)), gate_qubits[::-1])
+
+    return qiskit_circuit
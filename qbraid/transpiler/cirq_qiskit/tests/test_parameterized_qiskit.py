@@ -0,0 +1,120 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for conversions between parameterized Cirq circuits and Qiskit circuits.
+
+"""
+import cirq
+import numpy as np
+import pytest
+import sympy
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from qbraid.interface import circuits_allclose
+from qbraid.transpiler.cirq_qiskit import (
+    from_qiskit,
+    from_qiskit_parameterized,
+    to_qiskit_parameterized,
+)
+from qbraid.transpiler.exceptions import CircuitConversionError
+
+
+def _qiskit_circuit():
+    alpha, beta = Parameter("alpha"), Parameter("beta")
+    circuit = QuantumCircuit(3)
+    circuit.h(0)
+    circuit.rx(alpha, 0)
+    circuit.cx(0, 1)
+    circuit.rz(2 * alpha + beta, 1)
+    circuit.p(beta, 2)
+    circuit.u(alpha, beta, 0.3, 2)
+    circuit.crx(beta, 2, 0)
+    circuit.rzz(alpha * beta, 0, 2)
+    circuit.ryy(-alpha, 1, 0)
+    circuit.cp(alpha / 2, 0, 1)
+    circuit.sx(1)
+    circuit.cy(1, 2)
+    circuit.ccx(0, 1, 2)
+    return circuit
+
+
+@pytest.mark.parametrize("values", [(0.4, 1.1), (-2.0, 0.3)])
+def test_from_qiskit_parameterized(values):
+    """Test that parameters are kept as sympy symbols, and that binding them matches
+    converting the bound circuit."""
+    qiskit_circuit = _qiskit_circuit()
+    cirq_circuit = from_qiskit_parameterized(qiskit_circuit)
+    assert cirq.parameter_names(cirq_circuit) == {"alpha", "beta"}
+
+    resolver = dict(zip(["alpha", "beta"], values))
+    bound_qiskit = qiskit_circuit.assign_parameters(
+        {param: resolver[param.name] for param in qiskit_circuit.parameters}
+    )
+    bound_cirq = cirq.resolve_parameters(cirq_circuit, resolver)
+    assert circuits_allclose(bound_qiskit, bound_cirq)
+    assert circuits_allclose(from_qiskit(bound_qiskit), bound_cirq)
+
+
+@pytest.mark.parametrize("value", [0.3, 1.7])
+def test_to_qiskit_parameterized(value):
+    """Test converting parameterized Cirq gates, including global phase."""
+    theta = sympy.Symbol("theta")
+    q0, q1 = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(
+        cirq.X(q0) ** theta,
+        cirq.Y(q1) ** (theta / 2),
+        cirq.Z(q0) ** 0.3,
+        cirq.rz(theta).on(q1),
+        cirq.CZ(q0, q1) ** theta,
+        cirq.XX(q0, q1) ** theta,
+        cirq.ControlledGate(cirq.ry(theta)).on(q1, q0),
+        cirq.CNOT(q0, q1) ** 0.5,
+        cirq.H(q0),
+        cirq.ZZPowGate(exponent=theta, global_shift=0.2).on(q0, q1),
+    )
+    qiskit_circuit = to_qiskit_parameterized(cirq_circuit)
+    assert [param.name for param in qiskit_circuit.parameters] == ["theta"]
+
+    bound_qiskit = qiskit_circuit.assign_parameters({qiskit_circuit.parameters[0]: value})
+    bound_cirq = cirq.resolve_parameters(cirq_circuit, {"theta": value})
+    assert circuits_allclose(bound_qiskit, bound_cirq, strict_gphase=True)
+
+
+def test_to_qiskit_parameterized_measurement():
+    """Test that measurements are written to a classical register per key."""
+    q0, q1 = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(
+        cirq.rx(sympy.Symbol("theta")).on(q0), cirq.measure(q0, q1, key="result")
+    )
+    qiskit_circuit = to_qiskit_parameterized(cirq_circuit)
+    assert [creg.name for creg in qiskit_circuit.cregs] == ["m_result"]
+    assert qiskit_circuit.count_ops()["measure"] == 2
+
+
+def test_round_trip_parameterized():
+    """Test that Qiskit parameters survive a round trip through Cirq."""
+    qiskit_circuit = _qiskit_circuit()
+    round_trip = to_qiskit_parameterized(from_qiskit_parameterized(qiskit_circuit))
+    assert [param.name for param in round_trip.parameters] == ["alpha", "beta"]
+    values = np.array([0.7, -0.2])
+    assert circuits_allclose(
+        qiskit_circuit.assign_parameters(dict(zip(qiskit_circuit.parameters, values))),
+        round_trip.assign_parameters(dict(zip(round_trip.parameters, values))),
+    )
+
+
+def test_unsupported_parameterized_gate():
+    """Test raising error for parameterized gates without a Qiskit equivalent."""
+    q0, q1 = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(cirq.ISWAP(q0, q1) ** sympy.Symbol("theta"))
+    with pytest.raises(CircuitConversionError):
+        to_qiskit_parameterized(cirq_circuit)
@@ -0,0 +1,360 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining the graph of quantum program conversions used by the transpiler.
+
+"""
+import hashlib
+import heapq
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+from pytket.circuit import Circuit as TKCircuit
+from pytket.circuit import Qubit
+from pytket.qasm import circuit_from_qasm_str, circuit_to_qasm_str
+from qiskit import QuantumCircuit, QuantumRegister
+
+from qbraid.exceptions import PackageValueError
+from qbraid.transpiler.cirq_braket import from_braket
+from qbraid.transpiler.cirq_pyquil import from_pyquil
+from qbraid.transpiler.cirq_pytket import from_pytket
+from qbraid.transpiler.cirq_qasm import from_qasm
+from qbraid.transpiler.cirq_qiskit import from_qiskit
+from qbraid.transpiler.conversions import _conversion_source, convert_from_cirq
+from qbraid.transpiler.exceptions import CircuitConversionError
+from qbraid.transpiler.profiling import record_stage
+
+if TYPE_CHECKING:
+    import qbraid
+
+
+class Conversion:
+    """A directed edge of the :class:`~qbraid.transpiler.ConversionGraph`.
+
+    Args:
+        source: Package of the input quantum program.
+        target: Package of the output quantum program.
+        conversion_func: Function mapping a ``source`` program to a ``target`` program.
+        weight: Relative cost of the conversion. Lower weights are preferred.
+
+    """
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        conversion_func: Callable[["qbraid.QPROGRAM"], "qbraid.QPROGRAM"],
+        weight: float = 1.0,
+    ):
+        if weight < 0:
+            raise ValueError(f"Conversion weight must be non-negative, got {weight}.")
+        self.source = source
+        self.target = target
+        self.conversion_func = conversion_func
+        self.weight = weight
+
+    def __call__(self, program: "qbraid.QPROGRAM") -> "qbraid.QPROGRAM":
+        with record_stage(f"{self.source}->{self.target}", program):
+            return self.conversion_func(program)
+
+    def __repr__(self) -> str:
+        return f"Conversion('{self.source}' -> '{self.target}', weight={self.weight})"
+
+
+# Qiskit orders qubits little-endian, so the bit order is reversed on the way to / from
+# QASM to match the convention of the Cirq-based conversions. Conversions to and from
+# QASM 2 also drop idle qubits as the Cirq-based conversions do, so that a program
+# converts to the same circuit whichever path is taken.
+
+
+def _drop_idle_qubits(circuit: QuantumCircuit) -> QuantumCircuit:
+    used = {qubit for instruction in circuit.data for qubit in instruction.qubits}
+    if len(used) == circuit.num_qubits:
+        return circuit
+    qreg = QuantumRegister(len(used), "q")
+    qubit_map = dict(zip([qubit for qubit in circuit.qubits if qubit in used], qreg))
+    compact = QuantumCircuit(qreg, *circuit.cregs, global_phase=circuit.global_phase)
+    for instruction in circuit.data:
+        qubits = [qubit_map[qubit] for qubit in instruction.qubits]
+        compact.append(instruction.operation, qubits, instruction.clbits)
+    return compact
+
+
+def _drop_blank_wires(circuit: TKCircuit) -> TKCircuit:
+    num_qubits = circuit.n_qubits
+    circuit.remove_blank_wires()
+    if circuit.n_qubits < num_qubits:
+        circuit.rename_units({qubit: Qubit("q", i) for i, qubit in enumerate(circuit.qubits)})
+    return circuit
+
+
+def _qiskit_to_qasm2(circuit: QuantumCircuit) -> str:
+    return _drop_idle_qubits(circuit.reverse_bits()).qasm()
+
+
+def _qasm2_to_qiskit(qasm: str) -> QuantumCircuit:
+    return _drop_idle_qubits(QuantumCircuit.from_qasm_str(qasm).reverse_bits())
+
+
+def _pytket_to_qasm2(circuit: TKCircuit) -> str:
+    return circuit_to_qasm_str(_drop_blank_wires(circuit.copy()))
+
+
+def _qasm2_to_pytket(qasm: str) -> TKCircuit:
+    return _drop_blank_wires(circuit_from_qasm_str(qasm))
+
+
+def _from_cirq(frontend: str) -> Callable[["qbraid.QPROGRAM"], "qbraid.QPROGRAM"]:
+    def _convert(circuit):
+        return convert_from_cirq(circuit, frontend)
+
+    return _convert
+
+
+# Hand-assigned relative costs, not measurements. Conversions that go through a
+# framework's own OpenQASM 2 exporter / importer are assumed cheap compared to building
+# and re-serializing a Cirq circuit, so package pairs that both speak QASM 2 skip Cirq.
+# tests/benchmarking/transpile_benchmark.py times each package pair and can be used to
+# revisit them.
+DEFAULT_CONVERSIONS: List[Tuple[str, str, Callable, float]] = [
+    ("braket", "cirq", from_braket, 1.0),
+    ("qiskit", "cirq", from_qiskit, 3.0),
+    ("pyquil", "cirq", from_pyquil, 3.0),
+    ("pytket", "cirq", from_pytket, 3.0),
+    ("qasm2", "cirq", from_qasm, 3.0),
+    ("cirq", "braket", _from_cirq("braket"), 2.0),
+    ("cirq", "qiskit", _from_cirq("qiskit"), 4.0),
+    ("cirq", "pyquil", _from_cirq("pyquil"), 3.0),
+    ("cirq", "pytket", _from_cirq("pytket"), 3.0),
+    ("cirq", "qasm2", _from_cirq("qasm2"), 1.0),
+    ("qiskit", "qasm2", _qiskit_to_qasm2, 0.5),
+    ("qasm2", "qiskit", _qasm2_to_qiskit, 3.0),
+    ("pytket", "qasm2", _pytket_to_qasm2, 1.0),
+    ("qasm2", "pytket", _qasm2_to_pytket, 1.0),
+]
+
+
+class ConversionGraph:
+    """Directed, weighted graph whose nodes are quantum program packages and whose
+    edges are registered conversion functions. Programs are converted along the
+    cheapest path between two packages, falling back to the next cheapest path
+    if a conversion along the way fails.
+
+    Args:
+        conversions: Optional list of ``(source, target, conversion_func, weight)``
+            tuples. Defaults to :data:`DEFAULT_CONVERSIONS`.
+
+    """
+
+    def __init__(self, conversions: Optional[List[Tuple[str, str, Callable, float]]] = None):
+        self._edges: Dict[str, Dict[str, Conversion]] = {}
+        self._fingerprint: Optional[str] = None
+        conversions = DEFAULT_CONVERSIONS if conversions is None else conversions
+        for source, target, conversion_func, weight in conversions:
+            self.add_conversion(source, target, conversion_func, weight)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Return the packages that appear in the graph."""
+        nodes = set(self._edges)
+        for targets in self._edges.values():
+            nodes.update(targets)
+        return sorted(nodes)
+
+    @property
+    def conversions(self) -> List[Conversion]:
+        """Return all registered conversions."""
+        return [edge for targets in self._edges.values() for edge in targets.values()]
+
+    def add_conversion(
+        self,
+        source: str,
+        target: str,
+        conversion_func: Callable[["qbraid.QPROGRAM"], "qbraid.QPROGRAM"],
+        weight: float = 1.0,
+    ) -> None:
+        """Register a conversion from ``source`` to ``target``, replacing any existing one.
+
+        Args:
+            source: Package of the input quantum program.
+            target: Package of the output quantum program.
+            conversion_func: Function mapping a ``source`` program to a ``target`` program.
+            weight: Relative cost of the conversion. Lower weights are preferred.
+
+        """
+        self._edges.setdefault(source, {})[target] = Conversion(
+            source, target, conversion_func, weight
+        )
+        self._fingerprint = None
+
+    def remove_conversion(self, source: str, target: str) -> None:
+        """Remove the conversion from ``source`` to ``target``.
+
+        Raises:
+            ValueError: If no such conversion is registered.
+
+        """
+        try:
+            del self._edges[source][target]
+        except KeyError as err:
+            raise ValueError(f"No conversion registered from {source} to {target}.") from err
+        self._fingerprint = None
+
+    def fingerprint(self) -> str:
+        """Return a hash of the registered conversions and their weights. Conversion
+        functions are identified by their module and qualified name, so the hash is
+        stable across processes."""
+        if self._fingerprint is None:
+            edges = sorted(
+                (
+                    edge.source,
+                    edge.target,
+                    getattr(edge.conversion_func, "__module__", ""),
+                    getattr(edge.conversion_func, "__qualname__", repr(edge.conversion_func)),
+                    repr(edge.weight),
+                )
+                for edge in self.conversions
+            )
+            self._fingerprint = hashlib.sha256(repr(edges).encode()).hexdigest()
+        return self._fingerprint
+
+    def has_conversion(self, source: str, target: str) -> bool:
+        """Return True if there is a direct conversion from ``source`` to ``target``."""
+        return target in self._edges.get(source, {})
+
+    def path_cost(self, path: List[str]) -> float:
+        """Return the total weight of the conversions along ``path``."""
+        return sum(self._edges[u][v].weight for u, v in zip(path[:-1], path[1:]))
+
+    def find_shortest_path(self, source: str, target: str) -> List[str]:
+        """Return the cheapest sequence of packages leading from ``source`` to ``target``.
+
+        Raises:
+            PackageValueError: If ``target`` cannot be reached from ``source``.
+
+        """
+        dist = {source: 0.0}
+        prev: Dict[str, str] = {}
+        queue = [(0.0, source)]
+        visited: Set[str] = set()
+        while queue:
+            cost, node = heapq.heappop(queue)
+            if node in visited:
+                continue
+            if node == target:
+                path = [target]
+                while path[-1] != source:
+                    path.append(prev[path[-1]])
+                return path[::-1]
+            visited.add(node)
+            for nbr, edge in self._edges.get(node, {}).items():
+                new_cost = cost + edge.weight
+                if new_cost < dist.get(nbr, float("inf")):
+                    dist[nbr] = new_cost
+                    prev[nbr] = node
+                    heapq.heappush(queue, (new_cost, nbr))
+        raise PackageValueError(target)
+
+    def find_paths(self, source: str, target: str) -> List[List[str]]:
+        """Return every simple path from ``source`` to ``target``, cheapest first."""
+        paths = []
+        stack = [[source]]
+        while stack:
+            path = stack.pop()
+            node = path[-1]
+            if node == target:
+                paths.append(path)
+                continue
+            for nbr in self._edges.get(node, {}):
+                if nbr not in path:
+                    stack.append(path + [nbr])
+        return sorted(paths, key=lambda p: (self.path_cost(p), len(p)))
+
+    def convert(
+        self,
+        program: "qbraid.QPROGRAM",
+        source: str,
+        target: str,
+        intermediates: Optional[Dict[str, "qbraid.QPROGRAM"]] = None,
+    ) -> "qbraid.QPROGRAM":
+        """Convert ``program`` from package ``source`` to package ``target``.
+
+        Paths are attempted cheapest first. Intermediate programs are reused between
+        attempts, and any path through a conversion that already failed is skipped.
+
+        Args:
+            program (:data:`~qbraid.QPROGRAM`): The program to convert.
+            source: Package of ``program``.
+            target: Package to convert to.
+            intermediates: Optional mapping of packages to equivalent representations of
+                ``program`` that are already available. Conversions into these packages
+                are skipped and cost nothing when ranking paths. Programs produced while
+                converting are added to this mapping, so that callers may reuse them.
+
+        Raises:
+            PackageValueError: If ``target`` cannot be reached from ``source``.
+            CircuitConversionError: If every path from ``source`` to ``target`` failed.
+
+        """
+        if source == target:
+            return program
+
+        reached = intermediates if intermediates is not None else {}
+        reached[source] = program
+        if target in reached:
+            return reached[target]
+
+        paths = self.find_paths(source, target)
+        if len(paths) == 0:
+            raise PackageValueError(target)
+        if len(reached) > 1:
+            paths.sort(
+                key=lambda p: sum(
+                    self._edges[u][v].weight for u, v in zip(p[:-1], p[1:]) if v not in reached
+                )
+            )
+
+        failed: Set[Tuple[str, str]] = set()
+        last_err: Optional[Exception] = None
+
+        token = _conversion_source.set(source)
+        try:
+            for path in paths:
+                steps = list(zip(path[:-1], path[1:]))
+                if any(step in failed for step in steps):
+                    continue
+                for u, v in steps:
+                    if v in reached:
+                        continue
+                    try:
+                        reached[v] = self._edges[u][v](reached[u])
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        failed.add((u, v))
+                        last_err = err
+                        break
+                if target in reached:
+                    return reached[target]
+        finally:
+            _conversion_source.reset(token)
+
+        raise CircuitConversionError(
+            f"Quantum program could not be converted from {source} to {target}."
+        ) from last_err
+
+
+_default_graph: Optional[ConversionGraph] = None
+
+
+def get_conversion_graph() -> ConversionGraph:
+    """Return the conversion graph shared by all qBraid program wrappers."""
+    global _default_graph  # pylint: disable=global-statement
+    if _default_graph is None:
+        _default_graph = ConversionGraph()
+    return _default_graph
@@ -14,12 +14,17 @@
 Module containing functions for converting to/from Cirq's circuit representation.
 
 """
-from typing import TYPE_CHECKING, Tuple
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from cirq import Circuit
-from cirq.contrib.qasm_import import circuit_from_qasm
+import cirq
+from cirq import Circuit, LineQubit
 
-from qbraid.exceptions import PackageValueError, ProgramTypeError
+from qbraid._qprogram import get_program_type
+from qbraid.exceptions import PackageValueError
 from qbraid.transpiler.cirq_braket import from_braket, to_braket
 from qbraid.transpiler.cirq_pyquil import from_pyquil, to_pyquil
 from qbraid.transpiler.cirq_pytket import from_pytket, to_pytket
@@ -30,6 +35,20 @@ from qbraid.transpiler.exceptions import CircuitConversionError
 if TYPE_CHECKING:
     import qbraid
 
+_TO_CIRQ_FUNCTIONS = {
+    "braket": from_braket,
+    "pyquil": from_pyquil,
+    "pytket": from_pytket,
+    "qiskit": from_qiskit,
+}
+
+# Package of the program that the Cirq circuit being converted originated from. Set by
+# the conversion graph so that decomposition fallbacks can be attributed to a source.
+_conversion_source: ContextVar[str] = ContextVar("conversion_source", default="cirq")
+
+_fallback_counts: Counter = Counter()
+_fallback_lock = threading.Lock()
+
 
 def convert_to_cirq(program: "qbraid.QPROGRAM") -> Tuple[Circuit, str]:
     """Converts any valid input quantum program to a Cirq circuit.
@@ -47,45 +66,22 @@ def convert_to_cirq(program: "qbraid.QPROGRAM") -> Tuple[Circuit, str]:
     """
     if isinstance(program, str):
         try:
-            from_qasm(program)
-            package = "qasm2"
+            return from_qasm(program), "qasm2"
         except Exception as err:
             raise CircuitConversionError("Invalid OpenQASM 2.0 program.") from err
-    else:
-        try:
-            package = program.__module__
-        except AttributeError as err:
-            raise ProgramTypeError(program) from err
-
-    try:
-        if "qiskit" in package:
-            return from_qiskit(program), "qiskit"
 
-        if "pyquil" in package:
-            return from_pyquil(program), "pyquil"
-
-        if "braket" in package:
-            return from_braket(program), "braket"
-
-        if "pytket" in package:
-            return from_pytket(program), "pytket"
-
-        if "qasm2" in package:
-            return from_qasm(program), "qasm2"
-
-        if "qasm3" in package:
-            raise NotImplementedError
+    package = get_program_type(program)
 
-        if isinstance(program, Circuit):
-            return program, "cirq"
+    if package == "cirq":
+        return program, "cirq"
 
+    try:
+        return _TO_CIRQ_FUNCTIONS[package](program), package
     except Exception as err:
         raise CircuitConversionError(
             "Quantum program could not be converted to a Cirq circuit."
         ) from err
 
-    raise ProgramTypeError(program)
-
 
 def _convert_from_cirq(circuit: Circuit, frontend: str) -> "qbraid.QPROGRAM":
     """Converts a Cirq circuit to a type specified by the conversion type.
@@ -131,9 +127,141 @@ def _convert_from_cirq(circuit: Circuit, frontend: str) -> "qbraid.QPROGRAM":
     raise PackageValueError(frontend)
 
 
+def _angle_class(value: "cirq.TParamVal") -> object:
+    """Returns ``value`` if it is a multiple of a quarter turn, which converters commonly map
+    to named gates (e.g. X, S, T), and otherwise a class shared by all such angles."""
+    if cirq.is_parameterized(value):
+        return "symbolic"
+    if float(value * 4).is_integer():
+        return float(value)
+    return "generic"
+
+
+class _GateKey:
+    """Wraps a gate for the support caches. Rotation-like gates are keyed on their type,
+    number of qubits, global shift and the class of their exponents, so that rotations by
+    arbitrary angles share a cache entry. Other gates are keyed on their value."""
+
+    __slots__ = ("gate", "key")
+
+    def __init__(self, gate: cirq.Gate):
+        self.gate = gate
+        if isinstance(gate, (cirq.EigenGate, cirq.PhasedXPowGate)):
+            self.key = (
+                type(gate),
+                cirq.num_qubits(gate),
+                getattr(gate, "global_shift", 0),
+                _angle_class(gate.exponent),
+                _angle_class(getattr(gate, "phase_exponent", 0)),
+            )
+        else:
+            self.key = gate
+        hash(self.key)  # raises TypeError for unhashable gates
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _GateKey) and self.key == other.key
+
+
+def _gate_supported(gate: cirq.Gate, frontend: str) -> bool:
+    """Returns True if a single application of ``gate`` can be converted to ``frontend``."""
+    try:
+        return _gate_supported_cached(_GateKey(gate), frontend)
+    except TypeError:  # unhashable gate
+        return _check_gate_supported(gate, frontend)
+
+
+@lru_cache(maxsize=1024)
+def _gate_supported_cached(gate_key: _GateKey, frontend: str) -> bool:
+    return _check_gate_supported(gate_key.gate, frontend)
+
+
+def _check_gate_supported(gate: cirq.Gate, frontend: str) -> bool:
+    qubits = LineQubit.range(cirq.num_qubits(gate))
+    try:
+        _convert_from_cirq(Circuit(gate.on(*qubits)), frontend)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    return True
+
+
+def _gate_has_qasm(gate: cirq.Gate) -> bool:
+    """Returns True if ``gate`` has a direct OpenQASM 2 representation."""
+    try:
+        return _gate_has_qasm_cached(_GateKey(gate))
+    except TypeError:  # unhashable gate
+        return _check_gate_has_qasm(gate)
+
+
+@lru_cache(maxsize=1024)
+def _gate_has_qasm_cached(gate_key: _GateKey) -> bool:
+    return _check_gate_has_qasm(gate_key.gate)
+
+
+def _check_gate_has_qasm(gate: cirq.Gate) -> bool:
+    qubits = LineQubit.range(cirq.num_qubits(gate))
+    args = cirq.QasmArgs(qubit_id_map={qubit: f"q[{qubit.x}]" for qubit in qubits})
+    try:
+        return cirq.qasm(gate.on(*qubits), args=args, default=None) is not None
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+def _decompose_unsupported(circuit: Circuit, frontend: str) -> Circuit:
+    """Decomposes the operations of ``circuit`` that cannot be converted to ``frontend``.
+
+    Supported operations are left untouched. Unsupported operations are decomposed,
+    recursively, into operations that are both supported by ``frontend`` and have an
+    OpenQASM 2 representation, which is the gate set the frontend converters are tested
+    against. Qubits that an operation acts on but its decomposition does not (e.g. for
+    multi-qubit identities) are kept with identity gates. Qubits that are not all
+    ``LineQubit`` are relabeled to ``LineQubit`` in sorted order.
+
+    """
+
+    def keep(op: cirq.Operation) -> bool:
+        return (
+            op.gate is not None and _gate_has_qasm(op.gate) and _gate_supported(op.gate, frontend)
+        )
+
+    def map_func(op: cirq.Operation, _: int) -> cirq.OP_TREE:
+        if op.gate is not None and _gate_supported(op.gate, frontend):
+            return op
+        decomposed = cirq.decompose(op, keep=keep, on_stuck_raise=None)
+        acted_on = {qubit for sub_op in decomposed for qubit in sub_op.qubits}
+        idle = [qubit for qubit in op.qubits if qubit not in acted_on]
+        return decomposed + [cirq.I(qubit) for qubit in idle]
+
+    decomposed_circuit = cirq.map_operations_and_unroll(circuit, map_func)
+    qubits = sorted(decomposed_circuit.all_qubits())
+    if all(isinstance(qubit, LineQubit) for qubit in qubits):
+        return decomposed_circuit
+    qubit_map = dict(zip(qubits, LineQubit.range(len(qubits))))
+    return decomposed_circuit.transform_qubits(lambda qubit: qubit_map[qubit])
+
+
+def get_fallback_counts() -> Dict[Tuple[str, str], int]:
+    """Returns the number of times :func:`convert_from_cirq` had to decompose unsupported
+    operations, keyed by ``(source, target)`` package pair. The source is the package of the
+    program that was converted to Cirq, or "cirq" if the conversion started from Cirq."""
+    with _fallback_lock:
+        return dict(_fallback_counts)
+
+
+def reset_fallback_counts() -> None:
+    """Resets the counts returned by :func:`get_fallback_counts`."""
+    with _fallback_lock:
+        _fallback_counts.clear()
+
+
 def convert_from_cirq(circuit: Circuit, frontend: str) -> "qbraid.QPROGRAM":
     """Converts a Cirq circuit to a type specified by the conversion type.
 
+    If the circuit cannot be converted directly, the operations that ``frontend`` does
+    not support are decomposed and the conversion is retried.
+
     Args:
         circuit: Cirq circuit to convert.
         frontend: String specifier for the converted circuit type.
@@ -148,5 +276,7 @@ def convert_from_cirq(circuit: Circuit, frontend: str) -> "qbraid.QPROGRAM":
     try:
         return _convert_from_cirq(circuit, frontend)
     except CircuitConversionError:
-        circuit_flat = circuit_from_qasm(circuit.to_qasm())  # flatten circuit
-        return _convert_from_cirq(circuit_flat, frontend)
+        with _fallback_lock:
+            _fallback_counts[(_conversion_source.get(), frontend)] += 1
+        circuit_decomposed = _decompose_unsupported(circuit, frontend)
+        return _convert_from_cirq(circuit_decomposed, frontend)
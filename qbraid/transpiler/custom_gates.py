@@ -32,6 +32,8 @@ from cirq import (
     value,
 )
 
+from qbraid.transpiler.profiling import profiled
+
 
 class U2Gate(Gate):
     """A single qubit gate for rotations about the
@@ -206,5 +208,6 @@ def _map_zpow(op: Operation, _: int) -> OP_TREE:
         yield op
 
 
+@profiled("_map_zpow_and_unroll")
 def _map_zpow_and_unroll(circuit: Circuit) -> Circuit:
     return cirq.map_operations_and_unroll(circuit, _map_zpow)
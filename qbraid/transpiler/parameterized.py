@@ -0,0 +1,301 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module for transpiling parameterized quantum programs once, and binding their parameters
+to numeric values many times.
+
+"""
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Sequence, Union
+
+import cirq
+import numpy as np
+import sympy
+from braket.circuits import Circuit as BKCircuit
+from braket.circuits import FreeParameterExpression
+from braket.circuits import Instruction as BKInstruction
+from qiskit import QuantumCircuit
+
+from qbraid._qprogram import QPROGRAM_LIBS
+from qbraid.exceptions import PackageValueError
+from qbraid.transpiler.cirq_braket import from_braket, to_braket
+from qbraid.transpiler.cirq_qiskit import from_qiskit_parameterized, to_qiskit_parameterized
+from qbraid.transpiler.conversion_graph import get_conversion_graph
+from qbraid.transpiler.exceptions import CircuitConversionError
+
+if TYPE_CHECKING:
+    import qbraid
+
+ParameterValues = Union[Sequence[float], np.ndarray, Mapping[str, float]]
+
+# Parameter names of a program, in the order in which values are given. Qiskit sorts
+# parameters itself, e.g. ParameterVector elements by index.
+_PARAMETER_NAMES: Dict[str, Callable[["qbraid.QPROGRAM"], List[str]]] = {
+    "braket": lambda circuit: sorted(param.name for param in circuit.parameters),
+    "cirq": lambda circuit: sorted(cirq.parameter_names(circuit)),
+    "pytket": lambda circuit: sorted(str(symbol) for symbol in circuit.free_symbols()),
+    "qiskit": lambda circuit: [param.name for param in circuit.parameters],
+}
+
+# Symbol-preserving conversions to and from Cirq, in which parameters are sympy symbols.
+_TO_CIRQ = {
+    "braket": from_braket,
+    "cirq": lambda circuit: circuit,
+    "qiskit": from_qiskit_parameterized,
+}
+
+_FROM_CIRQ = {
+    "braket": to_braket,
+    "cirq": lambda circuit: circuit,
+    "qiskit": to_qiskit_parameterized,
+}
+
+BindFunction = Callable[[Dict[str, float]], "qbraid.QPROGRAM"]
+
+
+def _braket_binder(circuit: BKCircuit) -> BindFunction:
+    """Returns a function binding the parameters of ``circuit``. The angle of each
+    parameterized gate is compiled to a function once, so that binding does not go
+    through sympy substitution."""
+    compiled = []
+    for instruction in circuit.instructions:
+        angle = getattr(instruction.operator, "angle", None)
+        if not isinstance(angle, FreeParameterExpression):
+            if any(
+                isinstance(param, FreeParameterExpression)
+                for param in getattr(instruction.operator, "parameters", [])
+            ):
+                # gates of several angles are left to Braket
+                return partial(_bind_braket_circuit, circuit)
+            compiled.append((instruction, None, []))
+            continue
+        symbols = sorted(angle.expression.free_symbols, key=str)
+        angle_func = sympy.lambdify(symbols, angle.expression, modules="math")
+        compiled.append((instruction, angle_func, [str(symbol) for symbol in symbols]))
+
+    def bind(values: Dict[str, float]) -> BKCircuit:
+        bound = BKCircuit()
+        for instruction, angle_func, names in compiled:
+            if angle_func is not None:
+                gate = type(instruction.operator)(angle_func(*[values[name] for name in names]))
+                instruction = BKInstruction(gate, instruction.target)
+            bound.add_instruction(instruction)
+        for result_type in circuit.result_types:
+            bound.add_result_type(result_type)
+        return bound
+
+    return bind
+
+
+def _bind_braket_circuit(circuit: BKCircuit, values: Dict[str, float]) -> BKCircuit:
+    return circuit.make_bound_circuit(values, strict=False)
+
+
+def _bind_qiskit_circuit(circuit: QuantumCircuit, values: Dict[str, float]) -> QuantumCircuit:
+    return circuit.assign_parameters({param: values[param.name] for param in circuit.parameters})
+
+
+def _bind_pytket_circuit(circuit, values: Dict[str, float]):
+    bound = circuit.copy()
+    bound.symbol_substitution({sympy.Symbol(name): value for name, value in values.items()})
+    return bound
+
+
+# Functions returning a function that binds the parameters of the given program
+_BINDERS: Dict[str, Callable[["qbraid.QPROGRAM"], BindFunction]] = {
+    "braket": _braket_binder,
+    "cirq": lambda circuit: partial(cirq.resolve_parameters, circuit),
+    "pytket": lambda circuit: partial(_bind_pytket_circuit, circuit),
+    "qiskit": lambda circuit: partial(_bind_qiskit_circuit, circuit),
+}
+
+
+def _unparameterized_binder(program: "qbraid.QPROGRAM") -> BindFunction:
+    return lambda _: program
+
+
+def _bind_and_convert(
+    bind_func: BindFunction, source: str, target: str, values: Dict[str, float]
+) -> "qbraid.QPROGRAM":
+    return get_conversion_graph().convert(bind_func(values), source, target)
+
+
+class ParameterizedProgram:
+    """A quantum program transpiled once with its parameters kept symbolic, whose parameters
+    can then be bound to numeric values any number of times without transpiling it again.
+
+    Args:
+        template: The parameterized program that parameter values are substituted in.
+        package: Package of the programs obtained by binding parameter values.
+        parameters: Names of the parameters, in the order in which values are given to
+            :meth:`~qbraid.transpiler.ParameterizedProgram.bind`.
+        bind_func: Function mapping a dictionary of parameter values, keyed by name, to
+            a program of package ``package``.
+
+    """
+
+    def __init__(
+        self,
+        template: "qbraid.QPROGRAM",
+        package: str,
+        parameters: List[str],
+        bind_func: BindFunction,
+    ):
+        self._template = template
+        self._package = package
+        self._parameters = list(parameters)
+        self._bind_func = bind_func
+
+    @property
+    def template(self) -> "qbraid.QPROGRAM":
+        """Return the parameterized program that parameter values are substituted in.
+
+        This is a program of package :attr:`~qbraid.transpiler.ParameterizedProgram.package`
+        if that package has symbolic parameters supported by the transpiler. Otherwise, it
+        is either the source program or its Cirq representation, whichever leaves the
+        cheaper conversion to run after binding.
+
+        """
+        return self._template
+
+    @property
+    def package(self) -> str:
+        """Return the package of the programs obtained by binding parameter values."""
+        return self._package
+
+    @property
+    def parameters(self) -> List[str]:
+        """Return the parameter names, in the order in which values are given."""
+        return list(self._parameters)
+
+    def _values_by_name(self, values: ParameterValues) -> Dict[str, float]:
+        if isinstance(values, Mapping):
+            missing = [name for name in self._parameters if name not in values]
+            if missing:
+                raise ValueError(f"Missing values for parameters {missing}.")
+            return {name: float(values[name]) for name in self._parameters}
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(self._parameters),):
+            raise ValueError(
+                f"Expected {len(self._parameters)} parameter values, got shape {values.shape}."
+            )
+        return dict(zip(self._parameters, values.tolist()))
+
+    def bind(self, values: ParameterValues) -> "qbraid.QPROGRAM":
+        """Return the program with its parameters bound to ``values``.
+
+        Args:
+            values: Parameter values, either in the order of
+                :attr:`~qbraid.transpiler.ParameterizedProgram.parameters`, or keyed
+                by parameter name.
+
+        Raises:
+            ValueError: If the number of values does not match the number of parameters.
+
+        Returns:
+            :data:`~qbraid.QPROGRAM`: Program of package
+            :attr:`~qbraid.transpiler.ParameterizedProgram.package`.
+
+        """
+        return self._bind_func(self._values_by_name(values))
+
+    def bind_batch(
+        self, values: Union[np.ndarray, Sequence[Sequence[float]]]
+    ) -> List["qbraid.QPROGRAM"]:
+        """Return one program for each row of parameter values.
+
+        Args:
+            values: Array of shape ``(num_programs, num_parameters)``, with columns in the
+                order of :attr:`~qbraid.transpiler.ParameterizedProgram.parameters`.
+
+        Raises:
+            ValueError: If ``values`` is not of shape ``(num_programs, num_parameters)``.
+
+        Returns:
+            List of :data:`~qbraid.QPROGRAM`, in the order of the rows of ``values``.
+
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != len(self._parameters):
+            raise ValueError(
+                f"Expected an array of shape (num_programs, {len(self._parameters)}), "
+                f"got shape {values.shape}."
+            )
+        return [self._bind_func(dict(zip(self._parameters, row))) for row in values.tolist()]
+
+    def __repr__(self) -> str:
+        return f"ParameterizedProgram(package='{self._package}', parameters={self._parameters})"
+
+
+def transpile_parameterized(
+    program: "qbraid.QPROGRAM", source: str, target: str
+) -> ParameterizedProgram:
+    """Transpile ``program`` from package ``source`` to package ``target`` once, keeping its
+    parameters symbolic, so that it can then be bound to many parameter values.
+
+    Qiskit, Cirq and Braket programs are converted through Cirq with their parameters kept
+    as ``Parameter``'s, sympy symbols and ``FreeParameter``'s respectively. If ``target``
+    is one of these packages, binding only substitutes values in the converted program.
+    Other packages have no symbolic parameters that the transpiler supports, so values are
+    substituted in the Cirq circuit, which is then converted to ``target``. If the cheapest
+    conversion from ``source`` to ``target`` skips Cirq (e.g. from Qiskit to OpenQASM 2),
+    values are instead substituted in ``program``, which is then converted along it.
+
+    Programs of other source packages must not be parameterized, unless ``source`` and
+    ``target`` are both ``"pytket"``. Gates may be decomposed differently than by
+    :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile` of the bound program, and
+    the results may differ from it by a global phase.
+
+    Args:
+        program (:data:`~qbraid.QPROGRAM`): The program to transpile.
+        source: Package of ``program``.
+        target: Package to convert to. Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+
+    Raises:
+        PackageValueError: If ``target`` is not one of :data:`~qbraid.QPROGRAM_LIBS`.
+        CircuitConversionError: If the program could not be converted with its
+            parameters kept symbolic.
+
+    Returns:
+        The :class:`~qbraid.transpiler.ParameterizedProgram` to bind values to.
+
+    """
+    if target not in QPROGRAM_LIBS:
+        raise PackageValueError(target)
+
+    parameters = _PARAMETER_NAMES[source](program) if source in _PARAMETER_NAMES else []
+    binder = _BINDERS.get(source, _unparameterized_binder)
+
+    if source == target:
+        return ParameterizedProgram(program, target, parameters, binder(program))
+
+    graph = get_conversion_graph()
+    if target not in _FROM_CIRQ and "cirq" not in graph.find_shortest_path(source, target):
+        bind_func = partial(_bind_and_convert, binder(program), source, target)
+        return ParameterizedProgram(program, target, parameters, bind_func)
+
+    try:
+        if source in _TO_CIRQ:
+            circuit = _TO_CIRQ[source](program)
+        else:
+            circuit = graph.convert(program, source, "cirq")
+        if target in _FROM_CIRQ:
+            template = _FROM_CIRQ[target](circuit)
+            bind_func = _BINDERS[target](template)
+        else:
+            template = circuit
+            bind_func = partial(_bind_and_convert, _BINDERS["cirq"](circuit), "cirq", target)
+    except Exception as err:
+        raise CircuitConversionError(
+            f"Parameterized program could not be converted from {source} to {target}."
+        ) from err
+
+    return ParameterizedProgram(template, target, parameters, bind_func)
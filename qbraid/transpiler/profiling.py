@@ -0,0 +1,163 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing opt-in profiling of the stages of the transpile pipeline.
+
+"""
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Profiles that are recording in the current context. Empty unless inside ``profile()``.
+_active_profiles: ContextVar[Tuple["TranspileProfile", ...]] = ContextVar(
+    "active_profiles", default=()
+)
+
+
+def _program_size(program: Any) -> Optional[int]:
+    """Returns the size of a stage input: the number of characters of a string, or the
+    number of operations / instructions of a circuit. Returns None if unknown."""
+    if program is None:
+        return None
+    if isinstance(program, str):
+        return len(program)
+    if hasattr(program, "all_operations"):
+        return sum(1 for _ in program.all_operations())
+    if hasattr(program, "instructions"):
+        return len(program.instructions)
+    if hasattr(program, "n_gates"):
+        return program.n_gates
+    try:
+        return len(program)
+    except TypeError:
+        return None
+
+
+class TranspileProfile:
+    """Wall time, call counts and input sizes recorded for each stage of the transpile
+    pipeline, and for each edge of the :class:`~qbraid.transpiler.ConversionGraph`
+    (recorded as e.g. ``"qiskit->qasm2"``).
+
+    Times are inclusive, i.e. the time of a stage includes the time of the stages it
+    calls, so times of nested stages should not be summed.
+
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stages(self) -> List[str]:
+        """Return the names of the stages recorded so far, in order of first call."""
+        with self._lock:
+            return list(self._stages)
+
+    def record(self, stage: str, elapsed: float, size: Optional[int] = None) -> None:
+        """Record a call to ``stage`` that took ``elapsed`` seconds on an input of ``size``."""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = {"calls": 0, "total_time": 0.0, "max_time": 0.0, "total_size": 0}
+                self._stages[stage] = stats
+            stats["calls"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            if size is not None:
+                stats["total_size"] += size
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return the recorded statistics, keyed by stage.
+
+        Each entry holds the number of ``calls``, the ``total_time``, ``mean_time`` and
+        ``max_time`` in seconds, and the ``total_size`` of the inputs.
+
+        """
+        with self._lock:
+            return {
+                stage: {**stats, "mean_time": stats["total_time"] / stats["calls"]}
+                for stage, stats in self._stages.items()
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """Return the recorded statistics as a JSON string. Keyword arguments are passed
+        to :func:`json.dumps`."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return f"TranspileProfile(stages={self.stages})"
+
+
+@contextmanager
+def profile() -> Iterator[TranspileProfile]:
+    """Context manager recording the stages of every transpilation run inside of it.
+
+    .. code-block:: python
+
+        with qbraid.transpiler.profile() as prof:
+            circuit_wrapper(circuit).transpile("braket")
+
+        print(prof.to_json(indent=2))
+
+    Profiling is scoped to the current thread (or asyncio task), and does not record
+    conversions run in other processes, e.g. by :func:`~qbraid.transpiler.transpile_batch`.
+    Profiles may be nested, in which case stages are recorded in each of them.
+
+    Yields:
+        The :class:`~qbraid.transpiler.profiling.TranspileProfile` being recorded.
+
+    """
+    prof = TranspileProfile()
+    token = _active_profiles.set(_active_profiles.get() + (prof,))
+    try:
+        yield prof
+    finally:
+        _active_profiles.reset(token)
+
+
+@contextmanager
+def record_stage(stage: str, program: Any = None) -> Iterator[None]:
+    """Context manager recording the enclosed block as a call to ``stage`` with input
+    ``program``, if a profile is active."""
+    profiles = _active_profiles.get()
+    if not profiles:
+        yield
+        return
+    size = _program_size(program)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        for prof in profiles:
+            prof.record(stage, elapsed, size)
+
+
+def profiled(stage: str, arg: int = 0) -> Callable[[Callable], Callable]:
+    """Decorator recording calls to the decorated function as calls to ``stage``, if a
+    profile is active. The input size is taken from the positional argument at index
+    ``arg``."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active_profiles.get():
+                return func(*args, **kwargs)
+            with record_stage(stage, args[arg] if len(args) > arg else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
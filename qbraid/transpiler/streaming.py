@@ -0,0 +1,323 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module for converting OpenQASM 2 programs to other packages statement by statement,
+without holding the whole program, or intermediate copies of it, in memory.
+
+"""
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, List, Union
+
+from braket.circuits import Circuit as BKCircuit
+from cirq import Circuit, LineQubit, NamedQubit
+from cirq_rigetti.quil_output import QuilOutput
+from pyquil import Program
+from pytket.qasm import circuit_from_qasm_str
+from qiskit import QuantumCircuit
+
+from qbraid._qprogram import QPROGRAM_LIBS
+from qbraid.exceptions import PackageValueError
+from qbraid.transpiler.cirq_braket.convert_to_braket import _to_braket_instruction
+from qbraid.transpiler.cirq_qasm.qasm_conversions import parse_qasm
+from qbraid.transpiler.exceptions import QasmError
+
+if TYPE_CHECKING:
+    import qbraid
+
+QasmSource = Union[str, os.PathLike, IO[str], Iterable[str]]
+
+_DELIMITERS = re.compile(r"[;{}]")
+_KEYWORD = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+_HEADER_KEYWORDS = {"OPENQASM", "include", "qreg", "creg", "gate", "opaque"}
+_REGISTER_KEYWORDS = {"qreg", "creg"}
+
+
+def _is_header(statement: str) -> bool:
+    match = _KEYWORD.match(statement)
+    return match is not None and match.group() in _HEADER_KEYWORDS
+
+
+def _iter_lines(source: QasmSource) -> Iterator[str]:
+    """Yields the lines of ``source``, which is either the path of a QASM file, an open
+    text file, or an iterable of strings (e.g. lines, or chunks of arbitrary size)."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as file:
+            yield from file
+        return
+
+    carry = ""
+    for text in source:
+        lines = (carry + text).split("\n")
+        carry = lines.pop()
+        yield from lines
+    if carry:
+        yield carry
+
+
+def iter_qasm_statements(source: QasmSource) -> Iterator[str]:
+    """Yields the statements of an OpenQASM 2 program one at a time, with comments removed
+    and whitespace collapsed, so that each statement (including gate definitions) is on a
+    single line.
+
+    Args:
+        source: Path of a QASM file, an open text file, or an iterable of strings.
+
+    Raises:
+        QasmError: If the program ends in the middle of a statement.
+
+    """
+    pending = ""
+    depth = 0
+    for line in _iter_lines(source):
+        line = line.split("//", 1)[0].strip()
+        if not line:
+            continue
+        # only the new text is scanned, delimiters of the pending text were already counted
+        scan_from = len(pending)
+        pending = f"{pending} {line}" if pending else line
+        start = 0
+        for match in _DELIMITERS.finditer(pending, scan_from):
+            char = match.group()
+            if char == "{":
+                depth += 1
+                continue
+            if char == "}":
+                depth -= 1
+            if depth == 0:
+                statement = pending[start : match.end()].strip()
+                start = match.end()
+                if statement != ";":
+                    yield " ".join(statement.split())
+        pending = pending[start:].strip()
+    if pending:
+        raise QasmError(f"Incomplete OpenQASM statement at end of program: {pending}")
+
+
+class _StreamBuilder(ABC):
+    """Builds a program of the target package from consecutive chunks of an OpenQASM 2
+    program. Each chunk is a complete program, made of the header (version, includes,
+    register and gate declarations) followed by a batch of statements."""
+
+    @abstractmethod
+    def add(self, qasm: str) -> None:
+        """Add the statements of the chunk ``qasm`` to the program being built."""
+
+    @abstractmethod
+    def result(self) -> "qbraid.QPROGRAM":
+        """Return the program built from the chunks added so far."""
+
+
+class _CirqStreamBuilder(_StreamBuilder):
+    def __init__(self):
+        self._circuit = Circuit()
+
+    def add(self, qasm: str) -> None:
+        self._circuit.append(parse_qasm(qasm).circuit.all_operations())
+
+    def result(self) -> Circuit:
+        return self._circuit
+
+
+class _LineQubitStreamBuilder(_StreamBuilder):  # pylint: disable=abstract-method
+    """Builder for packages whose converters index qubits by their position in the sorted
+    list of all qubits. The list is fixed by the register declarations, so that qubit
+    indices agree between chunks."""
+
+    reverse = False
+
+    def __init__(self):
+        self._qubit_map = None
+
+    def _line_qubit_operations(self, qasm: str) -> list:
+        parsed = parse_qasm(qasm)
+        if self._qubit_map is None:
+            qubits = sorted(
+                NamedQubit(f"{reg}_{idx}")
+                for reg, size in parsed.qregs.items()
+                for idx in range(size)
+            )
+            if self.reverse:
+                qubits.reverse()
+            self._qubit_map = {qubit: LineQubit(index) for index, qubit in enumerate(qubits)}
+        return [
+            operation.transform_qubits(self._qubit_map)
+            for operation in parsed.circuit.all_operations()
+        ]
+
+
+class _BraketStreamBuilder(_LineQubitStreamBuilder):
+    def __init__(self):
+        super().__init__()
+        self._circuit = BKCircuit()
+        self._braket_qubits = None
+
+    def add(self, qasm: str) -> None:
+        operations = self._line_qubit_operations(qasm)
+        if self._braket_qubits is None:
+            num_qubits = len(self._qubit_map)
+            self._braket_qubits = {index: num_qubits - 1 - index for index in range(num_qubits)}
+        for operation in operations:
+            for instruction in _to_braket_instruction(operation, self._braket_qubits):
+                self._circuit.add_instruction(instruction)
+
+    def result(self) -> BKCircuit:
+        return self._circuit
+
+
+class _PyQuilStreamBuilder(_LineQubitStreamBuilder):
+    """Quil measurement registers and gate definitions are named per program, so the
+    operations are collected and written out as a single program at the end."""
+
+    reverse = True
+
+    def __init__(self):
+        super().__init__()
+        self._operations = []
+
+    def add(self, qasm: str) -> None:
+        self._operations.extend(self._line_qubit_operations(qasm))
+
+    def result(self) -> Program:
+        qubits = LineQubit.range(len(self._qubit_map))
+        return Program(str(QuilOutput(self._operations, qubits)))
+
+
+class _QiskitStreamBuilder(_StreamBuilder):
+    def __init__(self):
+        self._circuit = None
+
+    def add(self, qasm: str) -> None:
+        chunk = QuantumCircuit.from_qasm_str(qasm)
+        if self._circuit is None:
+            self._circuit = chunk
+        else:
+            self._circuit.compose(chunk, inplace=True)
+
+    def result(self) -> QuantumCircuit:
+        # qiskit orders qubits little-endian, see conversion_graph._qasm2_to_qiskit
+        return self._circuit.reverse_bits()
+
+
+class _PytketStreamBuilder(_StreamBuilder):
+    def __init__(self):
+        self._circuit = None
+
+    def add(self, qasm: str) -> None:
+        chunk = circuit_from_qasm_str(qasm)
+        if self._circuit is None:
+            self._circuit = chunk
+        else:
+            self._circuit.append(chunk)
+
+    def result(self):
+        return self._circuit
+
+
+class _Qasm2StreamBuilder(_StreamBuilder):
+    """Each chunk is parsed before its statements are kept, so that invalid programs are
+    rejected as by the other builders rather than passed through."""
+
+    def __init__(self):
+        self._statements: List[str] = []
+        self._header_length = 0
+
+    def add(self, qasm: str) -> None:
+        parse_qasm(qasm)
+        statements = qasm.split("\n")
+        header_length = sum(1 for statement in statements if _is_header(statement))
+        # the header only grows, so its new statements directly follow the known ones
+        self._statements.extend(statements[self._header_length : header_length])
+        self._statements.extend(statements[header_length:])
+        self._header_length = header_length
+
+    def result(self) -> str:
+        return "\n".join(self._statements) + "\n"
+
+
+_STREAM_BUILDERS = {
+    "braket": _BraketStreamBuilder,
+    "cirq": _CirqStreamBuilder,
+    "pyquil": _PyQuilStreamBuilder,
+    "pytket": _PytketStreamBuilder,
+    "qasm2": _Qasm2StreamBuilder,
+    "qiskit": _QiskitStreamBuilder,
+}
+
+
+def transpile_qasm_stream(
+    source: QasmSource, target: str, chunk_size: int = 1000
+) -> "qbraid.QPROGRAM":
+    """Convert an OpenQASM 2 program to a program of package ``target``, reading the
+    program statement by statement.
+
+    Statements are converted in chunks of ``chunk_size``, each of which is preprocessed,
+    parsed and appended to the target program before the next one is read. Peak memory
+    is therefore bounded by the size of the output program plus one chunk, rather than
+    by several whole-program intermediate copies.
+
+    For pyquil, the converted operations are collected and written out as a Quil program
+    once all statements have been read, since Quil names measurement registers and gate
+    definitions per program.
+
+    Register declarations must precede the gates and measurements that use them. Unlike
+    :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile`, qubits that are declared
+    but never used are kept in the output.
+
+    Args:
+        source: Path of a QASM file, an open text file, or an iterable of strings
+            (e.g. lines, or chunks of arbitrary size). A string is interpreted as a path.
+        target: Package to convert to. Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+        chunk_size: Number of statements converted at a time.
+
+    Raises:
+        PackageValueError: If ``target`` is not one of :data:`~qbraid.QPROGRAM_LIBS`.
+        QasmError: If the program could not be read or converted.
+
+    Returns:
+        :data:`~qbraid.QPROGRAM`: The converted program.
+
+    """
+    if target not in QPROGRAM_LIBS:
+        raise PackageValueError(target)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+    builder = _STREAM_BUILDERS[target]()
+    header: List[str] = []
+    body: List[str] = []
+    body_started = False
+
+    def flush():
+        try:
+            builder.add("\n".join(header + body))
+        except Exception as err:
+            raise QasmError(f"Could not convert OpenQASM statements to {target}.") from err
+        body.clear()
+
+    for statement in iter_qasm_statements(source):
+        if _is_header(statement):
+            if body_started and _KEYWORD.match(statement).group() in _REGISTER_KEYWORDS:
+                raise QasmError(
+                    f"Register declared after the first gate or measurement: {statement}"
+                )
+            header.append(statement)
+            continue
+        body_started = True
+        body.append(statement)
+        if len(body) >= chunk_size:
+            flush()
+
+    if body or not body_started:
+        flush()
+
+    return builder.result()
@@ -0,0 +1,94 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking the fast-path QASM parser against the LALR QasmParser, on QASM exported
+by qiskit from random circuits of increasing size.
+
+Usage::
+
+    python qbraid/transpiler/tests/benchmarking/qasm_parser_benchmark.py
+
+    python qbraid/transpiler/tests/benchmarking/qasm_parser_benchmark.py \\
+        --sizes 10x1000 50x10000 --repeat 5
+
+"""
+import argparse
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from qiskit.circuit.random import random_circuit
+
+from qbraid.transpiler.cirq_qasm import QasmParser, fast_parse_qasm
+from qbraid.transpiler.cirq_qasm.qasm_preprocess import convert_to_supported_qasm
+
+DEFAULT_SIZES = [(5, 100), (10, 1_000), (50, 10_000)]
+
+
+def generate_qasm(num_qubits: int, num_gates: int, seed: int = 0) -> str:
+    """Returns preprocessed QASM exported by qiskit from a random circuit of about
+    ``num_gates`` gates on ``num_qubits`` qubits, with final measurements."""
+    depth = max(1, 2 * num_gates // num_qubits)
+    circuit = random_circuit(num_qubits, depth, max_operands=2, measure=True, seed=seed)
+    return convert_to_supported_qasm(circuit.qasm())
+
+
+def best_time(func: Callable[[str], object], qasm: str, repeat: int) -> float:
+    """Returns the best wall time of ``func(qasm)`` over ``repeat`` runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(qasm)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmarks(sizes: List[Tuple[int, int]], repeat: int) -> None:
+    """Print the parse times of both parsers, and the speedup of the fast path."""
+    parser = QasmParser()
+    print(f"{'size':>12} {'statements':>11} {'QasmParser':>14} {'fast path':>14} {'speedup':>8}")
+    for num_qubits, num_gates in sizes:
+        qasm = generate_qasm(num_qubits, num_gates)
+        if fast_parse_qasm(qasm) is None:
+            print(f"{num_qubits}x{num_gates}: program not supported by the fast path")
+            continue
+        ply_time = best_time(parser.parse, qasm, repeat)
+        fast_time = best_time(fast_parse_qasm, qasm, repeat)
+        print(
+            f"{num_qubits:>5}x{num_gates:<6} {qasm.count(';'):>11} {ply_time * 1e3:>11.2f} ms "
+            f"{fast_time * 1e3:>11.2f} ms {ply_time / fast_time:>7.1f}x",
+            flush=True,
+        )
+
+
+def _parse_size(size: str) -> Tuple[int, int]:
+    num_qubits, num_gates = size.lower().split("x")
+    return int(num_qubits), int(num_gates)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line. Returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_parse_size,
+        default=DEFAULT_SIZES,
+        help="circuit sizes as NUM_QUBITSxNUM_GATES, e.g. 10x1000",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per parser")
+    args = parser.parse_args(argv)
+    run_benchmarks(args.sizes, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the transpile benchmark, and a test that fails on regressions against
+its committed baseline
+
+"""
+import json
+import os
+
+import pytest
+from transpile_benchmark import (
+    BASELINE_SIZES,
+    DEFAULT_BASELINE,
+    check_regressions,
+    find_regressions,
+    main,
+)
+
+from qbraid._qprogram import QPROGRAM_LIBS
+
+# Benchmarks take minutes and depend on the machine, so they are opt-in
+skip_benchmarks: bool = os.getenv("QBRAID_RUN_BENCHMARKS") is None
+REASON = "QBRAID_RUN_BENCHMARKS not set"
+
+
+def test_baseline_covers_every_pair():
+    """Test that the committed baseline has an entry for every pair at each size."""
+    with open(DEFAULT_BASELINE, encoding="utf-8") as file:
+        baseline = json.load(file)
+    expected = {
+        f"{source}->{target}@{num_qubits}x{num_gates}"
+        for num_qubits, num_gates in BASELINE_SIZES
+        for source in QPROGRAM_LIBS
+        for target in QPROGRAM_LIBS
+        if source != target
+    }
+    assert set(baseline) == expected
+
+
+def test_find_regressions():
+    """Test that slower, larger, or newly failing results are flagged."""
+    baseline = {
+        "a->b@2x10": {"time": 1.0, "peak_memory": 100},
+        "a->c@2x10": {"time": 1.0, "peak_memory": 100},
+        "b->c@2x10": {"error": "ValueError: "},
+    }
+    results = {
+        "a->b@2x10": {"time": 1.2, "peak_memory": 200},
+        "a->c@2x10": {"error": "ValueError: "},
+        "b->c@2x10": {"time": 9.0, "peak_memory": 900},
+        "c->a@2x10": {"time": 9.0, "peak_memory": 900},
+    }
+    regressions = find_regressions(results, baseline, tolerance=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a->b@2x10: peak_memory")
+    assert regressions[1] == "a->c@2x10: now fails with ValueError: "
+
+
+def test_missing_baseline(tmp_path):
+    """Test that comparing against a missing baseline exits with an error status."""
+    baseline = str(tmp_path / "baseline.json")
+    argv = ["--sources", "cirq", "--targets", "cirq", "--sizes", "2x10", "--baseline", baseline]
+    assert main(argv) == 1
+
+
+@pytest.mark.skipif(skip_benchmarks, reason=REASON)
+def test_no_regressions():
+    """Test that no pair of packages is slower or uses more memory than the baseline."""
+    regressions = check_regressions()
+    assert not regressions, "\n".join(regressions)
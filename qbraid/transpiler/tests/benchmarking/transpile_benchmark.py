@@ -0,0 +1,234 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking time and peak memory of transpiling between every pair of supported
+packages, on generated circuits of increasing size.
+
+Usage::
+
+    # record a baseline
+    python qbraid/transpiler/tests/benchmarking/transpile_benchmark.py --save-baseline
+
+    # compare against it, exiting with status 1 if any pair regressed
+    python qbraid/transpiler/tests/benchmarking/transpile_benchmark.py
+
+    # or, as a test that fails on a regression
+    QBRAID_RUN_BENCHMARKS=1 pytest qbraid/transpiler/tests/benchmarking
+
+    # restrict the run, e.g. while working on a single conversion
+    python qbraid/transpiler/tests/benchmarking/transpile_benchmark.py \\
+        --sources qiskit --targets braket --sizes 10x1000 50x10000
+
+The committed ``baseline.json`` covers the sizes in ``BASELINE_SIZES`` only. Its
+values are hand-set budgets, not measurements, so that it holds on any machine and
+flags only gross regressions. Record a baseline on your own machine with
+``--save-baseline`` to compare more closely.
+
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import cirq
+import numpy as np
+
+from qbraid import circuit_wrapper
+from qbraid._qprogram import QPROGRAM_LIBS
+
+DEFAULT_SIZES = [(2, 10), (10, 1_000), (50, 10_000), (128, 100_000)]
+
+# sizes covered by the committed baseline
+BASELINE_SIZES = [(2, 10), (10, 1_000)]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+ONE_QUBIT_GATES = [cirq.H, cirq.X, cirq.Y, cirq.Z, cirq.S, cirq.T]
+TWO_QUBIT_GATES = [cirq.CNOT, cirq.CZ, cirq.SWAP]
+
+
+def generate_circuit(num_qubits: int, num_gates: int, seed: int = 0) -> cirq.Circuit:
+    """Generate a Cirq circuit of ``num_gates`` gates, drawn from a gate set that every
+    supported package can represent, acting on ``num_qubits`` qubits."""
+    rng = np.random.default_rng(seed)
+    qubits = cirq.LineQubit.range(num_qubits)
+    operations = []
+    for _ in range(num_gates):
+        kind = rng.integers(3) if num_qubits > 1 else rng.integers(2)
+        if kind == 0:
+            gate = ONE_QUBIT_GATES[rng.integers(len(ONE_QUBIT_GATES))]
+            operations.append(gate(qubits[rng.integers(num_qubits)]))
+        elif kind == 1:
+            angle = float(rng.uniform(0, 2 * np.pi))
+            operations.append(cirq.rz(angle)(qubits[rng.integers(num_qubits)]))
+        else:
+            gate = TWO_QUBIT_GATES[rng.integers(len(TWO_QUBIT_GATES))]
+            q0, q1 = rng.choice(num_qubits, size=2, replace=False)
+            operations.append(gate(qubits[q0], qubits[q1]))
+    # every qubit is used, so that all packages agree on the number of qubits
+    operations.extend(cirq.I(qubit) for qubit in qubits)
+    return cirq.Circuit(operations)
+
+
+def benchmark_pair(program, target: str, repeat: int) -> Dict[str, float]:
+    """Return the best wall time over ``repeat`` runs, and the peak memory allocated
+    while transpiling ``program`` to ``target``."""
+    tracemalloc.start()
+    try:
+        circuit_wrapper(program).transpile(target)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        circuit_wrapper(program).transpile(target)
+        times.append(time.perf_counter() - start)
+    return {"time": min(times), "peak_memory": peak_memory}
+
+
+def run_benchmarks(
+    sources: List[str], targets: List[str], sizes: List[Tuple[int, int]], repeat: int
+) -> Dict[str, Dict[str, float]]:
+    """Benchmark every source -> target pair on a circuit of each size. Results are keyed
+    by ``"{source}->{target}@{num_qubits}x{num_gates}"``."""
+    results = {}
+    for num_qubits, num_gates in sizes:
+        cirq_circuit = generate_circuit(num_qubits, num_gates)
+        programs = {}
+        for source in sources:
+            try:
+                programs[source] = circuit_wrapper(cirq_circuit).transpile(source)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                print(f"skipping source {source} at {num_qubits}x{num_gates}: {err!r}")
+
+        for source, target in product(programs, targets):
+            if source == target:
+                continue
+            key = f"{source}->{target}@{num_qubits}x{num_gates}"
+            try:
+                results[key] = benchmark_pair(programs[source], target, repeat)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                results[key] = {"error": f"{type(err).__name__}: {err}"}
+            print(_format_result(key, results[key]), flush=True)
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Return a description of each result that is slower, uses more memory, or fails
+    where the baseline did not, by more than ``tolerance`` (relative)."""
+    regressions = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is None or "error" in expected:
+            continue
+        if "error" in result:
+            regressions.append(f"{key}: now fails with {result['error']}")
+            continue
+        for metric in ("time", "peak_memory"):
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{key}: {metric} {result[metric]:.4g} > baseline {expected[metric]:.4g}"
+                )
+    return regressions
+
+
+def check_regressions(
+    sizes: List[Tuple[int, int]] = BASELINE_SIZES,
+    baseline_path: str = DEFAULT_BASELINE,
+    tolerance: float = 0.25,
+    repeat: int = 3,
+) -> List[str]:
+    """Benchmark every pair of supported packages on circuits of each size, and return
+    the regressions against the baseline stored at ``baseline_path``."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    results = run_benchmarks(QPROGRAM_LIBS, QPROGRAM_LIBS, sizes, repeat)
+    return find_regressions(results, baseline, tolerance)
+
+
+def _format_result(key: str, result: Dict[str, float]) -> str:
+    if "error" in result:
+        return f"{key:40} {result['error']}"
+    return f"{key:40} {result['time'] * 1e3:12.2f} ms {result['peak_memory'] / 2**20:10.2f} MiB"
+
+
+def _parse_size(size: str) -> Tuple[int, int]:
+    num_qubits, num_gates = size.lower().split("x")
+    return int(num_qubits), int(num_gates)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line. Returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--sources", nargs="+", default=QPROGRAM_LIBS, choices=QPROGRAM_LIBS)
+    parser.add_argument("--targets", nargs="+", default=QPROGRAM_LIBS, choices=QPROGRAM_LIBS)
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_parse_size,
+        default=DEFAULT_SIZES,
+        help="circuit sizes as NUM_QUBITSxNUM_GATES, e.g. 10x1000",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per pair")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative slowdown before flagging"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sources, args.targets, args.sizes, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline found at {args.baseline}, run with --save-baseline to create one.")
+        return 1
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+        print("\n".join(regressions))
+        return 1
+    print(f"\nNo regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
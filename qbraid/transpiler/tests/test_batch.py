@@ -0,0 +1,79 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for batch transpilation
+
+"""
+import cirq
+import numpy as np
+import pytest
+
+from qbraid.interface import circuits_allclose
+from qbraid.interface.programs import bell_data
+from qbraid.transpiler import CircuitConversionError, transpile_batch
+from qbraid.transpiler.custom_gates import matrix_gate
+
+TEST_BELL, _ = bell_data()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_transpile_batch_preserves_order(max_workers):
+    """Test that results are returned in input order."""
+    programs = [TEST_BELL[package]() for package in ["cirq", "qiskit", "braket", "pytket"]]
+    results = transpile_batch(programs, "braket", max_workers=max_workers)
+    assert len(results) == len(programs)
+    for program, result in zip(programs, results):
+        assert circuits_allclose(program, result)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_transpile_batch_reports_errors(max_workers):
+    """Test that a failing item does not abort the rest of the batch."""
+    programs = [TEST_BELL["cirq"](), None, TEST_BELL["qiskit"]()]
+    results = transpile_batch(programs, "pytket", max_workers=max_workers)
+    assert isinstance(results[1], CircuitConversionError)
+    assert circuits_allclose(programs[0], results[0])
+    assert circuits_allclose(programs[2], results[2])
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 3])
+def test_transpile_batch_chunksize(chunksize):
+    """Test that results are scattered back to input order for any chunk size."""
+    programs = [TEST_BELL[package]() for package in ["cirq", "qiskit", "braket"]] * 2
+    programs.insert(3, None)
+    results = transpile_batch(programs, "cirq", max_workers=2, chunksize=chunksize)
+    assert isinstance(results[3], CircuitConversionError)
+    for program, result in zip(programs[:3] + programs[4:], results[:3] + results[4:]):
+        assert circuits_allclose(program, result)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_transpile_batch_unpicklable_program(chunksize):
+    """Test that chunks which cannot be sent to a worker are transpiled serially."""
+    qubits = cirq.LineQubit.range(2)
+    unpicklable = cirq.Circuit(matrix_gate(np.eye(2)).on(qubits[0]), cirq.CNOT(*qubits))
+    programs = [TEST_BELL["cirq"](), unpicklable, None]
+    results = transpile_batch(programs, "braket", max_workers=2, chunksize=chunksize)
+    assert circuits_allclose(programs[0], results[0])
+    assert circuits_allclose(unpicklable, results[1])
+    assert isinstance(results[2], CircuitConversionError)
+
+
+def test_transpile_batch_bad_workers():
+    """Test raising error for invalid number of workers."""
+    with pytest.raises(ValueError):
+        transpile_batch([], "cirq", max_workers=0)
+
+
+def test_transpile_batch_bad_chunksize():
+    """Test raising error for invalid chunk size."""
+    with pytest.raises(ValueError):
+        transpile_batch([], "cirq", chunksize=0)
@@ -0,0 +1,239 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the transpile cache
+
+"""
+import pickle
+import sqlite3
+import time
+
+import pytest
+
+from qbraid import circuit_wrapper
+from qbraid.interface.programs import bell_data
+from qbraid.transpiler import (
+    DiskTranspileCache,
+    TranspileCache,
+    disable_transpile_cache,
+    enable_disk_transpile_cache,
+    enable_transpile_cache,
+    get_conversion_graph,
+    get_transpile_cache,
+    program_fingerprint,
+)
+from qbraid.transpiler.cache import transpile_cache_key
+
+TEST_BELL, _ = bell_data()
+
+
+@pytest.fixture
+def transpile_cache():
+    """Enable the transpile cache for the duration of a test."""
+    yield enable_transpile_cache()
+    disable_transpile_cache()
+
+
+@pytest.mark.parametrize("package", ["braket", "cirq", "pyquil", "qiskit", "pytket", "qasm2"])
+def test_fingerprint_content_addressed(package):
+    """Test that equal programs built separately share a fingerprint."""
+    assert program_fingerprint(TEST_BELL[package](), package) == program_fingerprint(
+        TEST_BELL[package](), package
+    )
+
+
+def test_fingerprint_distinguishes_programs():
+    """Test that different programs have different fingerprints."""
+    circuit = TEST_BELL["cirq"]()
+    other = circuit + circuit
+    assert program_fingerprint(circuit, "cirq") != program_fingerprint(other, "cirq")
+
+
+def test_fingerprint_qiskit_lossless():
+    """Test that qiskit programs differing only below OpenQASM precision or in global
+    phase have different fingerprints."""
+    circuit = TEST_BELL["qiskit"]()
+    rotated, nudged, phased = circuit.copy(), circuit.copy(), circuit.copy()
+    rotated.rz(0.1, 0)
+    nudged.rz(0.1 + 1e-12, 0)
+    phased.global_phase = 0.5
+    assert program_fingerprint(rotated, "qiskit") != program_fingerprint(nudged, "qiskit")
+    assert program_fingerprint(circuit, "qiskit") != program_fingerprint(phased, "qiskit")
+
+
+def test_cache_key_covers_conversion_graph(transpile_cache):
+    """Test that changing the conversion graph changes the cache key."""
+    graph = get_conversion_graph()
+    circuit = TEST_BELL["cirq"]()
+    key = transpile_cache_key(circuit, "cirq", "qiskit")
+    edge = graph._edges["cirq"]["qiskit"]  # pylint: disable=protected-access
+    graph.add_conversion("cirq", "qiskit", edge.conversion_func, edge.weight + 1)
+    try:
+        assert transpile_cache_key(circuit, "cirq", "qiskit") != key
+    finally:
+        graph.add_conversion("cirq", "qiskit", edge.conversion_func, edge.weight)
+    assert transpile_cache_key(circuit, "cirq", "qiskit") == key
+
+
+def test_transpile_cache_hit(transpile_cache):
+    """Test that repeated transpiles are served from the cache."""
+    circuit_wrapper(TEST_BELL["cirq"]()).transpile("qiskit")
+    circuit_wrapper(TEST_BELL["cirq"]()).transpile("qiskit")
+    info = transpile_cache.cache_info()
+    assert info.hits == 1 and info.misses == 1 and info.currsize == 1
+
+
+def test_transpile_cache_defensive_copy(transpile_cache):
+    """Test that mutating a returned program does not affect the cache."""
+    first = circuit_wrapper(TEST_BELL["cirq"]()).transpile("qiskit")
+    first.x(0)
+    second = circuit_wrapper(TEST_BELL["cirq"]()).transpile("qiskit")
+    assert len(second.data) == len(first.data) - 1
+    assert get_transpile_cache() is transpile_cache
+
+
+def test_cache_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = TranspileCache(maxsize=2)
+    cache.put(("a", "cirq"), 1)
+    cache.put(("b", "cirq"), 2)
+    assert cache.get(("a", "cirq")) == 1
+    cache.put(("c", "cirq"), 3)
+    assert ("b", "cirq") not in cache
+    assert ("a", "cirq") in cache and ("c", "cirq") in cache
+
+
+def test_cache_memory_eviction():
+    """Test that entries are evicted to stay under the byte limit."""
+    cache = TranspileCache(maxsize=None, max_bytes=300)
+    cache.put(("a", "qasm2"), "x" * 200)
+    cache.put(("b", "qasm2"), "y" * 200)
+    assert len(cache) == 1 and ("b", "qasm2") in cache
+    cache.put(("c", "qasm2"), "z" * 1000)
+    assert ("c", "qasm2") not in cache
+    assert cache.cache_info().nbytes <= 300
+
+
+def test_cache_clear():
+    """Test clearing entries and counters."""
+    cache = TranspileCache()
+    cache.put(("a", "cirq"), 1)
+    cache.get(("a", "cirq"))
+    cache.get(("b", "cirq"))
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 256, 0, 0)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Enable the on-disk transpile cache for the duration of a test."""
+    yield enable_disk_transpile_cache(path=str(tmp_path / "cache.db"))
+    disable_transpile_cache()
+
+
+def test_disk_cache_persists(disk_cache):
+    """Test that entries are visible to a second cache opened on the same file."""
+    transpiled = circuit_wrapper(TEST_BELL["cirq"]()).transpile("braket")
+    reopened = DiskTranspileCache(path=disk_cache.path)
+    key = transpile_cache_key(TEST_BELL["cirq"](), "cirq", "braket")
+    assert reopened.get(key) == transpiled
+    assert reopened.cache_info().hits == 1
+
+
+def test_disk_cache_populates_memory_cache(disk_cache):
+    """Test that disk hits are copied into the in-memory cache."""
+    circuit_wrapper(TEST_BELL["qiskit"]()).transpile("cirq")
+    memory_cache = enable_transpile_cache()
+    circuit_wrapper(TEST_BELL["qiskit"]()).transpile("cirq")
+    circuit_wrapper(TEST_BELL["qiskit"]()).transpile("cirq")
+    assert disk_cache.cache_info().hits == 1
+    assert memory_cache.cache_info().hits == 1
+
+
+def test_disk_cache_versions_coexist(tmp_path, monkeypatch):
+    """Test that entries are keyed by qBraid version and kept for other versions."""
+    path = str(tmp_path / "cache.db")
+    cache = DiskTranspileCache(path=path)
+    cache.put(("a", "cirq", "qasm2"), "program")
+    monkeypatch.setattr("qbraid.transpiler.cache.__version__", "0.0.0")
+    new_cache = DiskTranspileCache(path=path)
+    assert len(new_cache) == 0
+    assert new_cache.get(("a", "cirq", "qasm2")) is None
+    new_cache.put(("a", "cirq", "qasm2"), "other program")
+    assert cache.get(("a", "cirq", "qasm2")) == "program"
+    assert new_cache.get(("a", "cirq", "qasm2")) == "other program"
+
+
+def test_disk_cache_age_eviction(tmp_path, monkeypatch):
+    """Test that entries not accessed within max_age are removed on open."""
+    path = str(tmp_path / "cache.db")
+    cache = DiskTranspileCache(path=path, max_age=60)
+    cache.put(("a", "cirq", "qasm2"), "program")
+    now = time.time()
+    monkeypatch.setattr("qbraid.transpiler.cache.time.time", lambda: now + 120)
+    assert len(DiskTranspileCache(path=path, max_age=None)) == 1
+    assert len(DiskTranspileCache(path=path, max_age=60)) == 0
+
+
+def test_disk_cache_rejects_tampered_entries(tmp_path):
+    """Test that entries whose signature does not match are discarded unread."""
+    path = str(tmp_path / "cache.db")
+    cache = DiskTranspileCache(path=path)
+    cache.put(("a", "cirq", "qasm2"), "program")
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE entries SET data=?", (pickle.dumps("tampered"),))
+    conn.close()
+    assert cache.get(("a", "cirq", "qasm2")) is None
+    assert ("a", "cirq", "qasm2") not in cache
+
+
+def test_disk_cache_key_without_hard_links(tmp_path, monkeypatch):
+    """Test that the signing key is created on file systems without hard links."""
+
+    def link(src, dst):
+        raise PermissionError(src, dst)
+
+    monkeypatch.setattr("qbraid.transpiler.cache.os.link", link)
+    path = str(tmp_path / "cache.db")
+    cache = DiskTranspileCache(path=path)
+    cache.put(("a", "cirq", "qasm2"), "program")
+    assert len((tmp_path / "cache.db.key").read_bytes()) == 32
+    assert DiskTranspileCache(path=path).get(("a", "cirq", "qasm2")) == "program"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith("tmp")] == []
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    """Test that least recently used entries are evicted to respect the size cap."""
+    cache = DiskTranspileCache(path=str(tmp_path / "cache.db"), max_bytes=500)
+    cache.put(("a", "cirq", "qasm2"), "x" * 200)
+    cache.put(("b", "cirq", "qasm2"), "y" * 200)
+    cache.get(("a", "cirq", "qasm2"))
+    cache.put(("c", "cirq", "qasm2"), "z" * 200)
+    assert ("b", "cirq", "qasm2") not in cache
+    assert ("a", "cirq", "qasm2") in cache and ("c", "cirq", "qasm2") in cache
+    assert cache.cache_info().nbytes <= 500
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_cache_running_size(tmp_path):
+    """Test that the running total size used for eviction matches the stored entries."""
+    path = str(tmp_path / "cache.db")
+    cache = DiskTranspileCache(path=path, max_bytes=500)
+    cache.put(("a", "cirq", "qasm2"), "x" * 200)
+    cache.put(("a", "cirq", "qasm2"), "x" * 150)
+    cache.put(("b", "cirq", "qasm2"), "y" * 200)
+    cache.put(("c", "cirq", "qasm2"), "z" * 200)
+    with sqlite3.connect(path) as conn:
+        total = conn.execute("SELECT total FROM size").fetchone()[0]
+        nbytes = conn.execute("SELECT SUM(nbytes) FROM entries").fetchone()[0]
+    conn.close()
+    assert total == nbytes == cache.cache_info().nbytes <= 500
@@ -0,0 +1,151 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the transpiler conversion graph
+
+"""
+import pytest
+
+from qbraid import circuit_wrapper
+from qbraid._qprogram import QPROGRAM_LIBS
+from qbraid.exceptions import PackageValueError
+from qbraid.interface import circuits_allclose
+from qbraid.interface.programs import bell_data
+from qbraid.interface.qbraid_qasm.tools import qasm_num_qubits
+from qbraid.transpiler import ConversionGraph, get_conversion_graph
+from qbraid.transpiler.exceptions import CircuitConversionError
+
+TEST_BELL, _ = bell_data()
+
+
+def test_default_graph_nodes():
+    """Test that every supported package is a node of the default graph."""
+    graph = ConversionGraph()
+    assert set(graph.nodes) == set(QPROGRAM_LIBS)
+
+
+@pytest.mark.parametrize(
+    "source,target,expected",
+    [
+        ("qiskit", "pytket", ["qiskit", "qasm2", "pytket"]),
+        ("pytket", "qiskit", ["pytket", "qasm2", "qiskit"]),
+        ("qiskit", "qasm2", ["qiskit", "qasm2"]),
+        ("braket", "qiskit", ["braket", "cirq", "qiskit"]),
+        ("pyquil", "braket", ["pyquil", "cirq", "braket"]),
+    ],
+)
+def test_shortest_path(source, target, expected):
+    """Test that QASM 2 native packages skip the Cirq intermediate."""
+    assert get_conversion_graph().find_shortest_path(source, target) == expected
+
+
+def test_shortest_path_unreachable():
+    """Test raising error when no path to target exists."""
+    graph = ConversionGraph([("a", "b", lambda x: x, 1.0)])
+    with pytest.raises(PackageValueError):
+        graph.find_shortest_path("b", "a")
+
+
+def test_find_paths_sorted_by_cost():
+    """Test that candidate paths are returned cheapest first."""
+    graph = ConversionGraph([("a", "b", str, 5.0), ("a", "c", str, 1.0), ("c", "b", str, 1.0)])
+    assert graph.find_paths("a", "b") == [["a", "c", "b"], ["a", "b"]]
+    assert graph.path_cost(["a", "c", "b"]) == 2.0
+
+
+def test_convert_falls_back_on_failure():
+    """Test that a failed conversion is retried along the next cheapest path."""
+
+    def fail(_):
+        raise ValueError
+
+    graph = ConversionGraph(
+        [("a", "b", lambda x: x + ["ab"], 5.0), ("a", "c", fail, 1.0), ("c", "b", str, 1.0)]
+    )
+    assert graph.convert([], "a", "b") == ["ab"]
+
+
+def test_convert_all_paths_fail():
+    """Test raising error when every path fails."""
+
+    def fail(_):
+        raise ValueError
+
+    graph = ConversionGraph([("a", "b", fail, 1.0)])
+    with pytest.raises(CircuitConversionError):
+        graph.convert(None, "a", "b")
+
+
+def test_add_remove_conversion():
+    """Test registering and removing edges."""
+    graph = ConversionGraph([])
+    graph.add_conversion("a", "b", str, 2.0)
+    assert graph.has_conversion("a", "b")
+    graph.remove_conversion("a", "b")
+    assert not graph.has_conversion("a", "b")
+    with pytest.raises(ValueError):
+        graph.remove_conversion("a", "b")
+
+
+@pytest.mark.parametrize("source", ["qiskit", "pytket", "qasm2"])
+@pytest.mark.parametrize("target", ["qiskit", "pytket", "qasm2"])
+def test_direct_qasm2_conversions(source, target):
+    """Test transpiling between QASM 2 native packages preserves the unitary."""
+    program = TEST_BELL[source]()
+    transpiled = circuit_wrapper(program).transpile(target)
+    assert circuits_allclose(program, transpiled)
+
+
+@pytest.mark.parametrize("target", ["qiskit", "pytket"])
+def test_direct_qasm2_conversion_drops_idle_qubits(target):
+    """Test that the direct QASM 2 edges drop idle qubits as the Cirq path does."""
+    qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\nh q[0];\ncx q[0],q[2];\n'
+    graph = get_conversion_graph()
+    direct = graph.convert(qasm, "qasm2", target)
+    via_cirq = graph.convert(graph.convert(qasm, "qasm2", "cirq"), "cirq", target)
+    num_qubits = {"qiskit": lambda c: c.num_qubits, "pytket": lambda c: c.n_qubits}[target]
+    assert num_qubits(direct) == num_qubits(via_cirq) == 2
+    assert circuits_allclose(direct, via_cirq)
+
+
+@pytest.mark.parametrize("source", ["qiskit", "pytket"])
+def test_direct_qasm2_export_drops_idle_qubits(source):
+    """Test that exporting to QASM 2 directly and through Cirq give the same qubits
+    for a circuit with an idle qubit."""
+    qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[3];\nh q[0];\ncx q[0],q[2];\n'
+    graph = get_conversion_graph()
+    circuit = graph.convert(qasm, "qasm2", source)
+    direct = graph.convert(circuit, source, "qasm2")
+    via_cirq = graph.convert(graph.convert(circuit, source, "cirq"), "cirq", "qasm2")
+    assert qasm_num_qubits(direct) == qasm_num_qubits(via_cirq) == 2
+    assert "qreg q[2];" in direct
+    assert circuits_allclose(direct, via_cirq)
+
+
+def test_convert_uses_intermediates():
+    """Test that available intermediate programs are not recomputed."""
+
+    def fail(_):
+        raise ValueError
+
+    graph = ConversionGraph([("a", "b", fail, 1.0), ("b", "c", lambda x: x + "c", 1.0)])
+    assert graph.convert("a", "a", "c", intermediates={"b": "b"}) == "bc"
+    assert graph.convert("a", "a", "b", intermediates={"b": "b"}) == "b"
+
+
+def test_convert_records_intermediates():
+    """Test that programs produced along the path are added to the intermediates."""
+    graph = ConversionGraph(
+        [("a", "b", lambda x: x + "b", 1.0), ("b", "c", lambda x: x + "c", 1.0)]
+    )
+    intermediates = {}
+    assert graph.convert("a", "a", "c", intermediates=intermediates) == "abc"
+    assert intermediates == {"a": "a", "b": "ab", "c": "abc"}
@@ -16,9 +16,17 @@ import cirq
 import numpy as np
 import pytest
 
+from qbraid import circuit_wrapper
 from qbraid._qprogram import QPROGRAM_LIBS
-from qbraid.interface import to_unitary
-from qbraid.transpiler.conversions import convert_from_cirq
+from qbraid.interface import circuits_allclose, to_unitary
+from qbraid.transpiler.conversions import (
+    _decompose_unsupported,
+    _gate_supported,
+    _gate_supported_cached,
+    convert_from_cirq,
+    get_fallback_counts,
+    reset_fallback_counts,
+)
 
 
 @pytest.mark.parametrize("frontend", QPROGRAM_LIBS)
@@ -34,3 +42,40 @@ def test_convert_circuit_operation_from_cirq(frontend):
     test_unitary = to_unitary(test_circuit)
 
     assert np.allclose(cirq_unitary, test_unitary)
+
+
+def test_decompose_unsupported_keeps_supported_operations():
+    """Test that only the operations the target cannot handle are decomposed."""
+    qubits = cirq.LineQubit.range(5)
+    qft = cirq.QuantumFourierTransformGate(5).on(*qubits)
+    cirq_circuit = cirq.Circuit(cirq.H(qubits[0]), qft, cirq.IdentityGate(5).on(*qubits))
+
+    decomposed = _decompose_unsupported(cirq_circuit, "braket")
+
+    assert cirq.H(qubits[0]) in decomposed.all_operations()
+    assert qft not in decomposed.all_operations()
+    assert decomposed.all_qubits() == cirq_circuit.all_qubits()
+    assert circuits_allclose(cirq_circuit, convert_from_cirq(cirq_circuit, "braket"))
+
+
+def test_gate_supported_keyed_on_gate_type():
+    """Test that rotations by different angles share one support cache entry."""
+    _gate_supported_cached.cache_clear()
+    for angle in np.linspace(0.1, 1.0, 10):
+        assert _gate_supported(cirq.rx(angle), "braket")
+    assert _gate_supported(cirq.rx(np.pi), "braket")
+    assert _gate_supported_cached.cache_info().currsize == 2
+
+
+def test_fallback_counts():
+    """Test that decomposition fallbacks are counted per source / target pair."""
+    reset_fallback_counts()
+    qubits = cirq.LineQubit.range(5)
+    cirq_circuit = cirq.Circuit(cirq.QuantumFourierTransformGate(5).on(*qubits))
+
+    convert_from_cirq(cirq_circuit, "braket")
+    circuit_wrapper(cirq_circuit).transpile("braket")
+    assert get_fallback_counts() == {("cirq", "braket"): 2}
+
+    reset_fallback_counts()
+    assert get_fallback_counts() == {}
@@ -0,0 +1,174 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for transpiling parameterized programs once and binding them many times
+
+"""
+import cirq
+import numpy as np
+import pytest
+import sympy
+from braket.circuits import Circuit as BKCircuit
+from braket.circuits import FreeParameter
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from qbraid import circuit_wrapper
+from qbraid._qprogram import QPROGRAM_LIBS
+from qbraid.exceptions import PackageValueError
+from qbraid.interface import circuits_allclose
+from qbraid.interface.programs import bell_data
+from qbraid.transpiler import ParameterizedProgram, transpile_parameterized
+
+VALUES = np.array([[0.4, 1.1], [-2.0, 0.3], [np.pi, 0.0]])
+
+
+def _qiskit_circuit():
+    alpha, beta = Parameter("alpha"), Parameter("beta")
+    circuit = QuantumCircuit(3)
+    circuit.h(0)
+    circuit.rx(alpha, 0)
+    circuit.cx(0, 1)
+    circuit.rz(2 * alpha + beta, 1)
+    circuit.ry(beta, 2)
+    circuit.cp(alpha, 1, 2)
+    return circuit
+
+
+def _cirq_circuit():
+    alpha, beta = sympy.symbols("alpha beta")
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    return cirq.Circuit(
+        cirq.H(q2),
+        cirq.rx(alpha).on(q2),
+        cirq.CNOT(q2, q1),
+        cirq.rz(2 * alpha + beta).on(q1),
+        cirq.ry(beta).on(q0),
+        cirq.CZ(q1, q0) ** (alpha / sympy.pi),
+    )
+
+
+def _braket_circuit():
+    alpha, beta = FreeParameter("alpha"), FreeParameter("beta")
+    return (  # pylint: disable=no-member
+        BKCircuit()
+        .h(0)
+        .rx(0, alpha)
+        .cnot(0, 1)
+        .rz(1, 2 * alpha + beta)
+        .ry(2, beta)
+        .cphaseshift(1, 2, alpha)
+    )
+
+
+PROGRAMS = {"qiskit": _qiskit_circuit, "cirq": _cirq_circuit, "braket": _braket_circuit}
+
+BIND_SOURCE = {
+    "qiskit": lambda circuit, values: circuit.assign_parameters(
+        {param: values[param.name] for param in circuit.parameters}
+    ),
+    "cirq": cirq.resolve_parameters,
+    "braket": lambda circuit, values: circuit.make_bound_circuit(values),
+}
+
+
+@pytest.mark.parametrize("source", PROGRAMS)
+@pytest.mark.parametrize("target", QPROGRAM_LIBS)
+def test_bind_matches_bound_program(source, target):
+    """Test that binding a program transpiled once matches the bound source program."""
+    program = PROGRAMS[source]()
+    parameterized = transpile_parameterized(program, source, target)
+    assert parameterized.package == target
+    assert parameterized.parameters == ["alpha", "beta"]
+    for values in VALUES:
+        bound = parameterized.bind(values)
+        expected = BIND_SOURCE[source](program, dict(zip(["alpha", "beta"], values)))
+        assert circuits_allclose(bound, expected)
+
+
+@pytest.mark.parametrize(
+    "source,target,symbol_type",
+    [
+        ("qiskit", "braket", FreeParameter),
+        ("braket", "qiskit", Parameter),
+        ("qiskit", "cirq", sympy.Symbol),
+    ],
+)
+def test_template_keeps_symbols(source, target, symbol_type):
+    """Test that the template of symbolic packages holds native parameters."""
+    template = transpile_parameterized(PROGRAMS[source](), source, target).template
+    if target == "cirq":
+        symbols = cirq.parameter_symbols(template)
+    else:
+        symbols = template.parameters
+    assert {str(symbol) for symbol in symbols} == {"alpha", "beta"}
+    assert all(isinstance(symbol, symbol_type) for symbol in symbols)
+
+
+def test_bind_by_name():
+    """Test binding values given by parameter name."""
+    parameterized = transpile_parameterized(_qiskit_circuit(), "qiskit", "braket")
+    by_position = parameterized.bind([0.4, 1.1])
+    by_name = parameterized.bind({"beta": 1.1, "alpha": 0.4})
+    assert circuits_allclose(by_position, by_name)
+
+
+def test_bind_batch():
+    """Test that each row of a batch is bound to a program."""
+    parameterized = transpile_parameterized(_cirq_circuit(), "cirq", "qiskit")
+    programs = parameterized.bind_batch(VALUES)
+    assert len(programs) == len(VALUES)
+    for program, values in zip(programs, VALUES):
+        assert circuits_allclose(program, parameterized.bind(values))
+
+
+@pytest.mark.parametrize("values", [[0.1], [0.1, 0.2, 0.3], {"alpha": 0.1}, [[0.1, 0.2]]], ids=str)
+def test_bind_wrong_values(values):
+    """Test raising error when values do not match the parameters."""
+    parameterized = transpile_parameterized(_qiskit_circuit(), "qiskit", "cirq")
+    with pytest.raises(ValueError):
+        parameterized.bind(values)
+
+
+@pytest.mark.parametrize("values", [[0.1, 0.2], [[0.1, 0.2, 0.3]]])
+def test_bind_batch_wrong_shape(values):
+    """Test raising error when a batch is not of shape (num_programs, num_parameters)."""
+    parameterized = transpile_parameterized(_qiskit_circuit(), "qiskit", "cirq")
+    with pytest.raises(ValueError):
+        parameterized.bind_batch(values)
+
+
+def test_transpile_parameterized_bad_target():
+    """Test raising error for unsupported target packages."""
+    with pytest.raises(PackageValueError):
+        transpile_parameterized(_qiskit_circuit(), "qiskit", "stim")
+
+
+@pytest.mark.parametrize("target", QPROGRAM_LIBS)
+def test_unparameterized_program(target):
+    """Test that programs without parameters bind to the transpiled program."""
+    program = bell_data()[0]["pyquil"]()
+    parameterized = transpile_parameterized(program, "pyquil", target)
+    assert not parameterized.parameters
+    assert circuits_allclose(parameterized.bind([]), program)
+
+
+def test_wrapper_memoizes_parameterized_program():
+    """Test that the wrapper transpiles the parameterized program once per target."""
+    wrapper = circuit_wrapper(_qiskit_circuit())
+    parameterized = wrapper.transpile_parameterized("braket")
+    assert isinstance(parameterized, ParameterizedProgram)
+    assert wrapper.transpile_parameterized("braket") is parameterized
+    assert circuits_allclose(wrapper.bind("braket", [0.4, 1.1]), parameterized.bind([0.4, 1.1]))
+    assert len(wrapper.bind_batch("braket", VALUES)) == len(VALUES)
+
+    wrapper.invalidate()
+    assert wrapper.transpile_parameterized("braket") is not parameterized
@@ -0,0 +1,62 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for transpiler profiling
+
+"""
+import json
+
+from qbraid import circuit_wrapper
+from qbraid.interface.programs import bell_data
+from qbraid.transpiler import TranspileProfile, profile
+from qbraid.transpiler.profiling import profiled
+
+TEST_BELL, _ = bell_data()
+
+
+def test_profile_records_stages_and_edges():
+    """Test that pipeline stages and conversion graph edges are recorded."""
+    with profile() as prof:
+        circuit_wrapper(TEST_BELL["qasm2"]()).transpile("braket")
+        circuit_wrapper(TEST_BELL["cirq"]()).transpile("qiskit")
+
+    stats = prof.to_dict()
+    for stage in ["convert_to_supported_qasm", "fast_parse_qasm", "to_qasm", "cirq->qiskit"]:
+        assert stats[stage]["calls"] >= 1
+        assert stats[stage]["total_time"] >= stats[stage]["max_time"] > 0
+    assert stats["fast_parse_qasm"]["total_size"] > 0
+    assert json.loads(prof.to_json()) == stats
+
+
+def test_profile_is_opt_in():
+    """Test that nothing is recorded outside of the profiling context."""
+    with profile() as prof:
+        pass
+    circuit_wrapper(TEST_BELL["cirq"]()).transpile("braket")
+    assert not prof.stages
+
+
+def test_nested_profiles():
+    """Test that stages are recorded in every active profile."""
+
+    @profiled("double")
+    def double(value):
+        return 2 * value
+
+    with profile() as outer:
+        double("a")
+        with profile() as inner:
+            assert double("ab") == "abab"
+
+    assert outer.to_dict()["double"]["calls"] == 2
+    assert outer.to_dict()["double"]["total_size"] == 3
+    assert inner.to_dict()["double"]["calls"] == 1
+    assert isinstance(inner, TranspileProfile)
@@ -0,0 +1,132 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for streaming OpenQASM 2 conversions
+
+"""
+import io
+
+import pytest
+
+from qbraid import circuit_wrapper
+from qbraid.exceptions import PackageValueError
+from qbraid.interface import circuits_allclose
+from qbraid.interface.programs import bell_data, shared15_data
+from qbraid.transpiler import transpile_qasm_stream
+from qbraid.transpiler.exceptions import QasmError
+from qbraid.transpiler.streaming import iter_qasm_statements
+
+QASM_CUSTOM_GATE = """OPENQASM 2.0;
+include "qelib1.inc";
+// a custom gate, defined over several lines
+gate bell q0,q1
+{
+  h q0;
+  cx q0,q1;
+}
+qreg q[3];
+bell q[0],q[1]; // trailing comment
+rz(pi/4) q[2];
+barrier q;
+bell q[1],q[2];
+"""
+
+# the same program, in the single-line form expected by the whole-program conversions
+QASM_CUSTOM_GATE_FLAT = """OPENQASM 2.0;
+include "qelib1.inc";
+gate bell q0,q1 { h q0; cx q0,q1; }
+qreg q[3];
+bell q[0],q[1];
+rz(pi/4) q[2];
+barrier q;
+bell q[1],q[2];
+"""
+
+# gates whose names start with header keywords are applications, not header statements
+QASM_KEYWORD_PREFIXED_GATES = """OPENQASM 2.0;
+include "qelib1.inc";
+gate gate_x a { x a; }
+gate include_rz(theta) a { rz(theta) a; }
+qreg q[2];
+h q[0];
+gate_x q[1];
+include_rz(0.1) q[0];
+cx q[0],q[1];
+gate_x q[0];
+"""
+
+TARGETS = ["braket", "cirq", "pytket", "qasm2", "qiskit", "pyquil"]
+
+
+def test_iter_qasm_statements():
+    """Test splitting a program into single-line statements, across arbitrary chunks."""
+    chunks = [QASM_CUSTOM_GATE[i : i + 7] for i in range(0, len(QASM_CUSTOM_GATE), 7)]
+    statements = list(iter_qasm_statements(chunks))
+    assert "\n".join(statements) + "\n" == QASM_CUSTOM_GATE_FLAT
+
+
+def test_iter_qasm_statements_incomplete():
+    """Test raising error when the program ends mid-statement."""
+    with pytest.raises(QasmError):
+        list(iter_qasm_statements(["OPENQASM 2.0;\nqreg q[1];\nh q"]))
+
+
+@pytest.mark.parametrize("target", TARGETS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_transpile_qasm_stream(target, chunk_size):
+    """Test that streamed conversions match the input program, for any chunk size."""
+    program = transpile_qasm_stream(io.StringIO(QASM_CUSTOM_GATE), target, chunk_size)
+    assert circuits_allclose(QASM_CUSTOM_GATE_FLAT, program)
+
+
+@pytest.mark.parametrize("target", ["cirq", "qasm2"])
+def test_transpile_qasm_stream_keyword_prefixed_gates(target):
+    """Test that applications of gates named e.g. gate_x stay in the body, in order."""
+    source = io.StringIO(QASM_KEYWORD_PREFIXED_GATES)
+    program = transpile_qasm_stream(source, target, chunk_size=1)
+    assert circuits_allclose(QASM_KEYWORD_PREFIXED_GATES, program)
+    if target == "qasm2":
+        assert program.count("gate_x q[") == 2
+        assert program.index("gate_x q[1];") > program.index("h q[0];")
+
+
+@pytest.mark.parametrize("target", ["braket", "cirq", "pytket", "qiskit"])
+def test_transpile_qasm_stream_matches_transpile(target):
+    """Test that streamed conversions agree with converting the whole program."""
+    qasm = shared15_data()[0]["qasm2"]()
+    streamed = transpile_qasm_stream(qasm.splitlines(keepends=True), target, chunk_size=4)
+    assert circuits_allclose(streamed, circuit_wrapper(qasm).transpile(target))
+
+
+def test_transpile_qasm_stream_from_file(tmp_path):
+    """Test reading the program from a file path."""
+    qasm = bell_data()[0]["qasm2"]()
+    path = tmp_path / "bell.qasm"
+    path.write_text(qasm)
+    assert circuits_allclose(qasm, transpile_qasm_stream(path, "cirq"))
+    assert circuits_allclose(qasm, transpile_qasm_stream(str(path), "braket"))
+
+
+def test_transpile_qasm_stream_errors():
+    """Test invalid targets and late register declarations."""
+    with pytest.raises(PackageValueError):
+        transpile_qasm_stream(io.StringIO(QASM_CUSTOM_GATE), "not_a_package")
+    late_register = "OPENQASM 2.0;\nqreg q[1];\nx q[0];\nqreg r[1];\nx r[0];\n"
+    with pytest.raises(QasmError):
+        transpile_qasm_stream(io.StringIO(late_register), "cirq")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_transpile_qasm_stream_qasm2_validates(chunk_size):
+    """Test that invalid statements are rejected rather than passed through to QASM."""
+    invalid = "OPENQASM 2.0;\ninclude \"qelib1.inc\";\nqreg q[1];\nh q[0];\nnot_a_gate q[0];\n"
+    with pytest.raises(QasmError):
+        transpile_qasm_stream(io.StringIO(invalid), "qasm2", chunk_size=chunk_size)
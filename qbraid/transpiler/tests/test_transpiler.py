@@ -31,7 +31,7 @@ from qiskit.circuit.quantumregister import Qubit as QiskitQubit
 from qbraid import QbraidError, circuit_wrapper
 from qbraid._qprogram import QPROGRAM_LIBS
 from qbraid.exceptions import PackageValueError, ProgramTypeError
-from qbraid.interface import convert_to_contiguous, to_unitary
+from qbraid.interface import circuits_allclose, convert_to_contiguous, to_unitary
 from qbraid.interface.programs import bell_data, shared15_data
 from qbraid.interface.qbraid_cirq._utils import _equal
 from qbraid.transpiler.cirq_braket.tests._gate_archive import braket_gates as braket_gates_dict
@@ -485,3 +485,108 @@ def test_non_contiguous_qubits_cirq():
     braket_unitary = to_unitary(braket_circuit)
     cirq.testing.assert_allclose_up_to_global_phase(cirq_unitary, qiskit_unitary, atol=1e-7)
     cirq.testing.assert_allclose_up_to_global_phase(braket_unitary, cirq_unitary, atol=1e-7)
+
+
+@pytest.fixture
+def qasm_parse_calls(monkeypatch):
+    """Record the QASM programs parsed by qBraid's QASM parsers."""
+    from qbraid.transpiler.cirq_qasm import qasm_conversions
+    from qbraid.transpiler.cirq_qasm.qasm_parser import QasmParser
+
+    calls = []
+    parse = QasmParser.parse
+    fast_parse = qasm_conversions.fast_parse_qasm
+
+    def counting_parse(self, qasm):
+        calls.append(qasm)
+        return parse(self, qasm)
+
+    def counting_fast_parse(qasm):
+        parsed = fast_parse(qasm)
+        if parsed is not None:
+            calls.append(qasm)
+        return parsed
+
+    monkeypatch.setattr(QasmParser, "parse", counting_parse)
+    monkeypatch.setattr(qasm_conversions, "fast_parse_qasm", counting_fast_parse)
+    return calls
+
+
+def test_qasm2_wrapper_parses_once(qasm_parse_calls):
+    """Test that wrapping and transpiling a QASM string along a path through Cirq parses
+    it exactly once, including for metadata accessed afterwards."""
+    qbraid_program = circuit_wrapper(TEST_BELL["qasm2"]())
+    assert len(qasm_parse_calls) == 0
+    braket_circuit = qbraid_program.transpile("braket")
+    assert len(qasm_parse_calls) == 1
+    assert qbraid_program.num_qubits == 2
+    assert len(qasm_parse_calls) == 1
+    assert np.allclose(to_unitary(braket_circuit), UNITARY_BELL)
+
+
+@pytest.mark.parametrize("target", ["qiskit", "pytket"])
+def test_qasm2_wrapper_direct_edge_skips_cirq_parse(qasm_parse_calls, target):
+    """Test that a transpile along a direct QASM 2 edge does not also parse the program
+    into Cirq."""
+    qbraid_program = circuit_wrapper(TEST_BELL["qasm2"]())
+    program = qbraid_program.transpile(target)
+    assert len(qasm_parse_calls) == 0
+    assert circuits_allclose(program, TEST_BELL["qasm2"]())
+
+
+def test_wrapper_metadata_is_lazy(monkeypatch):
+    """Test that wrapper metadata is computed on first access only, and memoized."""
+    calls = []
+    depth = QiskitCircuit.depth
+
+    def counting_depth(self, *args, **kwargs):
+        calls.append(self)
+        return depth(self, *args, **kwargs)
+
+    monkeypatch.setattr(QiskitCircuit, "depth", counting_depth)
+    qbraid_program = circuit_wrapper(TEST_BELL["qiskit"]())
+    qbraid_program.transpile("cirq")
+    assert len(calls) == 0
+    assert qbraid_program.depth == qbraid_program.depth == 2
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("package", QPROGRAM_LIBS)
+def test_wrapper_metadata(package):
+    """Test lazily computed wrapper metadata for each supported package."""
+    qbraid_program = circuit_wrapper(TEST_BELL[package]())
+    assert qbraid_program.num_qubits == 2
+    assert qbraid_program.depth >= 2
+
+
+def test_transpile_many_reuses_cirq_intermediate(monkeypatch):
+    """Test that fanning out to several targets converts to Cirq only once."""
+    from qbraid.transpiler import conversion_graph
+
+    calls = []
+    graph = conversion_graph.ConversionGraph()
+
+    def counting_from_braket(circuit):
+        calls.append(circuit)
+        return convert_to_cirq(circuit)[0]
+
+    graph.add_conversion("braket", "cirq", counting_from_braket, 1.0)
+    monkeypatch.setattr(conversion_graph, "_default_graph", graph)
+
+    braket_circuit = TEST_BELL["braket"]()
+    qbraid_program = circuit_wrapper(braket_circuit)
+    programs = qbraid_program.transpile_many(["qiskit", "pyquil", "cirq", "pytket"])
+    assert len(calls) == 1
+    for program in programs:
+        assert np.allclose(to_unitary(program), UNITARY_BELL)
+
+    qbraid_program.invalidate()
+    qbraid_program.transpile("cirq")
+    assert len(calls) == 2
+
+
+def test_transpile_many_invalid_target():
+    """Test that an unsupported target is rejected before converting."""
+    qbraid_program = circuit_wrapper(TEST_BELL["braket"]())
+    with pytest.raises(PackageValueError):
+        qbraid_program.transpile_many(["qiskit", "not_a_package"])
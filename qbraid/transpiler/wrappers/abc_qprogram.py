@@ -12,13 +12,20 @@
 Module defining QuantumProgramWrapper Class
 
 """
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
+from qbraid._executor import run_in_executor
 from qbraid._qprogram import QPROGRAM_LIBS, QPROGRAM_TYPES
 from qbraid.exceptions import PackageValueError
 from qbraid.interface.draw import circuit_drawer
-from qbraid.transpiler.conversions import convert_from_cirq, convert_to_cirq
+from qbraid.transpiler.cache import lookup_transpiled, store_transpiled, transpile_cache_key
+from qbraid.transpiler.conversion_graph import get_conversion_graph
 from qbraid.transpiler.exceptions import CircuitConversionError
+from qbraid.transpiler.parameterized import (
+    ParameterizedProgram,
+    ParameterValues,
+    transpile_parameterized,
+)
 
 if TYPE_CHECKING:
     import qbraid
@@ -32,17 +39,27 @@ class QuantumProgramWrapper:
     transpiled directly when the :meth:`~qbraid.transpiler.QuantumProgramtWrapper.transpile`
     method is called.
 
+    Program metadata (qubits, depth, etc.) is computed on first access and memoized, so that
+    wrapping a program only to transpile or submit it does not pay for it. Subclasses provide
+    the metadata by overriding the corresponding ``_get_*`` methods.
+
+    The Cirq intermediate representation produced by the first conversion that goes through
+    Cirq is kept on the wrapper and reused by later conversions. If the wrapped program is
+    modified in place, call :meth:`~qbraid.transpiler.QuantumProgramWrapper.invalidate`.
+
     """
 
     def __init__(self, program: "qbraid.QPROGRAM"):
         self._program = program
-        self._qubits = []
-        self._num_qubits = 0
-        self._num_clbits = 0
-        self._depth = 0
-        self._params = []
+        self._qubits = None
+        self._num_qubits = None
+        self._num_clbits = None
+        self._depth = None
+        self._params = None
         self._input_param_mapping = {}
         self._package = None
+        self._cirq_ir = None
+        self._parameterized = {}
 
     @property
     def program(self) -> "qbraid.QPROGRAM":
@@ -52,28 +69,59 @@ class QuantumProgramWrapper:
     @property
     def qubits(self) -> List[int]:
         """Return the qubits acted upon by the operations in this circuit"""
+        if self._qubits is None:
+            self._qubits = self._get_qubits()
         return self._qubits
 
     @property
     def num_qubits(self) -> int:
         """Return the number of qubits in the circuit."""
+        if self._num_qubits is None:
+            self._num_qubits = self._get_num_qubits()
         return self._num_qubits
 
     @property
     def num_clbits(self) -> int:
         """Return the number of classical bits in the circuit."""
+        if self._num_clbits is None:
+            self._num_clbits = self._get_num_clbits()
         return self._num_clbits
 
     @property
     def depth(self) -> int:
         """Return the circuit depth (i.e., length of critical path)."""
+        if self._depth is None:
+            self._depth = self._get_depth()
         return self._depth
 
     @property
     def params(self) -> Optional[list]:
         """Return the circuit parameters. Defaults to None."""
+        if self._params is None:
+            self._params = self._get_params()
         return self._params
 
+    def _get_qubits(self) -> list:
+        """Compute the qubits acted upon by the program. Defaults to an empty list."""
+        return []
+
+    def _get_num_qubits(self) -> int:
+        """Compute the number of qubits in the program. Defaults to the number of qubits
+        acted upon by its operations."""
+        return len(self.qubits)
+
+    def _get_num_clbits(self) -> int:
+        """Compute the number of classical bits in the program. Defaults to 0."""
+        return 0
+
+    def _get_depth(self) -> int:
+        """Compute the depth of the program. Defaults to 0."""
+        return 0
+
+    def _get_params(self) -> list:
+        """Compute the parameters of the program. Defaults to an empty list."""
+        return []
+
     @property
     def input_param_mapping(self) -> dict:
         """Return the input parameter mapping. Defaults to None."""
@@ -84,10 +132,35 @@ class QuantumProgramWrapper:
         """Return the original package of the wrapped circuit."""
         return self._package
 
+    def _intermediates(self, target: Optional[str] = None) -> dict:
+        """Return already available representations of the wrapped program, keyed by
+        package, that conversions to ``target`` may start from instead of the program
+        itself."""
+        if self._cirq_ir is None:
+            return {}
+        return {"cirq": self._cirq_ir.copy()}
+
+    def invalidate(self) -> None:
+        """Discard memoized metadata and intermediate representations of the wrapped
+        program. Must be called after modifying the wrapped program in place."""
+        self._qubits = None
+        self._num_qubits = None
+        self._num_clbits = None
+        self._depth = None
+        self._params = None
+        self._cirq_ir = None
+        self._parameterized = {}
+
     def transpile(self, conversion_type: str) -> "qbraid.QPROGRAM":
         r"""Transpile a qbraid quantum program wrapper object to quantum
         program object of type specified by ``conversion_type``.
 
+        The program is converted along the cheapest path of the transpiler's
+        :class:`~qbraid.transpiler.ConversionGraph`. If a transpile cache is
+        enabled (see :func:`~qbraid.transpiler.enable_transpile_cache` and
+        :func:`~qbraid.transpiler.enable_disk_transpile_cache`), results are
+        looked up by the fingerprint of the wrapped program.
+
         Args:
             conversion_type: a supported quantum frontend package.
                 Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
@@ -105,28 +178,147 @@ class QuantumProgramWrapper:
         if conversion_type == self.package:
             return self.program
         if conversion_type in QPROGRAM_LIBS:
+            cache_key = transpile_cache_key(self.program, self.package, conversion_type)
+            if cache_key is not None:
+                cached_program = lookup_transpiled(cache_key)
+                if cached_program is not None:
+                    return cached_program
+            graph = get_conversion_graph()
+            intermediates = self._intermediates(conversion_type)
             try:
-                cirq_circuit, _ = convert_to_cirq(self.program)
+                converted_program = graph.convert(
+                    self.program, self.package, conversion_type, intermediates
+                )
             except Exception as err:
                 raise CircuitConversionError(
-                    "Quantum program could not be converted to a Cirq circuit. "
-                    "This may be because the program contains custom gates or "
-                    f"Pragmas (pyQuil). \n\nProvided program has type {type(self.program)} "
-                    f"and is:\n\n{self.program}\n\nQuantum program types supported by the "
-                    f"qbraid.transpiler are \n{QPROGRAM_TYPES}."
+                    f"Quantum program could not be converted to a circuit of type "
+                    f"{conversion_type}. This may be because the program contains custom "
+                    f"gates or Pragmas (pyQuil). \n\nProvided program has type "
+                    f"{type(self.program)} and is:\n\n{self.program}\n\nQuantum program "
+                    f"types supported by the qbraid.transpiler are \n{QPROGRAM_TYPES}."
                 ) from err
-            try:
-                converted_program = convert_from_cirq(cirq_circuit, conversion_type)
-            except Exception as err:
-                raise CircuitConversionError(
-                    f"Circuit could not be converted from a Cirq type to a "
-                    f"circuit of type {conversion_type}."
-                ) from err
-
+            if self._cirq_ir is None and self.package != "cirq" and "cirq" in intermediates:
+                cirq_ir = intermediates["cirq"]
+                self._cirq_ir = cirq_ir.copy() if cirq_ir is converted_program else cirq_ir
+            if cache_key is not None:
+                store_transpiled(cache_key, converted_program)
             return converted_program
 
         raise PackageValueError(conversion_type)
 
+    async def transpile_async(
+        self, conversion_type: str, timeout: Optional[float] = None
+    ) -> "qbraid.QPROGRAM":
+        """Transpile the wrapped program to ``conversion_type`` without blocking the event loop.
+
+        The conversion done by :meth:`~qbraid.transpiler.QuantumProgramWrapper.transpile` is
+        run on the executor set by :func:`~qbraid.set_executor`.
+
+        Args:
+            conversion_type: a supported quantum frontend package.
+                Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+            timeout: Seconds to wait for the conversion. If ``None``, wait indefinitely.
+
+        Raises:
+            PackageValueError: If ``conversion_type`` is not one of
+                :data:`~qbraid.QPROGRAM_LIBS`.
+            CircuitConversionError: If the input quantum program could not be
+                converted to a program of type ``conversion_type``.
+            asyncio.TimeoutError: If the conversion does not finish before ``timeout``.
+
+        Returns:
+            :data:`~qbraid.QPROGRAM`: supported quantum program object
+
+        """
+        if conversion_type == self.package:
+            return self.program
+        return await run_in_executor(self.transpile, conversion_type, timeout=timeout)
+
+    def transpile_many(self, conversion_types: Sequence[str]) -> List["qbraid.QPROGRAM"]:
+        """Transpile the wrapped program to each of several packages.
+
+        The wrapped program is converted to the Cirq intermediate representation at most
+        once, and every target that is converted through Cirq is emitted from it.
+
+        Args:
+            conversion_types: supported quantum frontend packages.
+                Each must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+
+        Raises:
+            PackageValueError: If any of ``conversion_types`` is not one of
+                :data:`~qbraid.QPROGRAM_LIBS`.
+            CircuitConversionError: If the input quantum program could not be
+                converted to one of the requested program types.
+
+        Returns:
+            List of :data:`~qbraid.QPROGRAM`, in the same order as ``conversion_types``.
+
+        """
+        for conversion_type in conversion_types:
+            if conversion_type not in QPROGRAM_LIBS:
+                raise PackageValueError(conversion_type)
+        return [self.transpile(conversion_type) for conversion_type in conversion_types]
+
+    def transpile_parameterized(self, conversion_type: str) -> ParameterizedProgram:
+        """Transpile the wrapped program to package ``conversion_type`` once, keeping its
+        parameters symbolic. The result is memoized, and its
+        :meth:`~qbraid.transpiler.ParameterizedProgram.bind` method substitutes parameter
+        values without transpiling the program again.
+
+        See :func:`~qbraid.transpiler.transpile_parameterized` for the supported packages.
+
+        Args:
+            conversion_type: a supported quantum frontend package.
+                Must be one of :data:`~qbraid.QPROGRAM_LIBS`.
+
+        Raises:
+            PackageValueError: If ``conversion_type`` is not one of
+                :data:`~qbraid.QPROGRAM_LIBS`.
+            CircuitConversionError: If the program could not be converted with its
+                parameters kept symbolic.
+
+        Returns:
+            :class:`~qbraid.transpiler.ParameterizedProgram`
+
+        """
+        if conversion_type not in self._parameterized:
+            self._parameterized[conversion_type] = transpile_parameterized(
+                self.program, self.package, conversion_type
+            )
+        return self._parameterized[conversion_type]
+
+    def bind(self, conversion_type: str, values: ParameterValues) -> "qbraid.QPROGRAM":
+        """Return the wrapped program transpiled to package ``conversion_type``, with its
+        parameters bound to ``values``. The parameterized program is transpiled only on
+        the first call for each package.
+
+        Args:
+            conversion_type: a supported quantum frontend package.
+            values: Parameter values, in the order of
+                :attr:`~qbraid.transpiler.ParameterizedProgram.parameters`, or keyed by name.
+
+        Returns:
+            :data:`~qbraid.QPROGRAM`: supported quantum program object
+
+        """
+        return self.transpile_parameterized(conversion_type).bind(values)
+
+    def bind_batch(self, conversion_type: str, values) -> List["qbraid.QPROGRAM"]:
+        """Return the wrapped program transpiled to package ``conversion_type`` once for
+        each row of parameter ``values``, an array of shape ``(num_programs, num_params)``.
+        The parameterized program is transpiled only on the first call for each package.
+
+        Args:
+            conversion_type: a supported quantum frontend package.
+            values: Array of parameter values, with columns in the order of
+                :attr:`~qbraid.transpiler.ParameterizedProgram.parameters`.
+
+        Returns:
+            List of :data:`~qbraid.QPROGRAM`, in the order of the rows of ``values``.
+
+        """
+        return self.transpile_parameterized(conversion_type).bind_batch(values)
+
     def draw(self, package: str = "cirq", output: Optional[str] = None, **kwrags):
         """draw circuit"""
         return circuit_drawer(self.transpile(package), output, **kwrags)
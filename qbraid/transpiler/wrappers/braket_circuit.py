@@ -29,8 +29,11 @@ class BraketCircuitWrapper(QuantumProgramWrapper):
         """
         super().__init__(circuit)
 
-        self._qubits = circuit.qubits
-        self._num_qubits = len(self.qubits)
-        self._depth = circuit.depth
         self._package = "braket"
         self._program_type = "Circuit"
+
+    def _get_qubits(self):
+        return self.program.qubits
+
+    def _get_depth(self) -> int:
+        return self.program.depth
@@ -33,8 +33,11 @@ class CirqCircuitWrapper(QuantumProgramWrapper):
         """
         super().__init__(circuit)
 
-        self._qubits = circuit.all_qubits()
-        self._num_qubits = len(self.qubits)
-        self._depth = len(Circuit(circuit.all_operations()))
         self._package = "cirq"
         self._program_type = "Circuit"
+
+    def _get_qubits(self):
+        return self.program.all_qubits()
+
+    def _get_depth(self) -> int:
+        return len(Circuit(self.program.all_operations()))
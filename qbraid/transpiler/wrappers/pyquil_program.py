@@ -29,8 +29,11 @@ class PyQuilProgramWrapper(QuantumProgramWrapper):
         """
         super().__init__(program)
 
-        self._qubits = program.get_qubits()
-        self._num_qubits = len(self.qubits)
-        self._depth = len(program)
         self._package = "pyquil"
         self._program_type = "Program"
+
+    def _get_qubits(self):
+        return self.program.get_qubits()
+
+    def _get_depth(self) -> int:
+        return len(self.program)
@@ -29,9 +29,17 @@ class PytketCircuitWrapper(QuantumProgramWrapper):
         """
         super().__init__(circuit)
 
-        self._qubits = circuit.qubits
-        self._num_qubits = circuit.n_qubits
-        self._num_clbits = circuit.n_bits
-        self._depth = circuit.depth()
         self._package = "pytket"
         self._program_type = "Circuit"
+
+    def _get_qubits(self):
+        return self.program.qubits
+
+    def _get_num_qubits(self) -> int:
+        return self.program.n_qubits
+
+    def _get_num_clbits(self) -> int:
+        return self.program.n_bits
+
+    def _get_depth(self) -> int:
+        return self.program.depth()
@@ -15,25 +15,76 @@
 Module defining Qasm2CircuitWrapper Class
 
 """
-from qbraid.interface.qbraid_qasm.tools import qasm_depth, qasm_num_qubits, qasm_qubits
+from typing import TYPE_CHECKING, Optional
+
+from cirq import Circuit
+
+from qbraid.exceptions import PackageValueError
+from qbraid.interface.qbraid_qasm.tools import qasm_qubits
+from qbraid.transpiler.cirq_qasm.qasm_conversions import parse_qasm
+from qbraid.transpiler.conversion_graph import get_conversion_graph
 from qbraid.transpiler.wrappers.abc_qprogram import QuantumProgramWrapper
 
+if TYPE_CHECKING:
+    from qbraid.transpiler.cirq_qasm.qasm_parser import Qasm
+
 
 class QasmCircuitWrapper(QuantumProgramWrapper):
     """Wrapper class for Cirq ``Circuit`` objects."""
 
-    def __init__(self, qasm_str: str):
-        """Create a CirqCircuitWrapper
+    def __init__(self, qasm_str: str, parsed_qasm: Optional["Qasm"] = None):
+        """Create a QasmCircuitWrapper
 
         Args:
-            circuit: the cirq ``Circuit`` object to be wrapped
+            qasm_str: the OpenQASM 2 string to be wrapped
+            parsed_qasm: the already parsed program, if available. If None,
+                ``qasm_str`` is parsed when its metadata is first accessed, or when
+                it is transpiled along a path through Cirq.
 
         """
         # coverage: ignore
         super().__init__(qasm_str)
 
-        self._qubits = qasm_qubits(qasm_str)
-        self._num_qubits = qasm_num_qubits(qasm_str)
-        self._depth = qasm_depth(qasm_str)
+        self._parsed_qasm = parsed_qasm
         self._package = "qasm2"
         self._program_type = "str"
+
+    @property
+    def parsed_qasm(self) -> "Qasm":
+        """Return the parsed program, holding the Cirq circuit and register metadata."""
+        if self._parsed_qasm is None:
+            self._parsed_qasm = parse_qasm(self.program)
+        return self._parsed_qasm
+
+    def _intermediates(self, target: Optional[str] = None) -> dict:
+        # the parsed circuit is the Cirq intermediate, so parse here, once, only if it is
+        # already available or the cheapest path to the target goes through Cirq
+        if self._cirq_ir is None and (
+            self._parsed_qasm is not None or self._path_through_cirq(target)
+        ):
+            try:
+                self._cirq_ir = self.parsed_qasm.circuit
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass  # reported by the conversion itself
+        return super()._intermediates(target)
+
+    def _path_through_cirq(self, target: Optional[str]) -> bool:
+        if target is None:
+            return False
+        try:
+            path = get_conversion_graph().find_shortest_path(self.package, target)
+        except PackageValueError:
+            return False
+        return "cirq" in path
+
+    def _get_qubits(self):
+        return qasm_qubits(self.program)
+
+    def _get_num_qubits(self) -> int:
+        return sum(self.parsed_qasm.qregs.values())
+
+    def _get_num_clbits(self) -> int:
+        return sum(self.parsed_qasm.cregs.values())
+
+    def _get_depth(self) -> int:
+        return len(Circuit(self.parsed_qasm.circuit.all_operations()))
@@ -28,10 +28,20 @@ class QiskitCircuitWrapper(QuantumProgramWrapper):
         """
         super().__init__(circuit)
 
-        self._qubits = circuit.qubits
-        self._params = circuit.parameters
-        self._num_qubits = circuit.num_qubits
-        self._num_clbits = circuit.num_clbits
-        self._depth = circuit.depth()
         self._package = "qiskit"
         self._program_type = "QuantumCircuit"
+
+    def _get_qubits(self):
+        return self.program.qubits
+
+    def _get_params(self):
+        return self.program.parameters
+
+    def _get_num_qubits(self) -> int:
+        return self.program.num_qubits
+
+    def _get_num_clbits(self) -> int:
+        return self.program.num_clbits
+
+    def _get_depth(self) -> int:
+        return self.program.depth()
@@ -13,21 +13,33 @@ Module containing top-level qbraid wrapper functionality. Each of these
 functions utilize entrypoints via ``pkg_resources``.
 
 """
-import pkg_resources
-from cirq.contrib.qasm_import.exception import QasmException
+import re
+from functools import lru_cache
 
-from qbraid.transpiler.cirq_qasm.qasm_parser import QasmParser
+import pkg_resources
 
-from ._qprogram import QPROGRAM
+from ._qprogram import QPROGRAM, get_program_type
 from .api import QbraidSession
 from .exceptions import QbraidError
 
 
+# OpenQASM 2 version statement, optionally preceded by whitespace and line comments
+_QASM2_VERSION = re.compile(r"\s*(?://[^\n]*\s*)*OPENQASM\s+2(?:\.\d+)?\s*;")
+
+
+@lru_cache(maxsize=None)
 def _get_entrypoints(group: str):
-    """Returns a dictionary mapping each entry of ``group`` to its loadable entrypoint."""
+    """Returns a dictionary mapping each entry of ``group`` to its loadable entrypoint.
+    Installed entrypoints are scanned once per process."""
     return {entry.name: entry for entry in pkg_resources.iter_entry_points(group)}
 
 
+@lru_cache(maxsize=None)
+def _load_entrypoint(group: str, name: str):
+    """Returns the object referenced by entrypoint ``name`` of ``group``, loading it once."""
+    return _get_entrypoints(group)[name].load()
+
+
 def circuit_wrapper(program: QPROGRAM):
     """Apply qbraid quantum program wrapper to a supported quantum program.
 
@@ -56,28 +68,17 @@ def circuit_wrapper(program: QPROGRAM):
 
     """
     if isinstance(program, str):
-        try:
-            QasmParser().parse(program)
-            package = "qasm2"
-        except QasmException as err:
-            raise QbraidError(
-                "Input of type string must represent a valid OpenQASM 2 program."
-            ) from err
+        # the program is only parsed once its metadata or a conversion needs it
+        if _QASM2_VERSION.match(program) is None:
+            raise QbraidError("Input of type string must represent a valid OpenQASM 2 program.")
+        package = "qasm2"
     else:
-        try:
-            package = program.__module__.split(".")[0]
-        except AttributeError as err:
-            raise QbraidError(
-                f"Error applying circuit wrapper to quantum program \
-                of type {type(program)}"
-            ) from err
+        package = get_program_type(program)
 
     ep = package.lower()
 
-    transpiler_entrypoints = _get_entrypoints("qbraid.transpiler")
-
-    if package in transpiler_entrypoints:
-        circuit_wrapper_class = transpiler_entrypoints[ep].load()
+    if ep in _get_entrypoints("qbraid.transpiler"):
+        circuit_wrapper_class = _load_entrypoint("qbraid.transpiler", ep)
         return circuit_wrapper_class(program)
 
     raise QbraidError(f"Error applying circuit wrapper to quantum program of type {type(program)}")